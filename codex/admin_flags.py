@@ -0,0 +1,42 @@
+"""Process local cache of admin flags."""
+
+from threading import Lock
+from types import MappingProxyType
+
+from codex.models import AdminFlag
+
+
+class AdminFlagCache:
+    """Load every admin flag once and keep them until a flag changes.
+
+    Each process has its own cache. The admin flag view clears it in the
+    web process and tells the librarian to clear its copy.
+    """
+
+    def __init__(self):
+        """Initialize the cache."""
+        self._flags: MappingProxyType[str, bool] | None = None
+        self._lock = Lock()
+
+    def get_flags(self) -> MappingProxyType[str, bool]:
+        """Get all flags by key, loading them if needed."""
+        flags = self._flags
+        if flags is None:
+            with self._lock:
+                if self._flags is None:
+                    pairs = AdminFlag.objects.values_list("key", "on")
+                    self._flags = MappingProxyType(dict(pairs))
+                flags = self._flags
+        return flags
+
+    def get(self, key) -> bool:
+        """Get one flag, falling back to its default if it doesn't exist."""
+        return self.get_flags().get(key, key not in AdminFlag.FALSE_DEFAULTS)
+
+    def clear(self):
+        """Forget the flags so they're loaded again on next use."""
+        with self._lock:
+            self._flags = None
+
+
+ADMIN_FLAGS = AdminFlagCache()
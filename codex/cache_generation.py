@@ -0,0 +1,26 @@
+"""Shared cache generation for response ETags.
+
+Clients revalidate responses with ETags that don't change when the cache is
+cleared. Every clear starts a new generation that goes into the ETag digest.
+"""
+
+from uuid import uuid4
+
+from django.core.cache import cache
+
+_GENERATION_KEY = "codex.generation"
+
+
+def get_cache_generation() -> str:
+    """Get the current generation, starting one if the cache was cleared."""
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        cache.add(_GENERATION_KEY, uuid4().hex, None)
+        generation = cache.get(_GENERATION_KEY, "")
+    return generation
+
+
+def clear_cache():
+    """Clear the cache and start a new generation."""
+    cache.clear()
+    cache.set(_GENERATION_KEY, uuid4().hex, None)
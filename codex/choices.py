@@ -198,6 +198,11 @@ ADMIN_TASK_GROUPS = MappingProxyType(
                         "title": "Sync Watchdog with DB",
                         "desc": "Ensure the Watchdog file watcher is enabled per database preferences for each library",
                     },
+                    {
+                        "value": "purge_extract_cache",
+                        "title": "Clear Metadata Cache",
+                        "desc": "Remove cached comic metadata so the next update re-reads every archive",
+                    },
                 ],
             },
             {
@@ -215,6 +220,11 @@ ADMIN_TASK_GROUPS = MappingProxyType(
                         "desc": "Pre-generate covers for every comic in every library and all custom covers",
                         "confirm": "Are you sure?",
                     },
+                    {
+                        "value": "pack_covers",
+                        "title": "Pack & Compact Covers",
+                        "desc": "Move cover files into cover packs and reclaim space from removed covers. Only if cover packs are enabled. Runs nightly.",
+                    },
                     {
                         "value": "force_update_groups",
                         "title": "Update Group Timestamps",
@@ -7,7 +7,12 @@ from django.db.models.query import Q
 
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import NotifierTask
-from codex.models import Bookmark, Comic
+from codex.models import (
+    GROUP_PROGRESS_MODELS,
+    Bookmark,
+    Comic,
+    get_rollup_group_pks,
+)
 from codex.models.admin import UserActive
 from codex.views.auth import GroupACLMixin
 from codex.views.mixins import BookmarkSearchMixin
@@ -146,6 +151,14 @@ class BookmarkUpdate(GroupACLMixin, BookmarkSearchMixin):
             reason = f"update user activity {exc}"
             log.warning(reason)
 
+    @staticmethod
+    def _update_group_progress(auth_filter, comic_filter):
+        """Recompute the reading progress of the bookmarked comics' groups."""
+        comics = Comic.objects.filter(**comic_filter)
+        group_pks = get_rollup_group_pks(comics)
+        for model, progress_model in GROUP_PROGRESS_MODELS.items():
+            progress_model.update_groups(group_pks[model], auth_filter)
+
     @classmethod
     def update_bookmarks(cls, auth_filter, comic_filter, updates, log):
         """Update a user bookmark."""
@@ -162,6 +175,7 @@ class BookmarkUpdate(GroupACLMixin, BookmarkSearchMixin):
         if user:
             cls._update_user_active(user, log)
         if count:
+            cls._update_group_progress(auth_filter, comic_filter)
             uid = next(iter(auth_filter.values()))
             cls._notify_library_changed(uid)
         return count
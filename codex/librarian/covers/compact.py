@@ -0,0 +1,59 @@
+"""Pack loose cover files and compact cover packs."""
+
+import shutil
+from time import time
+
+from humanize import naturaldelta, naturalsize
+
+from codex.librarian.covers.purge import CoverPurgeThread
+from codex.models import Comic, CustomCover
+from codex.settings.settings import COVER_PACKS
+
+_PACK_BATCH_SIZE = 256
+
+
+class CoverCompactThread(CoverPurgeThread):
+    """Pack and compact covers."""
+
+    def _pack_loose_covers(self, model, custom):
+        """Move covers from the directory tree into packs."""
+        cover_root = self.CUSTOM_COVERS_ROOT if custom else self.COVERS_ROOT
+        if not cover_root.is_dir():
+            return 0
+        count = 0
+        covers = []
+        pks = model.objects.values_list("pk", flat=True)
+        for pk in pks.iterator():
+            try:
+                data = self.get_cover_path(pk, custom).read_bytes()
+            except FileNotFoundError:
+                continue
+            covers.append((pk, data))
+            if len(covers) >= _PACK_BATCH_SIZE:
+                count += self.save_packed_covers(covers, custom)
+                covers = []
+        if covers:
+            count += self.save_packed_covers(covers, custom)
+        # Anything left is an orphan.
+        shutil.rmtree(cover_root, ignore_errors=True)
+        return count
+
+    def pack_covers(self):
+        """Move loose covers into packs and compact the packs."""
+        if not COVER_PACKS:
+            self.log.warning("Cover packs are not enabled.")
+            return
+        start_time = time()
+        count = self._pack_loose_covers(CustomCover, True)
+        count += self._pack_loose_covers(Comic, False)
+        if count:
+            self.log.info(f"Moved {count} cover files into packs.")
+        old_size, new_size = self.compact_cover_packs()
+        if old_size == new_size:
+            self.log.info("Cover packs are compact enough.")
+            return
+        elapsed = naturaldelta(time() - start_time)
+        self.log.info(
+            f"Compacted cover packs from {naturalsize(old_size)}"
+            f" to {naturalsize(new_size)} in {elapsed}."
+        )
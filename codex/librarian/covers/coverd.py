@@ -1,8 +1,10 @@
 """Functions for dealing with comic cover thumbnails."""
 
-from codex.librarian.covers.purge import CoverPurgeThread
+from codex.librarian.covers.compact import CoverCompactThread
 from codex.librarian.covers.tasks import (
     CoverCreateAllTask,
+    CoverCreateTask,
+    CoverPackTask,
     CoverRemoveAllTask,
     CoverRemoveOrphansTask,
     CoverRemoveTask,
@@ -10,14 +12,14 @@ from codex.librarian.covers.tasks import (
 )
 
 
-class CoverThread(CoverPurgeThread):
+class CoverThread(CoverCompactThread):
     """Create comic covers in it's own thread."""
 
     def process_item(self, item):
         """Run the task method."""
         task = item
         if isinstance(task, CoverSaveToCache):
-            self.save_cover_to_cache(task.cover_path, task.data)
+            self.save_cover_to_cache(task)
         elif isinstance(task, CoverRemoveAllTask):
             self.purge_all_comic_covers(self.librarian_queue)
         elif isinstance(task, CoverRemoveTask):
@@ -26,5 +28,9 @@ class CoverThread(CoverPurgeThread):
             self.cleanup_orphan_covers()
         elif isinstance(task, CoverCreateAllTask):
             self.create_all_covers()
+        elif isinstance(task, CoverPackTask):
+            self.pack_covers()
+        elif isinstance(task, CoverCreateTask):
+            self._bulk_create_comic_covers(task.pks, task.custom)
         else:
             self.log.error(f"Bad task sent to {self.__class__.__name__}: {task}")
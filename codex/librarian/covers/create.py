@@ -1,17 +1,34 @@
 """Create comic cover paths."""
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from io import BytesIO
+from multiprocessing import cpu_count, get_context
 from pathlib import Path
-from time import time
+from time import perf_counter, time
+from types import MappingProxyType
+from typing import NamedTuple
+from zipfile import BadZipFile
 
 from comicbox.box import Comicbox
+from comicbox.exceptions import UnsupportedArchiveTypeError
 from humanize import naturaldelta
 from PIL import Image
+from rarfile import BadRarFile
 
+from codex.librarian.covers.pack import CoverPackMixin
 from codex.librarian.covers.path import CoverPathMixin
 from codex.librarian.covers.status import CoverStatusTypes
 from codex.librarian.covers.tasks import CoverSaveToCache
 from codex.models import Comic, CustomCover
+from codex.settings.settings import (
+    COVER_PACKS,
+    COVER_THUMBNAIL_PROFILE,
+    COVER_WORKERS,
+    FILTER_BATCH_SIZE,
+)
 from codex.status import Status
 from codex.threads import QueuedThread
 
@@ -19,9 +36,46 @@ _COVER_RATIO = 1.5372233400402415  # modal cover ratio
 THUMBNAIL_WIDTH = 165
 THUMBNAIL_HEIGHT = round(THUMBNAIL_WIDTH * _COVER_RATIO)
 _THUMBNAIL_SIZE = (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+# Starting worker processes costs more than creating a few covers.
+_MIN_POOL_COVERS = 64
+# Covers queued per worker, bounds memory held by unread results.
+_POOL_QUEUE_PER_WORKER = 16
+# Unreadable archives and images, logged without tracebacks.
+_WARN_EXCEPTIONS = (
+    UnsupportedArchiveTypeError,
+    BadRarFile,
+    BadZipFile,
+    OSError,
+    ValueError,
+)
+_PACK_BATCH_SIZE = 256
 
 
-class CoverCreateThread(QueuedThread, CoverPathMixin):
+class _ThumbnailProfile(NamedTuple):
+    """Thumbnail resampling & encoding speed versus quality settings."""
+
+    resample: Image.Resampling
+    reducing_gap: float
+    method: int
+    quality: int
+
+
+_PROFILES = MappingProxyType(
+    {
+        "fast": _ThumbnailProfile(Image.Resampling.BILINEAR, 2.0, 0, 75),
+        "balanced": _ThumbnailProfile(Image.Resampling.LANCZOS, 2.0, 4, 80),
+        "quality": _ThumbnailProfile(Image.Resampling.LANCZOS, 3.0, 6, 80),
+    }
+)
+_PROFILE = _PROFILES[COVER_THUMBNAIL_PROFILE]
+
+
+def _ms(seconds):
+    """Format seconds as milliseconds."""
+    return round(seconds * 1000, 1)
+
+
+class CoverCreateThread(QueuedThread, CoverPathMixin, CoverPackMixin):
     """Create methods for covers."""
 
     @classmethod
@@ -32,10 +86,15 @@ class CoverCreateThread(QueuedThread, CoverPathMixin):
             with Image.open(image_io) as cover_image:
                 cover_image.thumbnail(
                     _THUMBNAIL_SIZE,
-                    Image.Resampling.LANCZOS,  # type: ignore
-                    reducing_gap=3.0,
+                    _PROFILE.resample,
+                    reducing_gap=_PROFILE.reducing_gap,
+                )
+                cover_image.save(
+                    cover_thumb_buffer,
+                    "WEBP",
+                    method=_PROFILE.method,
+                    quality=_PROFILE.quality,
                 )
-                cover_image.save(cover_thumb_buffer, "WEBP", method=6)
             cover_image.close()  # extra close for animated sequences
         return cover_thumb_buffer
 
@@ -68,25 +127,34 @@ class CoverCreateThread(QueuedThread, CoverPathMixin):
         try:
             model = CustomCover if custom else Comic
             db_path = model.objects.only("path").get(pk=pk).path
+            start_time = perf_counter()
             if custom:
                 cover_image = cls._get_custom_cover_image(db_path)
             else:
                 cover_image = cls._get_comic_cover_image(db_path)
+            read_time = perf_counter()
             thumb_buffer = cls._create_cover_thumbnail(cover_image)
             thumb_bytes = thumb_buffer.getvalue()
             thumb_buffer.seek(0)
+            log.debug(
+                f"Created cover for {db_path} in"
+                f" {_ms(perf_counter() - start_time)}ms: read"
+                f" {_ms(read_time - start_time)}ms, thumbnail"
+                f" {_ms(perf_counter() - read_time)}ms."
+            )
         except Exception as exc:
             thumb_bytes = b""
             thumb_buffer = None
             cover_str = db_path if db_path else f"{pk=}"
             log.warning(f"Could not create cover thumbnail for {cover_str}: {exc}")
 
-        task = CoverSaveToCache(cover_path, thumb_bytes)
+        task = CoverSaveToCache(cover_path, thumb_bytes, pk, custom)
         librarian_queue.put(task)
         return thumb_buffer
 
-    def save_cover_to_cache(self, cover_path, data):
-        """Save cover thumb image to the disk cache."""
+    @staticmethod
+    def _write_cover_file(cover_path, data):
+        """Write cover thumb image data to the disk cache."""
         cover_path.parent.mkdir(exist_ok=True, parents=True)
         if data:
             with cover_path.open("wb") as cover_file:
@@ -95,6 +163,122 @@ class CoverCreateThread(QueuedThread, CoverPathMixin):
             # zero length file is code for missing.
             cover_path.touch()
 
+    def save_cover_to_cache(self, task: CoverSaveToCache):
+        """Save cover thumb image to the disk cache."""
+        if COVER_PACKS:
+            self.save_packed_cover(task.pk, task.data, task.custom)
+        else:
+            self._write_cover_file(task.cover_path, task.data)
+
+    @classmethod
+    def create_cover_file(cls, pk_path, custom=False):
+        """Create one cover thumbnail. Runs in worker processes.
+
+        Writes loose cover files directly but returns data for packing.
+        Unreadable covers are returned as errors, anything else is raised.
+        """
+        pk, db_path = pk_path
+        error = ""
+        try:
+            if custom:
+                cover_image = cls._get_custom_cover_image(db_path)
+            else:
+                cover_image = cls._get_comic_cover_image(db_path)
+            data = cls._create_cover_thumbnail(cover_image).getvalue()
+        except _WARN_EXCEPTIONS as exc:
+            data = b""
+            error = f"Could not create cover thumbnail for {db_path}: {exc}"
+        if COVER_PACKS:
+            return pk, error, data
+        cls._write_cover_file(cls.get_cover_path(pk, custom), data)
+        return pk, error, None
+
+    @staticmethod
+    def _get_cover_pk_paths(pks, custom):
+        """Query source paths for covers in batches."""
+        model = CustomCover if custom else Comic
+        pks = tuple(pks)
+        for start in range(0, len(pks), FILTER_BATCH_SIZE):
+            batch_pks = pks[start : start + FILTER_BATCH_SIZE]
+            yield from model.objects.filter(pk__in=batch_pks).values_list("pk", "path")
+
+    def _bulk_create_covers_serial(self, pks, custom, status):
+        """Create covers in this thread."""
+        for pk in pks:
+            cover_path = self.get_cover_path(pk, custom)
+            # bulk contributor creates covers inline
+            data = self.create_cover_from_path(
+                pk, cover_path, self.log, self.librarian_queue, custom=custom
+            )
+            if data:
+                data.close()
+            status.increment_complete()
+            self.status_controller.update(status)
+
+    def _get_pool_cover(self, pk_path, future, custom):
+        """Get a worker's cover, recording unexpected errors as missing covers."""
+        try:
+            pk, error, data = future.result()
+        except BrokenProcessPool:
+            raise
+        except Exception:
+            pk, db_path = pk_path
+            self.log.exception(f"Could not create cover thumbnail for {db_path}")
+            error = ""
+            data = b""
+            if not COVER_PACKS:
+                self._write_cover_file(self.get_cover_path(pk, custom), data)
+                data = None
+        if error:
+            self.log.warning(error)
+        return pk, data
+
+    def _create_covers_in_pool(self, executor, pk_paths, custom, status, max_queued):
+        """Create covers in the pool, yielding each pk and its pack data."""
+        create_cover_file = partial(CoverCreateThread.create_cover_file, custom=custom)
+        queued = deque()
+        for pk_path in pk_paths:
+            queued.append((pk_path, executor.submit(create_cover_file, pk_path)))
+            if len(queued) >= max_queued:
+                yield self._get_pool_cover(*queued.popleft(), custom)
+                status.increment_complete()
+                self.status_controller.update(status)
+        while queued:
+            yield self._get_pool_cover(*queued.popleft(), custom)
+            status.increment_complete()
+            self.status_controller.update(status)
+
+    def _bulk_create_covers_pool(self, pks, custom, status, num_workers):
+        """Create covers in a pool of worker processes."""
+        self.log.debug(f"Creating covers with {num_workers} worker processes.")
+        pk_paths = tuple(self._get_cover_pk_paths(pks, custom))
+        status.total = len(pk_paths)
+        done = 0
+        pack_covers = []
+        try:
+            # Spawn because forking the multithreaded librarian is unsafe.
+            with ProcessPoolExecutor(
+                max_workers=num_workers, mp_context=get_context("spawn")
+            ) as executor:
+                max_queued = num_workers * _POOL_QUEUE_PER_WORKER
+                for pk, data in self._create_covers_in_pool(
+                    executor, pk_paths, custom, status, max_queued
+                ):
+                    done += 1
+                    if data is None:
+                        continue
+                    pack_covers.append((pk, data))
+                    if len(pack_covers) >= _PACK_BATCH_SIZE:
+                        self.save_packed_covers(pack_covers, custom)
+                        pack_covers = []
+        except BrokenProcessPool:
+            self.log.exception("Cover pool failed, continuing serially.")
+            remaining_pks = tuple(pk for pk, _ in pk_paths[done:])
+            self._bulk_create_covers_serial(remaining_pks, custom, status)
+        finally:
+            if pack_covers:
+                self.save_packed_covers(pack_covers, custom)
+
     def _bulk_create_comic_covers(self, pks, custom=False):
         """Create bulk comic covers."""
         num_comics = len(pks)
@@ -106,27 +290,28 @@ class CoverCreateThread(QueuedThread, CoverPathMixin):
             self.log.debug(f"Creating {num_comics} comic covers...")
             self.status_controller.start(status)
 
-            # Get comic objects
+            packed_pks = self.get_packed_cover_pks(custom) if COVER_PACKS else ()
+            create_pks = []
             for pk in pks:
-                # Create all covers.
-                cover_path = self.get_cover_path(pk, custom)
-                if cover_path.exists():
+                if pk in packed_pks or self.get_cover_path(pk, custom).exists():
                     status.decrement_total()
                 else:
-                    # bulk contributor creates covers inline
-                    data = self.create_cover_from_path(
-                        pk, cover_path, self.log, self.librarian_queue
-                    )
-                    if data:
-                        data.close()
-                    status.increment_complete()
-                self.status_controller.update(status)
+                    create_pks.append(pk)
+
+            num_workers = min(COVER_WORKERS or cpu_count() or 1, len(create_pks))
+            if num_workers > 1 and len(create_pks) >= _MIN_POOL_COVERS:
+                self._bulk_create_covers_pool(create_pks, custom, status, num_workers)
+            else:
+                self._bulk_create_covers_serial(create_pks, custom, status)
 
-            total_elapsed = naturaldelta(time() - start_time)
+            elapsed = time() - start_time
             desc = "custom" if custom else "comic"
-            self.log.info(
-                f"Created {status.complete} {desc} covers in {total_elapsed}."
+            log_txt = (
+                f"Created {status.complete} {desc} covers in {naturaldelta(elapsed)}"
             )
+            if status.complete:
+                log_txt += f", {_ms(elapsed / status.complete)}ms per cover"
+            self.log.info(log_txt + ".")
         finally:
             self.status_controller.finish(status)
         return status.complete
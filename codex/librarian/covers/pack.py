@@ -0,0 +1,258 @@
+"""Packed cover store.
+
+Cover thumbnails are appended to large pack files and located by a small
+sqlite index instead of being written one file per cover. Only the
+librarian process writes. Readers memory map the packs and copy covers out.
+"""
+
+import mmap
+import sqlite3
+from collections import OrderedDict
+from contextlib import suppress
+from threading import Lock, local
+from typing import ClassVar
+
+from codex.settings.settings import FILTER_BATCH_SIZE, ROOT_CACHE_PATH
+
+COVER_PACKS_ROOT = ROOT_CACHE_PATH / "cover-packs"
+_INDEX_PATH = COVER_PACKS_ROOT / "index.sqlite3"
+_PACK_SUFFIX = ".pack"
+_PACK_MAX_SIZE = 256 * 1024 * 1024
+_MAX_OPEN_PACKS = 16
+_COMPACT_MIN_DEAD_RATIO = 0.25
+_INDEX_TIMEOUT = 30
+_CREATE_INDEX_SQL = """
+CREATE TABLE IF NOT EXISTS covers (
+    custom INTEGER NOT NULL,
+    pk INTEGER NOT NULL,
+    pack INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (custom, pk)
+) WITHOUT ROWID
+"""
+_SELECT_SQL = "SELECT pack, offset, length FROM covers WHERE custom=? AND pk=?"
+_UPSERT_SQL = "INSERT OR REPLACE INTO covers VALUES (?, ?, ?, ?, ?)"
+
+
+class CoverPackMixin:
+    """Read and write covers in pack files."""
+
+    _index_local = local()
+    _pack_maps: ClassVar[OrderedDict[int, mmap.mmap]] = OrderedDict()
+    _pack_maps_lock = Lock()
+    _write_lock = Lock()
+
+    @staticmethod
+    def _get_pack_path(pack_id):
+        return COVER_PACKS_ROOT / f"{pack_id:08d}{_PACK_SUFFIX}"
+
+    @staticmethod
+    def _get_pack_ids():
+        """Get the ids of all pack files on disk."""
+        if not COVER_PACKS_ROOT.is_dir():
+            return []
+        return sorted(
+            int(path.stem) for path in COVER_PACKS_ROOT.glob(f"*{_PACK_SUFFIX}")
+        )
+
+    @classmethod
+    def _get_index(cls):
+        """Get a connection to the index for this thread."""
+        conn = getattr(cls._index_local, "conn", None)
+        if conn is None:
+            COVER_PACKS_ROOT.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                _INDEX_PATH, timeout=_INDEX_TIMEOUT, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_CREATE_INDEX_SQL)
+            cls._index_local.conn = conn
+        return conn
+
+    @classmethod
+    def _close_pack_map(cls, pack_id):
+        """Close a cached pack map. Call with the maps lock held."""
+        pack_map = cls._pack_maps.pop(pack_id, None)
+        if pack_map is not None:
+            pack_map.close()
+
+    @classmethod
+    def _read_pack(cls, pack_id, offset, length):
+        """Read bytes from a pack through a cached read only memory map."""
+        end = offset + length
+        with cls._pack_maps_lock:
+            pack_map = cls._pack_maps.get(pack_id)
+            if pack_map is None or len(pack_map) < end:
+                if pack_map is None:
+                    # Let go of packs compacted away by another process.
+                    for cached_id in tuple(cls._pack_maps):
+                        if not cls._get_pack_path(cached_id).exists():
+                            cls._close_pack_map(cached_id)
+                else:
+                    # Packs grow, so remap when reading past the old end.
+                    cls._close_pack_map(pack_id)
+                with cls._get_pack_path(pack_id).open("rb") as pack_file:
+                    pack_map = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+                cls._pack_maps[pack_id] = pack_map
+            cls._pack_maps.move_to_end(pack_id)
+            while len(cls._pack_maps) > _MAX_OPEN_PACKS:
+                cls._close_pack_map(next(iter(cls._pack_maps)))
+            if len(pack_map) < end:
+                return None
+            return pack_map[offset:end]
+
+    @classmethod
+    def read_packed_cover(cls, pk, custom=False):
+        """Read a cover from the packs.
+
+        Return None if the cover is not packed and empty if it is missing.
+        """
+        data = None
+        for _ in range(2):
+            row = cls._get_index().execute(_SELECT_SQL, (int(custom), pk)).fetchone()
+            if not row:
+                break
+            pack_id, offset, length = row
+            if not length:
+                data = b""
+                break
+            try:
+                data = cls._read_pack(pack_id, offset, length)
+                break
+            except FileNotFoundError:
+                # Compacted away since the index was read, read it again.
+                continue
+        return data
+
+    @classmethod
+    def get_packed_cover_pks(cls, custom=False):
+        """Get the pks of all packed covers."""
+        rows = cls._get_index().execute(
+            "SELECT pk FROM covers WHERE custom=?", (int(custom),)
+        )
+        return frozenset(row[0] for row in rows)
+
+    @classmethod
+    def _get_writable_pack(cls, pack_ids):
+        """Get the pack to append to."""
+        pack_id = pack_ids[-1] if pack_ids else 1
+        pack_path = cls._get_pack_path(pack_id)
+        if pack_path.exists() and pack_path.stat().st_size >= _PACK_MAX_SIZE:
+            pack_id += 1
+            pack_path = cls._get_pack_path(pack_id)
+        return pack_id, pack_path
+
+    @classmethod
+    def save_packed_covers(cls, covers, custom=False):
+        """Append covers to the packs. Takes an iterable of pk, data pairs."""
+        with cls._write_lock:
+            conn = cls._get_index()
+            pack_id, pack_path = cls._get_writable_pack(cls._get_pack_ids())
+            rows = []
+            pack_file = pack_path.open("ab")
+            try:
+                for pk, data in covers:
+                    offset = pack_file.tell()
+                    if offset >= _PACK_MAX_SIZE:
+                        pack_file.close()
+                        pack_id += 1
+                        pack_file = cls._get_pack_path(pack_id).open("ab")
+                        offset = 0
+                    # zero length is code for missing.
+                    if data:
+                        pack_file.write(data)
+                    rows.append((int(custom), pk, pack_id, offset, len(data)))
+            finally:
+                pack_file.close()
+            conn.executemany(_UPSERT_SQL, rows)
+        return len(rows)
+
+    @classmethod
+    def save_packed_cover(cls, pk, data, custom=False):
+        """Append one cover to the packs."""
+        cls.save_packed_covers(((pk, data),), custom)
+
+    @classmethod
+    def remove_packed_covers(cls, pks, custom=False):
+        """Remove covers from the index. Compaction reclaims the space."""
+        pks = tuple(pks)
+        count = 0
+        with cls._write_lock:
+            conn = cls._get_index()
+            for start in range(0, len(pks), FILTER_BATCH_SIZE):
+                batch_pks = pks[start : start + FILTER_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch_pks))
+                cursor = conn.execute(
+                    f"DELETE FROM covers WHERE custom=? AND pk IN ({placeholders})",  # noqa: S608
+                    (int(custom), *batch_pks),
+                )
+                count += cursor.rowcount
+        return count
+
+    @classmethod
+    def remove_all_packed_covers(cls):
+        """Remove every packed cover."""
+        with cls._write_lock:
+            cls._get_index().execute("DELETE FROM covers")
+            for pack_id in cls._get_pack_ids():
+                with suppress(FileNotFoundError):
+                    cls._get_pack_path(pack_id).unlink()
+
+    @classmethod
+    def _read_pack_rows(cls, rows):
+        """Read cover data for index rows from the old packs."""
+        for custom, pk, pack_id, offset, length in rows:
+            data = b""
+            if length:
+                data = cls._read_pack(pack_id, offset, length) or b""
+            yield custom, pk, data
+
+    @classmethod
+    def compact_cover_packs(cls):
+        """Rewrite live covers into new packs and remove the old ones.
+
+        Packs are only rewritten when enough of them is dead space.
+        """
+        with cls._write_lock:
+            conn = cls._get_index()
+            old_pack_ids = cls._get_pack_ids()
+            if not old_pack_ids:
+                return 0, 0
+            old_size = sum(
+                cls._get_pack_path(pack_id).stat().st_size for pack_id in old_pack_ids
+            )
+            live_size = conn.execute("SELECT COALESCE(SUM(length), 0) FROM covers")
+            dead_size = old_size - live_size.fetchone()[0]
+            if dead_size < old_size * _COMPACT_MIN_DEAD_RATIO:
+                return old_size, old_size
+            rows = conn.execute(
+                "SELECT custom, pk, pack, offset, length FROM covers"
+                " ORDER BY custom, pk"
+            ).fetchall()
+            pack_id = old_pack_ids[-1] + 1
+            new_rows = []
+            pack_file = cls._get_pack_path(pack_id).open("wb")
+            try:
+                for custom, pk, data in cls._read_pack_rows(rows):
+                    if pack_file.tell() >= _PACK_MAX_SIZE:
+                        pack_file.close()
+                        pack_id += 1
+                        pack_file = cls._get_pack_path(pack_id).open("wb")
+                    new_rows.append((custom, pk, pack_id, pack_file.tell(), len(data)))
+                    pack_file.write(data)
+            finally:
+                pack_file.close()
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(_UPSERT_SQL, new_rows)
+            conn.execute("COMMIT")
+            with cls._pack_maps_lock:
+                for old_pack_id in old_pack_ids:
+                    cls._close_pack_map(old_pack_id)
+            for old_pack_id in old_pack_ids:
+                cls._get_pack_path(old_pack_id).unlink()
+            new_size = sum(
+                cls._get_pack_path(new_pack_id).stat().st_size
+                for new_pack_id in cls._get_pack_ids()
+            )
+        return old_size, new_size
@@ -5,6 +5,7 @@ import shutil
 from pathlib import Path
 
 from codex.librarian.covers.create import CoverCreateThread
+from codex.librarian.covers.pack import COVER_PACKS_ROOT
 from codex.librarian.covers.status import CoverStatusTypes
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
 from codex.models import Comic
@@ -55,6 +56,8 @@ class CoverPurgeThread(CoverCreateThread):
 
     def purge_comic_covers(self, pks: frozenset[int], custom: bool):
         """Purge a set a cover paths."""
+        if COVER_PACKS_ROOT.is_dir():
+            self.remove_packed_covers(pks, custom)
         cover_paths = self.get_cover_paths(pks, custom)
         cover_root = self.CUSTOM_COVERS_ROOT if custom else self.COVERS_ROOT
         return self.purge_cover_paths(cover_paths, cover_root)
@@ -69,15 +72,28 @@ class CoverPurgeThread(CoverCreateThread):
             self.log.info("Removed entire custom cover cache.")
         except Exception as exc:
             self.log.warning(exc)
+        if COVER_PACKS_ROOT.is_dir():
+            self.remove_all_packed_covers()
+            self.log.info("Removed all packed covers.")
         librarian_queue.put(LIBRARY_CHANGED_TASK)
 
+    def _cleanup_orphan_packed_covers(self, pks, custom, name):
+        """Remove orphan covers from the pack index."""
+        if not COVER_PACKS_ROOT.is_dir():
+            return
+        orphan_pks = self.get_packed_cover_pks(custom) - frozenset(pks)
+        if count := self.remove_packed_covers(orphan_pks, custom):
+            self.log.info(f"Removed {count} packed covers for missing {name}.")
+
     def _cleanup_orphan_covers(self, cover_class, cover_root, name):
         """Remove all orphan cover thumbs."""
         try:
             self.log.debug(f"Removing covers from missing {name}.")
             self.status_controller.start_many(self._CLEANUP_STATUS_MAP)
             pks = cover_class.objects.all().values_list("pk", flat=True)
-            db_cover_paths = self.get_cover_paths(pks)
+            custom = cover_class == CustomCover
+            self._cleanup_orphan_packed_covers(pks, custom, name)
+            db_cover_paths = self.get_cover_paths(pks, custom)
 
             orphan_cover_paths = set()
             for root, _, filenames in os.walk(cover_root):
@@ -39,8 +39,23 @@ class CoverSaveToCache(CoverTask):
 
     cover_path: str
     data: bytes
+    pk: int = 0
+    custom: bool = False
 
 
 @dataclass
 class CoverCreateAllTask(CoverTask):
     """A create all comic covers."""
+
+
+@dataclass
+class CoverCreateTask(CoverTask):
+    """Create missing covers for pks, in order."""
+
+    pks: tuple[int, ...]
+    custom: bool = False
+
+
+@dataclass
+class CoverPackTask(CoverTask):
+    """Move loose covers into packs and compact the packs."""
@@ -3,6 +3,7 @@
 from collections.abc import Mapping
 from pathlib import Path
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.librarian.importer.const import (
     COMIC_FK_FIELD_NAMES,
     COMIC_M2M_FIELD_NAMES,
@@ -16,6 +17,8 @@ from codex.librarian.importer.const import (
     ISSUE_COUNT,
     M2M_MDS,
     MDS,
+    PAGE_INDEX_METADATA_KEY,
+    PAGE_INDEXES,
     VOLUME_COUNT,
 )
 from codex.librarian.importer.extract import ExtractMetadataImporter
@@ -183,6 +186,7 @@ class AggregateMetadataImporter(ExtractMetadataImporter):
         md, m2m_md, fk_md, group_tree_md = self._get_path_metadata(md, path)
 
         path_str = str(path)
+        self.metadata[PAGE_INDEXES][path_str] = md.pop(PAGE_INDEX_METADATA_KEY, None)
         if md:
             all_mds = self.metadata[MDS]
             all_mds[path_str] = md
@@ -223,17 +227,18 @@ class AggregateMetadataImporter(ExtractMetadataImporter):
             import_metadata = True
         else:
             key = AdminFlag.FlagChoices.IMPORT_METADATA.value  # type: ignore
-            import_metadata = AdminFlag.objects.get(key=key).on
+            import_metadata = ADMIN_FLAGS.get(key)
         if not import_metadata:
             self.log.warn("Admin flag set to NOT import metadata.")
 
         # Init metadata, extract and aggregate
         self.metadata[MDS] = {}
         self.metadata[M2M_MDS] = {}
+        self.metadata[PAGE_INDEXES] = {}
         self.metadata[FKS] = {GROUP_TREES: {cls: {} for cls in self._BROWSER_GROUPS}}
-        self.metadata[FIS] = {}
-        for path in all_paths:
-            md = self.extract_and_clean(path, import_metadata)
+        # Failed imports accumulate across chunks.
+        self.metadata.setdefault(FIS, {})
+        for path, md in self.extract_all(all_paths, import_metadata):
             if md:
                 self._aggregate_path(md, path, status)
 
@@ -4,7 +4,7 @@ from django.db.models.aggregates import Count
 from django.db.models.functions.datetime import Now
 from django.db.models.query import Q
 
-from codex.librarian.importer.init import InitImporter
+from codex.librarian.importer.rollups import GroupRollupImporter
 from codex.librarian.importer.status import ImportStatusTypes
 from codex.models import StoryArc, Volume
 from codex.status import Status
@@ -13,7 +13,7 @@ from codex.views.const import GROUP_MODELS
 _UPDATE_FIELDS = ("updated_at",)
 
 
-class CacheUpdateImporter(InitImporter):
+class CacheUpdateImporter(GroupRollupImporter):
     """Update Groups timestamp for cover cache busting."""
 
     @staticmethod
@@ -65,7 +65,9 @@ class CacheUpdateImporter(InitImporter):
             log_list.append(f"{count} {model.__name__}s")
         return count
 
-    def update_all_groups(self, force_update_group_map, start_time):
+    def update_all_groups(
+        self, force_update_group_map, start_time, include_stale_groups=True
+    ):
         """Update timestamps for each group for cover cache busting."""
         total_count = 0
         status = Status(ImportStatusTypes.GROUP_UPDATE)
@@ -82,6 +84,10 @@ class CacheUpdateImporter(InitImporter):
                 status.add_complete(count)
                 self.status_controller.update(status, notify=False)
                 total_count += count
+            self.update_group_rollups(
+                force_update_group_map, start_time, include_stale_groups
+            )
+            self.update_comic_facets(start_time)
 
             if total_count:
                 groups_log = ", ".join(log_list)
@@ -121,6 +121,8 @@ _EXCLUDEBULK_UPDATE_COMIC_FIELDS = {
     "id",
     "library",
     "comicfts",
+    "facets",
+    "page_index",
 }
 GROUP_BASE_FIELDS = ("name", "sort_name")
 BULK_UPDATE_COMIC_FIELDS = tuple(
@@ -192,9 +194,12 @@ M2M_MDS = "m2m_mds"
 FKS = "fks"
 FIS = "fis"
 FK_CREATE = "fk_create"
+FK_LINKS = "fk_links"
 COVERS_UPDATE = "covers_update"
 COVERS_CREATE = "covers_create"
 LINK_COVER_PKS = "link_cover_pks"
+PAGE_INDEX_METADATA_KEY = "page_index"
+PAGE_INDEXES = "page_indexes"
 GROUP_COMPARE_FIELDS = MappingProxyType(
     {
         Series: ("publisher__name", "imprint__name", "name"),
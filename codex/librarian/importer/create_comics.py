@@ -7,6 +7,7 @@ from codex.librarian.importer.const import (
     BULK_CREATE_COMIC_FIELDS,
     BULK_UPDATE_COMIC_FIELDS,
     BULK_UPDATE_COMIC_FIELDS_WITH_VALUES,
+    FK_LINKS,
     MDS,
 )
 from codex.librarian.importer.link_comics import LinkComicsImporter
@@ -116,6 +117,7 @@ class CreateComicsImporter(LinkComicsImporter):
                 self.log.exception(f"Error preparing {path} for create.")
         self.task.files_created = frozenset()
         self.metadata.pop(MDS)
+        self.metadata.pop(FK_LINKS, None)
 
         num_comics = len(create_comics)
         count = 0
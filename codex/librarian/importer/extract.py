@@ -1,7 +1,11 @@
 """Clean metadata before importing."""
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import suppress
 from decimal import ROUND_DOWN, Decimal
+from functools import partial
+from multiprocessing import cpu_count, get_context
 from typing import Any
 from zipfile import BadZipFile
 
@@ -13,7 +17,13 @@ from django.db.models import CharField
 from django.db.models.fields import DecimalField, PositiveSmallIntegerField
 from rarfile import BadRarFile
 
-from codex.librarian.importer.const import FIS, STORY_ARCS_METADATA_KEY
+from codex.librarian.importer.const import (
+    FIS,
+    PAGE_INDEX_METADATA_KEY,
+    STORY_ARCS_METADATA_KEY,
+)
+from codex.librarian.importer.extract_cache import ExtractCacheMixin
+from codex.librarian.importer.page_index import PageIndexMixin
 from codex.librarian.importer.query_fks import QueryForeignKeysImporter
 from codex.models import Comic
 from codex.models.named import (
@@ -23,12 +33,14 @@ from codex.models.named import (
     IdentifierType,
     StoryArc,
 )
+from codex.settings.settings import EXTRACT_WORKERS
 
 _MD_INVALID_KEYS = frozenset(
     (
         "id",
         "created_at",
         "library",
+        "page_index",
         "parent_folder",
         "pk",
         "stat",
@@ -64,9 +76,14 @@ _SI_MIN = 2**15 * -1
 _SI_MAX = 2**15 - 1
 _DECIMAL_ZERO = Decimal("0.00")
 _ALPHA_2_LEN = 2
+_WARN_EXCEPTIONS = (UnsupportedArchiveTypeError, BadRarFile, BadZipFile, OSError)
+# Starting worker processes costs more than reading a few comics.
+_MIN_POOL_PATHS = 64
 
 
-class ExtractMetadataImporter(QueryForeignKeysImporter):
+class ExtractMetadataImporter(
+    QueryForeignKeysImporter, ExtractCacheMixin, PageIndexMixin
+):
     """Clean metadata before importing."""
 
     @staticmethod
@@ -236,12 +253,21 @@ class ExtractMetadataImporter(QueryForeignKeysImporter):
         cls._clean_identifiers(md)
         return md
 
-    def extract_and_clean(self, path, import_metadata):
-        """Extract metadata from comic and clean it for codex."""
+    @classmethod
+    def extract_and_clean_path(cls, path, import_metadata):
+        """Extract and clean metadata for one path. Runs in worker processes.
+
+        Unreadable archives are returned as errors, anything else is raised.
+        """
         md = {}
-        failed_import = {}
+        error = None
+        cache_key = None
+        page_index = None
         try:
             if import_metadata:
+                cache_key = cls.get_extract_cache_key(path)
+                if cache_key and (cached_md := cls.load_extract_cache(cache_key)):
+                    return cached_md, error
                 with Comicbox(path) as cb:
                     md = cb.to_dict()
                     md = md.get("comicbox", {})
@@ -249,14 +275,72 @@ class ExtractMetadataImporter(QueryForeignKeysImporter):
                         md["file_type"] = cb.get_file_type()
                     if "page_count" not in md:
                         md["page_count"] = cb.get_page_count()
+                    page_index = cls.get_page_index(cb, path)
             md["path"] = path
-            md = self._clean_md(md)
-        except (UnsupportedArchiveTypeError, BadRarFile, BadZipFile, OSError) as exc:
-            self.log.warning(f"Failed to import {path}: {exc}")
-            failed_import = {path: exc}
+            md = cls._clean_md(md)
+            if page_index:
+                md[PAGE_INDEX_METADATA_KEY] = page_index
+        except _WARN_EXCEPTIONS as exc:
+            error = exc
+        if cache_key and not error:
+            with suppress(OSError):
+                cls.save_extract_cache(cache_key, md)
+        return md, error
+
+    def _get_extract_result(self, path, get_result):
+        """Get extracted metadata and record failed imports."""
+        try:
+            md, exc = get_result()
+        except BrokenProcessPool:
+            raise
         except Exception as exc:
             self.log.exception(f"Failed to import: {path}")
-            failed_import = {path: exc}
-        if failed_import:
-            self.metadata[FIS].update(failed_import)
+            self.metadata[FIS][path] = exc
+            return {}
+        if exc:
+            self.log.warning(f"Failed to import {path}: {exc}")
+            self.metadata[FIS][path] = exc
         return md
+
+    def extract_and_clean(self, path, import_metadata):
+        """Extract metadata from comic and clean it for codex."""
+        return self._get_extract_result(
+            path, partial(self.extract_and_clean_path, path, import_metadata)
+        )
+
+    def _extract_all_serial(self, paths, import_metadata):
+        """Extract metadata in this thread."""
+        for path in paths:
+            yield path, self.extract_and_clean(path, import_metadata)
+
+    def _extract_all_pool(self, paths, import_metadata, num_workers):
+        """Extract metadata in a pool of worker processes."""
+        extract = partial(
+            ExtractMetadataImporter.extract_and_clean_path,
+            import_metadata=import_metadata,
+        )
+        done = 0
+        try:
+            # Spawn because forking the multithreaded librarian is unsafe.
+            with ProcessPoolExecutor(
+                max_workers=num_workers, mp_context=get_context("spawn")
+            ) as executor:
+                # Submit each path so one failure doesn't stop the rest.
+                futures = [executor.submit(extract, path) for path in paths]
+                for path, future in zip(paths, futures, strict=True):
+                    md = self._get_extract_result(path, future.result)
+                    done += 1
+                    yield path, md
+        except BrokenProcessPool:
+            self.log.exception("Metadata extract pool failed, continuing serially.")
+            yield from self._extract_all_serial(paths[done:], import_metadata)
+
+    def extract_all(self, paths, import_metadata):
+        """Extract and clean metadata for many paths. Yields path, md pairs."""
+        paths = tuple(paths)
+        num_workers = min(EXTRACT_WORKERS or cpu_count() or 1, len(paths))
+        if num_workers <= 1 or len(paths) < _MIN_POOL_PATHS:
+            yield from self._extract_all_serial(paths, import_metadata)
+        else:
+            self.log.debug(f"Reading tags with {num_workers} worker processes.")
+            yield from self._extract_all_pool(paths, import_metadata, num_workers)
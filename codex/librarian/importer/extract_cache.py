@@ -0,0 +1,115 @@
+"""On disk cache of cleaned comic metadata."""
+
+import os
+import pickle
+from contextlib import suppress
+from hashlib import blake2b
+from importlib.metadata import version
+from pathlib import Path
+
+from codex.settings.settings import EXTRACT_CACHE_MAX_ENTRIES, ROOT_CACHE_PATH
+from codex.version import VERSION
+from codex.worker_base import WorkerBaseMixin
+
+EXTRACT_CACHE_ROOT = ROOT_CACHE_PATH / "extract"
+_HEAD_SIZE = 4096
+# Zip & rar indexes live at the end of the archive.
+_TAIL_SIZE = 65536
+_SUFFIX = ".pickle"
+# Bump when what's cached changes.
+_FORMAT_VERSION = 1
+_VERSION_SALT = (_FORMAT_VERSION, VERSION, version("comicbox"))
+
+
+class ExtractCacheMixin(WorkerBaseMixin):
+    """Cache cleaned metadata keyed by path, size, inode and a content fingerprint."""
+
+    @staticmethod
+    def _get_extract_cache_path(path) -> Path:
+        """Get the cache entry path for a comic path."""
+        digest = blake2b(str(path).encode(), digest_size=16).hexdigest()
+        return EXTRACT_CACHE_ROOT / digest[:2] / (digest + _SUFFIX)
+
+    @staticmethod
+    def get_extract_cache_key(path) -> tuple | None:
+        """Cheaply fingerprint a comic without reading all of it."""
+        if not EXTRACT_CACHE_MAX_ENTRIES:
+            return None
+        stat = Path(path).stat()
+        fingerprint = blake2b(digest_size=16)
+        with Path(path).open("rb") as comic_file:
+            fingerprint.update(comic_file.read(_HEAD_SIZE))
+            if stat.st_size > _HEAD_SIZE:
+                comic_file.seek(max(_HEAD_SIZE, stat.st_size - _TAIL_SIZE))
+                fingerprint.update(comic_file.read(_TAIL_SIZE))
+        return (
+            str(path),
+            stat.st_size,
+            stat.st_ino,
+            fingerprint.hexdigest(),
+            *_VERSION_SALT,
+        )
+
+    @classmethod
+    def load_extract_cache(cls, key) -> dict | None:
+        """Load cached metadata if the key matches."""
+        if not EXTRACT_CACHE_MAX_ENTRIES:
+            return None
+        cache_path = cls._get_extract_cache_path(key[0])
+        try:
+            with cache_path.open("rb") as cache_file:
+                cached_key, md = pickle.load(cache_file)  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return None
+        if cached_key != key:
+            return None
+        # mtime records recent use for eviction.
+        cache_path.touch()
+        return md
+
+    @classmethod
+    def save_extract_cache(cls, key, md):
+        """Atomically write metadata to the cache."""
+        if not EXTRACT_CACHE_MAX_ENTRIES:
+            return
+        cache_path = cls._get_extract_cache_path(key[0])
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as cache_file:
+            pickle.dump((key, md), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+
+    @staticmethod
+    def _get_extract_cache_entries():
+        """Get all cache entries with their last use time."""
+        entries = []
+        if not EXTRACT_CACHE_ROOT.is_dir():
+            return entries
+        for cache_dir in os.scandir(EXTRACT_CACHE_ROOT):
+            if not cache_dir.is_dir():
+                continue
+            for entry in os.scandir(cache_dir.path):
+                with suppress(FileNotFoundError):
+                    entries.append((entry.stat().st_mtime, entry.path))
+        return entries
+
+    def cleanup_extract_cache(self, purge=False):
+        """Evict least recently used metadata cache entries or purge them all."""
+        entries = self._get_extract_cache_entries()
+        if purge:
+            remove_entries = entries
+        else:
+            num_extra = len(entries) - EXTRACT_CACHE_MAX_ENTRIES
+            remove_entries = sorted(entries)[:num_extra] if num_extra > 0 else ()
+        count = 0
+        for _, entry_path in remove_entries:
+            try:
+                Path(entry_path).unlink()
+                count += 1
+            except FileNotFoundError:
+                pass
+        if count:
+            self.log.info(f"Removed {count} metadata cache entries.")
+        else:
+            self.log.debug("No metadata cache entries to remove.")
+        return count
@@ -1,15 +1,20 @@
 """The main importer class."""
 
+from math import ceil
 from time import time
 
-from django.core.cache import cache
+from django.utils.timezone import now
 from humanize import naturaldelta
 
+from codex.cache_generation import clear_cache
+from codex.librarian.covers.tasks import CoverCreateTask
 from codex.librarian.importer.moved import MovedImporter
 from codex.librarian.importer.status import ImportStatusTypes
 from codex.librarian.notifier.tasks import FAILED_IMPORTS_TASK, LIBRARY_CHANGED_TASK
 from codex.librarian.search.tasks import SearchIndexUpdateTask
 from codex.librarian.tasks import DelayedTasks
+from codex.models import Comic
+from codex.settings.settings import IMPORT_CHUNK_SIZE
 
 
 class ComicImporter(MovedImporter):
@@ -24,10 +29,41 @@ class ComicImporter(MovedImporter):
         self.library.save()
         self.status_controller.finish_many(ImportStatusTypes.values)
 
+    def _notify_library_changed(self):
+        """Bust the cache and tell browsers the library changed."""
+        clear_cache()
+        self.librarian_queue.put(LIBRARY_CHANGED_TASK)
+
+    def _get_cover_create_pks(self):
+        """Order imported comic pks by how likely their covers are to be seen."""
+        rows = (
+            Comic.objects.filter(library=self.library, updated_at__gt=self.start_time)
+            .order_by("-created_at", "-pk")
+            .values_list("pk", "series_id", "issue_number")
+        )
+        # First issues of each series, newest series first.
+        first_issues = {}
+        for pk, series_id, issue_number in rows:
+            first_issue = first_issues.get(series_id)
+            if first_issue is None or (
+                issue_number is not None
+                and (first_issue[1] is None or issue_number < first_issue[1])
+            ):
+                first_issues[series_id] = (pk, issue_number)
+        first_pks = tuple(pk for pk, _ in first_issues.values())
+        # Then the rest, newest first.
+        first_pks_set = frozenset(first_pks)
+        other_pks = tuple(pk for pk, _, _ in rows if pk not in first_pks_set)
+        return first_pks + other_pks
+
+    def _queue_create_covers(self):
+        """Pre-generate covers for imported comics in the background."""
+        if pks := self._get_cover_create_pks():
+            self.librarian_queue.put(CoverCreateTask(pks))
+
     def _finish_apply(self, new_failed_imports, imported_count):
         """Perform final tasks when the apply is done."""
         if self.changed:
-            cache.clear()
             elapsed_time = time() - self.start_time.timestamp()
             elapsed = naturaldelta(elapsed_time)
             log_txt = f"Updated library {self.library.path} in {elapsed}."
@@ -39,7 +75,9 @@ class ComicImporter(MovedImporter):
             else:
                 log_txt += " No comics to import."
             self.log.info(log_txt)
-            self.librarian_queue.put(LIBRARY_CHANGED_TASK)
+            self._notify_library_changed()
+            if imported_count:
+                self._queue_create_covers()
 
             # Wait to start the search index update in case more updates are incoming.
             until = time() + 1
@@ -50,37 +88,83 @@ class ComicImporter(MovedImporter):
         if new_failed_imports:
             self.librarian_queue.put(FAILED_IMPORTS_TASK)
 
+    def _import_comics_chunk(self):
+        """Extract, query, create and link one chunk of comics."""
+        #############
+        # AGGREGATE #
+        #############
+        self.get_aggregate_metadata()
+
+        #########
+        # QUERY #
+        #########
+        self.query_all_missing_fks()
+
+        #####################
+        # UPDATE AND CREATE #
+        #####################
+        self.create_all_fks()
+        self.build_fk_link_map()
+        imported_count = self.bulk_update_comics()
+        imported_count += self.bulk_create_comics()
+        self.bulk_update_page_indexes()
+
+        ########
+        # LINK #
+        ########
+        self.bulk_query_and_link_comic_m2m_fields()
+        return imported_count
+
+    def _import_comics(self):
+        """Import comics in fixed size chunks to bound memory use.
+
+        Returns the count and the time groups need updating since.
+        """
+        files_modified = self.task.files_modified
+        files_created = self.task.files_created
+        paths = sorted(files_modified | files_created)
+        num_chunks = max(1, ceil(len(paths) / IMPORT_CHUNK_SIZE))
+        imported_count = 0
+        groups_updated_since = self.start_time
+        for index in range(num_chunks):
+            start = index * IMPORT_CHUNK_SIZE
+            chunk = frozenset(paths[start : start + IMPORT_CHUNK_SIZE])
+            self.task.files_modified = chunk & files_modified
+            self.task.files_created = chunk & files_created
+            if num_chunks > 1:
+                self.log.info(
+                    f"Importing chunk {index + 1} of {num_chunks}"
+                    f" in {self.library.path}..."
+                )
+            chunk_count = self._import_comics_chunk()
+            imported_count += chunk_count
+            if chunk_count and index < num_chunks - 1:
+                # Show progress in the browser before the import finishes.
+                update_start_time = now()
+                self.update_all_groups(
+                    {}, groups_updated_since, include_stale_groups=False
+                )
+                groups_updated_since = update_start_time
+                self._notify_library_changed()
+        self.task.files_modified = files_modified
+        self.task.files_created = files_created
+        return imported_count, groups_updated_since
+
     def apply(self):
         """Bulk import comics."""
         try:
             self.init_apply()
+            self.init_group_rollups()
             self.move_and_modify_dirs()
 
-            #############
-            # AGGREGATE #
-            #############
-            self.get_aggregate_metadata()
-
-            #########
-            # QUERY #
-            #########
-            self.query_all_missing_fks()
             self.query_missing_custom_covers()
+            imported_count, groups_updated_since = self._import_comics()
 
-            #####################
-            # UPDATE AND CREATE #
-            #####################
-            self.create_all_fks()
+            ##########
+            # COVERS #
+            ##########
             self.update_custom_covers()
             self.create_custom_covers()
-
-            imported_count = self.bulk_update_comics()
-            imported_count += self.bulk_create_comics()
-
-            ########
-            # LINK #
-            ########
-            self.bulk_query_and_link_comic_m2m_fields()
             self.link_custom_covers()
             self.changed += imported_count
 
@@ -88,7 +172,8 @@ class ComicImporter(MovedImporter):
 
             deleted_comic_groups = self.delete()
 
-            self.update_all_groups(deleted_comic_groups, self.start_time)
+            # Earlier chunks' groups are already up to date.
+            self.update_all_groups(deleted_comic_groups, groups_updated_since)
 
         finally:
             self._finish_apply_status()
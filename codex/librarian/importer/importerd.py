@@ -4,22 +4,31 @@ from pathlib import Path
 
 from django.utils import timezone
 
+from codex.librarian.importer.extract_cache import ExtractCacheMixin
 from codex.librarian.importer.importer import ComicImporter
 from codex.librarian.importer.status import ImportStatusTypes
 from codex.librarian.importer.tasks import (
     AdoptOrphanFoldersTask,
+    ExtractCacheCleanupTask,
     ImportDBDiffTask,
     LazyImportComicsTask,
+    UpdateGroupRollupsTask,
     UpdateGroupsTask,
 )
 from codex.librarian.janitor.tasks import JanitorAdoptOrphanFoldersFinishedTask
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
-from codex.models import Comic, Folder, Library
+from codex.models import (
+    GROUP_PROGRESS_MODELS,
+    GROUP_ROLLUP_MODELS,
+    Comic,
+    Folder,
+    Library,
+)
 from codex.status import Status
 from codex.threads import QueuedThread
 
 
-class ComicImporterThread(QueuedThread):
+class ComicImporterThread(ExtractCacheMixin, QueuedThread):
     """A worker to handle all bulk database updates."""
 
     def _create_importer(self, task):
@@ -58,6 +67,19 @@ class ComicImporterThread(QueuedThread):
             importer.update_all_groups({}, start_time)
         self.librarian_queue.put(LIBRARY_CHANGED_TASK)
 
+    def _update_group_rollups(self, task):
+        """Recompute rollups and reading progress for the task's groups."""
+        count = 0
+        for model, rollup_model in GROUP_ROLLUP_MODELS.items():
+            pks = task.group_pks.get(model.__name__)
+            if not pks:
+                continue
+            count += rollup_model.update_groups(pks)
+            GROUP_PROGRESS_MODELS[model].update_groups(pks)
+        if count:
+            self.log.debug(f"Updated {count} group rollups.")
+        self.librarian_queue.put(LIBRARY_CHANGED_TASK)
+
     def _adopt_orphan_folders_for_library(self, library):
         """Adopt orphan folders for one library."""
         orphan_folder_paths = (
@@ -117,7 +139,11 @@ class ComicImporterThread(QueuedThread):
             self._lazy_import_metadata(task)
         elif isinstance(task, UpdateGroupsTask):
             self._update_groups(task)
+        elif isinstance(task, UpdateGroupRollupsTask):
+            self._update_group_rollups(task)
         elif isinstance(task, AdoptOrphanFoldersTask):
             self._adopt_orphan_folders(task.janitor)
+        elif isinstance(task, ExtractCacheCleanupTask):
+            self.cleanup_extract_cache(task.purge)
         else:
             self.log.warning(f"Bad task sent to library updater {task}")
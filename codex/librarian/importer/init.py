@@ -27,6 +27,7 @@ class InitImporter(WorkerBaseMixin):
         self.task: ImportDBDiffTask = task
         self.metadata: dict[str, Any] = {}
         self.changed: int = 0
+        self.stale_rollup_groups: dict[type, set[int]] = {}
         self.library = Library.objects.only("path", "update_in_progress").get(
             pk=self.task.library_id
         )
@@ -1,6 +1,7 @@
 """Bulk update m2m fields."""
 
 from pathlib import Path
+from types import MappingProxyType
 
 from django.db.models import Q
 
@@ -8,9 +9,11 @@ from codex.librarian.importer.const import (
     COMIC_FK_FIELD_NAMES,
     DICT_MODEL_FIELD_NAME_CLASS_MAP,
     DICT_MODEL_REL_LINK_MAP,
+    FK_LINKS,
     FOLDERS_FIELD,
     IMPRINT,
     M2M_MDS,
+    MDS,
     PARENT_FOLDER,
     PUBLISHER,
     SERIES,
@@ -29,8 +32,18 @@ from codex.models import (
     Volume,
 )
 from codex.models.named import Identifier
+from codex.settings.settings import FILTER_BATCH_SIZE
 from codex.status import Status
 
+_GROUP_PARENTS = MappingProxyType(
+    {
+        Publisher: (),
+        Imprint: ("publisher",),
+        Series: ("publisher", "imprint"),
+        Volume: ("publisher", "imprint", "series"),
+    }
+)
+
 
 class LinkComicsImporter(LinkCoversImporter):
     """Link comics methods."""
@@ -42,31 +55,142 @@ class LinkComicsImporter(LinkCoversImporter):
         return md.get(field_name, group_class.DEFAULT_NAME)
 
     @classmethod
-    def get_comic_fk_links(cls, md, path):
+    def _get_group_names(cls, md):
+        """Get the group names tuple for a comic."""
+        return tuple(cls._get_group_name(group_cls, md) for group_cls in _GROUP_PARENTS)
+
+    def _get_fk_link_keys(self):
+        """Collect the group trees, folders and fk names used by all comics."""
+        keys = {model: set() for model in (*_GROUP_PARENTS, Folder)}
+        for path, md in self.metadata[MDS].items():
+            group_tree = self._get_group_names(md)
+            for index, group_cls in enumerate(_GROUP_PARENTS, start=1):
+                keys[group_cls].add(group_tree[:index])
+            keys[Folder].add(str(Path(path).parent))
+            for field_name in COMIC_FK_FIELD_NAMES:
+                if name := md.get(field_name):
+                    if field_name not in keys:
+                        keys[field_name] = set()
+                    keys[field_name].add(name)
+        return keys
+
+    @staticmethod
+    def _get_fk_link_filter(field, values, _parents):
+        """Filter on values including null."""
+        query_filter = Q(**{f"{field}__in": values})
+        if None in values:
+            query_filter |= Q(**{f"{field}__isnull": True})
+        return query_filter
+
+    @staticmethod
+    def _get_group_link_filter(field, group_trees, parents):
+        """Filter on whole group trees so shared names don't match other parents."""
+        rels = (*(f"{parent}__{field}" for parent in parents), field)
+        query_filter = Q()
+        for group_tree in group_trees:
+            tree_filter = Q()
+            for rel, name in zip(rels, group_tree, strict=True):
+                if name is None:
+                    tree_filter &= Q(**{f"{rel}__isnull": True})
+                else:
+                    tree_filter &= Q(**{rel: name})
+            query_filter |= tree_filter
+        return query_filter
+
+    def _query_fk_link_map(self, key, model, field, values, parents=()):
+        """Query one model's linkable objects in batches."""
+        fk_link_map = self.metadata[FK_LINKS]
+        values = list(values)
+        qs = model.objects.all()
+        if parents:
+            qs = qs.select_related(*parents)
+            get_filter = self._get_group_link_filter
+        else:
+            get_filter = self._get_fk_link_filter
+        # Do this in batches so as not to exceed the 1k line sqlite limit
+        batch_size = max(1, FILTER_BATCH_SIZE // (len(parents) + 1))
+        start = 0
+        while start < len(values):
+            batch = values[start : start + batch_size]
+            for obj in qs.filter(get_filter(field, batch, parents)):
+                obj_key = (
+                    *(getattr(obj, parent).name for parent in parents),
+                    getattr(obj, field),
+                )
+                fk_link_map[(key, obj_key)] = obj
+            start += batch_size
+
+    def build_fk_link_map(self):
+        """Query all foreign keys the comics link to in bulk."""
+        if not self.metadata.get(MDS):
+            return
+        self.metadata[FK_LINKS] = {}
+        for key, values in self._get_fk_link_keys().items():
+            if not values:
+                continue
+            if key in _GROUP_PARENTS:
+                self._query_fk_link_map(key, key, "name", values, _GROUP_PARENTS[key])
+            elif key == Folder:
+                self._query_fk_link_map(key, Folder, "path", values)
+            else:
+                model = Comic._meta.get_field(key).related_model
+                self._query_fk_link_map(key, model, "name", values)
+        count = len(self.metadata[FK_LINKS])
+        self.log.debug(f"Queried {count} foreign keys to link comics to.")
+
+    def _get_fk_link(self, key, obj_key, model, **get_kwargs):
+        """Get a foreign key object from the link map or the database."""
+        fk_link_map = self.metadata.get(FK_LINKS)
+        if fk_link_map is None:
+            fk_link_map = self.metadata[FK_LINKS] = {}
+        map_key = (key, obj_key)
+        obj = fk_link_map.get(map_key)
+        if obj is None:
+            obj = fk_link_map[map_key] = model.objects.get(**get_kwargs)
+        return obj
+
+    def get_comic_fk_links(self, md, path):
         """Get links for all foreign keys for creating and updating."""
-        publisher_name = cls._get_group_name(Publisher, md)
-        imprint_name = cls._get_group_name(Imprint, md)
-        series_name = cls._get_group_name(Series, md)
-        volume_name = cls._get_group_name(Volume, md)
-        md[PUBLISHER] = Publisher.objects.get(name=publisher_name)
-        md[IMPRINT] = Imprint.objects.get(
-            publisher__name=publisher_name, name=imprint_name
+        publisher_name, imprint_name, series_name, volume_name = (
+            group_tree := self._get_group_names(md)
+        )
+        md[PUBLISHER] = self._get_fk_link(
+            Publisher, group_tree[:1], Publisher, name=publisher_name
         )
-        md[SERIES] = Series.objects.get(
-            publisher__name=publisher_name, imprint__name=imprint_name, name=series_name
+        md[IMPRINT] = self._get_fk_link(
+            Imprint,
+            group_tree[:2],
+            Imprint,
+            publisher__name=publisher_name,
+            name=imprint_name,
         )
-        md[VOLUME] = Volume.objects.get(
+        md[SERIES] = self._get_fk_link(
+            Series,
+            group_tree[:3],
+            Series,
+            publisher__name=publisher_name,
+            imprint__name=imprint_name,
+            name=series_name,
+        )
+        md[VOLUME] = self._get_fk_link(
+            Volume,
+            group_tree,
+            Volume,
             publisher__name=publisher_name,
             imprint__name=imprint_name,
             series__name=series_name,
             name=volume_name,
         )
-        parent_path = Path(path).parent
-        md[PARENT_FOLDER] = Folder.objects.get(path=parent_path)
+        parent_path = str(Path(path).parent)
+        md[PARENT_FOLDER] = self._get_fk_link(
+            Folder, (parent_path,), Folder, path=parent_path
+        )
         for field_name in COMIC_FK_FIELD_NAMES:
             name = md.pop(field_name, None)
             if name and (fk_class := Comic._meta.get_field(field_name).related_model):
-                md[field_name] = fk_class.objects.get(name=name)
+                md[field_name] = self._get_fk_link(
+                    field_name, (name,), fk_class, name=name
+                )
 
     @staticmethod
     def _get_link_folders_filter(_field_name, folder_paths):
@@ -0,0 +1,124 @@
+"""Index where each page lives in comic archives."""
+
+from contextlib import suppress
+from pathlib import Path
+from zipfile import BadZipFile, ZipFile, ZipInfo
+
+from comicbox.exceptions import UnsupportedArchiveTypeError
+from PIL import Image
+from rarfile import BadRarFile
+
+from codex.librarian.importer.const import PAGE_INDEXES
+from codex.models import Comic
+from codex.models.comic import ComicPageIndex, FileType
+from codex.settings.settings import FILTER_BATCH_SIZE
+from codex.worker_base import WorkerBaseMixin
+
+_ARCHIVE_EXCEPTIONS = (UnsupportedArchiveTypeError, BadRarFile, BadZipFile, OSError)
+
+
+class PageIndexMixin(WorkerBaseMixin):
+    """Build and store per comic page indexes."""
+
+    @staticmethod
+    def _get_page_entry(pagename, info, is_zip):
+        """Get the archive location of one page."""
+        if is_zip and isinstance(info, ZipInfo):
+            return [
+                pagename,
+                info.compress_size,
+                info.file_size,
+                info.header_offset,
+                info.compress_type,
+                None,
+                None,
+            ]
+        return [
+            pagename,
+            getattr(info, "compress_size", None),
+            getattr(info, "file_size", None),
+            None,
+            None,
+            None,
+            None,
+        ]
+
+    @staticmethod
+    def _add_page_dims(path, pages):
+        """Read page dimensions from the image headers of a zip."""
+        with ZipFile(path) as zf:
+            for page in pages:
+                # Only the image header is decompressed.
+                with (
+                    suppress(Exception),
+                    zf.open(page[ComicPageIndex.NAME]) as page_file,
+                    Image.open(page_file) as image,
+                ):
+                    page[ComicPageIndex.WIDTH], page[ComicPageIndex.HEIGHT] = image.size
+
+    @classmethod
+    def get_page_index(cls, cb, path):
+        """Get the archive size and page locations. Runs in worker processes."""
+        try:
+            # Pdf pages look like zip members but aren't.
+            is_zip = cb.get_file_type() == FileType.CBZ.value
+            infos = {info.filename: info for info in cb.infolist()}
+            pages = [
+                cls._get_page_entry(pagename, infos.get(pagename), is_zip)
+                for pagename in cb.get_page_filenames()
+            ]
+            if not pages:
+                return None
+            if is_zip:
+                cls._add_page_dims(path, pages)
+            return (Path(path).stat().st_size, pages)
+        except _ARCHIVE_EXCEPTIONS:
+            # Unreadable archives are read page by page.
+            return None
+
+    def _delete_page_indexes(self, pks):
+        """Delete page indexes comics no longer have."""
+        if not pks:
+            return
+        count, _ = ComicPageIndex.objects.filter(comic_id__in=pks).delete()
+        if count:
+            self.log.debug(f"Deleted {count} stale comic page indexes.")
+
+    def _bulk_update_page_indexes_batch(self, page_indexes, paths):
+        """Create or update the page indexes for a batch of paths."""
+        comics = Comic.objects.filter(library=self.library, path__in=paths).values_list(
+            "pk", "path"
+        )
+        update_indexes = []
+        delete_pks = []
+        for pk, path in comics:
+            if page_index := page_indexes.get(path):
+                size, pages = page_index
+                update_indexes.append(
+                    ComicPageIndex(comic_id=pk, size=size, pages=pages)
+                )
+            else:
+                delete_pks.append(pk)
+        if update_indexes:
+            ComicPageIndex.objects.bulk_create(
+                update_indexes,
+                update_conflicts=True,
+                update_fields=("size", "pages", "updated_at"),
+                unique_fields=("comic",),
+            )
+        self._delete_page_indexes(delete_pks)
+        return len(update_indexes)
+
+    def bulk_update_page_indexes(self):
+        """Store the page indexes of imported comics."""
+        page_indexes = self.metadata.pop(PAGE_INDEXES, None)
+        if not page_indexes:
+            return 0
+        paths = tuple(page_indexes.keys())
+        count = 0
+        for start in range(0, len(paths), FILTER_BATCH_SIZE):
+            batch = paths[start : start + FILTER_BATCH_SIZE]
+            count += self._bulk_update_page_indexes_batch(page_indexes, batch)
+        if count:
+            self.log.debug(f"Indexed pages of {count} comics.")
+        return count
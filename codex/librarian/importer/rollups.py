@@ -0,0 +1,75 @@
+"""Maintain materialized group rollups and comic facets for the browser."""
+
+from codex.librarian.importer.init import InitImporter
+from codex.models import Comic, ComicFacet
+from codex.models.rollups import (
+    GROUP_PROGRESS_MODELS,
+    GROUP_ROLLUP_MODELS,
+    get_rollup_group_pks,
+)
+from codex.settings.settings import FILTER_BATCH_SIZE
+
+
+class GroupRollupImporter(InitImporter):
+    """Maintain materialized group rollups for browser cards."""
+
+    def _add_stale_rollup_groups(self, comics):
+        """Remember the groups comics are in."""
+        for model, pks in get_rollup_group_pks(comics).items():
+            self.stale_rollup_groups.setdefault(model, set()).update(pks)
+
+    def init_group_rollups(self):
+        """Remember the groups comics are leaving before they change."""
+        comic_paths = sorted(
+            self.task.files_modified
+            | frozenset(self.task.files_moved.keys())
+            | self.task.files_deleted
+        )
+        dir_paths = sorted(
+            frozenset(self.task.dirs_moved.keys()) | self.task.dirs_deleted
+        )
+        comics = Comic.objects.filter(library=self.library)
+        for paths, rel in ((comic_paths, "path__in"), (dir_paths, "folders__path__in")):
+            for start in range(0, len(paths), FILTER_BATCH_SIZE):
+                batch = paths[start : start + FILTER_BATCH_SIZE]
+                self._add_stale_rollup_groups(comics.filter(**{rel: batch}))
+
+    def update_group_rollups(
+        self, force_update_group_map, start_time, include_stale_groups=True
+    ):
+        """Recompute rollups and reading progress for groups whose comics changed.
+
+        Groups comics are leaving are only recomputed once every chunk has
+        moved its comics out of them.
+        """
+        count = 0
+        for model, rollup_model in GROUP_ROLLUP_MODELS.items():
+            pks = set(
+                model.objects.filter(comic__updated_at__gt=start_time)
+                .values_list("pk", flat=True)
+                .distinct()
+            )
+            pks |= force_update_group_map.get(model, set())
+            if include_stale_groups:
+                pks |= self.stale_rollup_groups.get(model, set())
+            # New groups without rollups yet.
+            pks |= set(
+                model.objects.filter(rollup__isnull=True).values_list("pk", flat=True)
+            )
+            count += rollup_model.update_groups(pks)
+            GROUP_PROGRESS_MODELS[model].update_groups(pks)
+        if include_stale_groups:
+            self.stale_rollup_groups = {}
+        if count:
+            self.log.debug(f"Updated {count} group rollups.")
+        return count
+
+    def update_comic_facets(self, start_time):
+        """Recreate filter facets for comics changed during this import."""
+        pks = Comic.objects.filter(
+            library=self.library, updated_at__gt=start_time
+        ).values_list("pk", flat=True)
+        count = ComicFacet.update_comics(pks)
+        if count:
+            self.log.debug(f"Updated {count} comic filter facets.")
+        return count
@@ -48,8 +48,22 @@ class AdoptOrphanFoldersTask(ImportTask):
     janitor: bool = False
 
 
+@dataclass
+class ExtractCacheCleanupTask(ImportTask):
+    """Evict old metadata extraction cache entries or purge them all."""
+
+    purge: bool = False
+
+
 @dataclass
 class UpdateGroupsTask(ImportTask):
     """Force the update of group timestamp."""
 
     start_time: datetime | None = None
+
+
+@dataclass
+class UpdateGroupRollupsTask(ImportTask):
+    """Recompute rollups and reading progress for groups by model name."""
+
+    group_pks: Mapping[str, frozenset[int]] = field(default_factory=dict)
@@ -1,10 +1,11 @@
 """Janitor task runner."""
 
 from codex.librarian.covers.status import CoverStatusTypes
-from codex.librarian.covers.tasks import CoverRemoveOrphansTask
+from codex.librarian.covers.tasks import CoverPackTask, CoverRemoveOrphansTask
 from codex.librarian.importer.status import ImportStatusTypes
 from codex.librarian.importer.tasks import (
     AdoptOrphanFoldersTask,
+    ExtractCacheCleanupTask,
 )
 from codex.librarian.janitor.cleanup import TOTAL_NUM_FK_CLASSES, CleanupMixin
 from codex.librarian.janitor.failed_imports import UpdateFailedImportsMixin
@@ -41,6 +42,7 @@ from codex.librarian.search.tasks import (
     SearchIndexUpdateTask,
 )
 from codex.models import Timestamp
+from codex.settings.settings import COVER_PACKS
 from codex.status import Status
 
 _JANITOR_STATII = (
@@ -95,7 +97,10 @@ class Janitor(
                 JanitorCleanupBookmarksTask(),
                 AdoptOrphanFoldersTask(janitor=True),
                 CoverRemoveOrphansTask(),
+                ExtractCacheCleanupTask(),
             )
+            if COVER_PACKS:
+                tasks += (CoverPackTask(),)
             for task in tasks:
                 self.librarian_queue.put(task)
             Timestamp.touch(Timestamp.TimestampChoices.JANITOR)
@@ -7,6 +7,7 @@ import sys
 
 from versio.version import Version
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.librarian.janitor.status import JanitorStatusTypes
 from codex.librarian.tasks import LibrarianShutdownTask
 from codex.models import AdminFlag
@@ -43,10 +44,8 @@ class UpdateMixin(WorkerBaseMixin):
             if force:
                 self.log.info("Forcing update of Codex.")
             else:
-                eau = AdminFlag.objects.only("on").get(
-                    key=AdminFlag.FlagChoices.AUTO_UPDATE.value
-                )
-                if not eau.on or not self._is_outdated():
+                eau = ADMIN_FLAGS.get(AdminFlag.FlagChoices.AUTO_UPDATE.value)
+                if not eau or not self._is_outdated():
                     self.log.info("Codex is up to date.")
                     return
 
@@ -7,6 +7,7 @@ from typing import NamedTuple
 
 from caseconverter import snakecase
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.librarian.bookmark.bookmarkd import BookmarkThread
 from codex.librarian.bookmark.tasks import BookmarkTask
 from codex.librarian.covers.coverd import CoverThread
@@ -28,7 +29,12 @@ from codex.librarian.search.tasks import (
     SearchIndexerTask,
     SearchIndexUpdateTask,
 )
-from codex.librarian.tasks import DelayedTasks, LibrarianShutdownTask, WakeCronTask
+from codex.librarian.tasks import (
+    AdminFlagsChangedTask,
+    DelayedTasks,
+    LibrarianShutdownTask,
+    WakeCronTask,
+)
 from codex.librarian.telemeter.tasks import TelemeterTask
 from codex.librarian.telemeter.telemeter import send_telemetry
 from codex.librarian.watchdog.event_batcherd import WatchdogEventBatcherThread
@@ -114,6 +120,8 @@ class LibrarianDaemon(Process, LoggerBaseMixin):
                 self._threads.search_indexer_thread.queue.put(task)
             case WakeCronTask():
                 self._threads.cron_thread.end_timeout()
+            case AdminFlagsChangedTask():
+                ADMIN_FLAGS.clear()
             case TelemeterTask():
                 send_telemetry(self.log)
             case JanitorTask():
@@ -4,6 +4,7 @@ from time import time
 
 from humanize import naturaldelta
 
+from codex.cache_generation import clear_cache
 from codex.librarian.search.optimize import OptimizeMixin
 from codex.librarian.search.status import SearchIndexStatusTypes
 from codex.models.comic import ComicFTS
@@ -18,6 +19,7 @@ class RemoveMixin(OptimizeMixin):
         clear_status = Status(SearchIndexStatusTypes.SEARCH_INDEX_CLEAR)
         self.status_controller.start(clear_status)
         ComicFTS.objects.all().delete()
+        clear_cache()
         self.status_controller.finish(clear_status)
         self.log.info("Old search index cleared.")
 
@@ -31,6 +33,7 @@ class RemoveMixin(OptimizeMixin):
 
         # Finish
         if count:
+            clear_cache()
             elapsed_time = time() - start_time
             elapsed = naturaldelta(elapsed_time)
             cps = int(count / elapsed_time)
@@ -9,6 +9,7 @@ from django.db.models.expressions import F
 from django.db.models.functions.datetime import Now
 from humanize import naturaldelta
 
+from codex.cache_generation import clear_cache
 from codex.librarian.search.remove import RemoveMixin
 from codex.librarian.search.status import SearchIndexStatusTypes
 from codex.models import Comic, Library
@@ -172,6 +173,7 @@ class FTSUpdateMixin(RemoveMixin):
     def _update_search_index_finish(self, count, verb, status):
         verb = verb.capitalize() + "d"
         if count:
+            clear_cache()
             self.log.info(f"{verb} {count} search entries.")
         else:
             self.log.debug(f"{verb} no search entries.")
@@ -17,3 +17,7 @@ class LibrarianShutdownTask:
 
 class WakeCronTask:
     """Signal task."""
+
+
+class AdminFlagsChangedTask:
+    """Signal task."""
@@ -8,6 +8,7 @@ from uuid import uuid4
 
 from requests import Session
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.librarian.telemeter.stats import CodexStats
 from codex.models.admin import AdminFlag, Timestamp
 from codex.settings.settings import DEBUG
@@ -61,7 +62,7 @@ def _post_stats(log, data):
 
 def _send_telemetry(log):
     """Send telemetry to server."""
-    if not AdminFlag.objects.get(key=AdminFlag.FlagChoices.SEND_TELEMETRY.value).on:
+    if not ADMIN_FLAGS.get(AdminFlag.FlagChoices.SEND_TELEMETRY.value):
         reason = "Send Telemetry flag is off."
         raise ValueError(reason)
     ts = get_telemeter_timestamp()
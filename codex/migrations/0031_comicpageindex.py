@@ -0,0 +1,38 @@
+"""Generated by Django 5.1.1 on 2024-09-20 18:53."""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Run migrations."""
+
+    dependencies = [
+        ("codex", "0030_nocase_collation_day_month_indexes_status_types"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ComicPageIndex",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "comic",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="page_index",
+                        serialize=False,
+                        to="codex.comic",
+                    ),
+                ),
+                ("size", models.PositiveBigIntegerField()),
+                ("pages", models.JSONField(default=list)),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,244 @@
+"""Generated by Django 5.1.15 on 2026-10-18 19:33."""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.aggregates import Count, Max, Min, Sum
+
+_GROUP_MODEL_NAMES = ("publisher", "imprint", "series", "volume", "folder")
+
+
+def populate_group_rollups(apps, _schema_editor):
+    """Aggregate every group's comics into its rollup."""
+    aggregates = {
+        "child_count": Count("comic"),
+        "page_count": Sum("comic__page_count", default=0),
+        "size": Sum("comic__size", default=0),
+        "created_at_min": Min("comic__created_at"),
+        "created_at_max": Max("comic__created_at"),
+        "date_min": Min("comic__date"),
+        "date_max": Max("comic__date"),
+        "updated_at_min": Min("comic__updated_at"),
+        "updated_at_max": Max("comic__updated_at"),
+        "community_rating_total": Sum("comic__community_rating"),
+        "community_rating_count": Count("comic__community_rating"),
+        "critical_rating_total": Sum("comic__critical_rating"),
+        "critical_rating_count": Count("comic__critical_rating"),
+    }
+    for model_name in _GROUP_MODEL_NAMES:
+        group_model = apps.get_model("codex", model_name)
+        rollup_model = apps.get_model("codex", model_name + "rollup")
+        rows = group_model.objects.values("pk").annotate(**aggregates)
+        rollups = (rollup_model(group_id=row.pop("pk"), **row) for row in rows)
+        rollup_model.objects.bulk_create(rollups, batch_size=900)
+
+
+class Migration(migrations.Migration):
+    """Run migrations."""
+
+    dependencies = [
+        ("codex", "0031_comicpageindex"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FolderRollup",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("created_at_min", models.DateTimeField(null=True)),
+                ("created_at_max", models.DateTimeField(null=True)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                ("updated_at_min", models.DateTimeField(null=True)),
+                ("updated_at_max", models.DateTimeField(null=True)),
+                (
+                    "community_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("community_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "critical_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("critical_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "group",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="codex.folder",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ImprintRollup",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("created_at_min", models.DateTimeField(null=True)),
+                ("created_at_max", models.DateTimeField(null=True)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                ("updated_at_min", models.DateTimeField(null=True)),
+                ("updated_at_max", models.DateTimeField(null=True)),
+                (
+                    "community_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("community_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "critical_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("critical_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "group",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="codex.imprint",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="PublisherRollup",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("created_at_min", models.DateTimeField(null=True)),
+                ("created_at_max", models.DateTimeField(null=True)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                ("updated_at_min", models.DateTimeField(null=True)),
+                ("updated_at_max", models.DateTimeField(null=True)),
+                (
+                    "community_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("community_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "critical_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("critical_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "group",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="codex.publisher",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="SeriesRollup",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("created_at_min", models.DateTimeField(null=True)),
+                ("created_at_max", models.DateTimeField(null=True)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                ("updated_at_min", models.DateTimeField(null=True)),
+                ("updated_at_max", models.DateTimeField(null=True)),
+                (
+                    "community_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("community_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "critical_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("critical_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "group",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="codex.series",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="VolumeRollup",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("child_count", models.PositiveIntegerField(default=0)),
+                ("page_count", models.PositiveBigIntegerField(default=0)),
+                ("size", models.PositiveBigIntegerField(default=0)),
+                ("created_at_min", models.DateTimeField(null=True)),
+                ("created_at_max", models.DateTimeField(null=True)),
+                ("date_min", models.DateField(null=True)),
+                ("date_max", models.DateField(null=True)),
+                ("updated_at_min", models.DateTimeField(null=True)),
+                ("updated_at_max", models.DateTimeField(null=True)),
+                (
+                    "community_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("community_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "critical_rating_total",
+                    models.DecimalField(decimal_places=2, max_digits=14, null=True),
+                ),
+                ("critical_rating_count", models.PositiveIntegerField(default=0)),
+                (
+                    "group",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="codex.volume",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+            },
+        ),
+        migrations.RunPython(populate_group_rollups),
+    ]
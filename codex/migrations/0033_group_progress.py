@@ -0,0 +1,301 @@
+"""Generated by Django 5.1.15 on 2026-10-18 19:38."""
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, Q, When
+from django.db.models.aggregates import Count, Max, Sum
+from django.db.models.functions import Coalesce
+
+import codex.models.bookmark
+
+_GROUP_MODEL_NAMES = ("publisher", "imprint", "series", "volume", "folder")
+
+
+def populate_group_progress(apps, _schema_editor):
+    """Aggregate every group's bookmarks into reading progress."""
+    aggregates = {
+        "page": Sum(
+            Case(
+                When(comic__bookmark__finished=True, then="comic__page_count"),
+                default=Coalesce("comic__bookmark__page", 0),
+            ),
+            default=0,
+        ),
+        "finished_count": Count(
+            "comic__bookmark", filter=Q(comic__bookmark__finished=True)
+        ),
+        "bookmark_updated_at": Max("comic__bookmark__updated_at"),
+    }
+    for model_name in _GROUP_MODEL_NAMES:
+        group_model = apps.get_model("codex", model_name)
+        progress_model = apps.get_model("codex", model_name + "progress")
+        rows = (
+            group_model.objects.filter(comic__bookmark__isnull=False)
+            .values("pk", "comic__bookmark__user", "comic__bookmark__session")
+            .annotate(**aggregates)
+        )
+        progresses = (
+            progress_model(
+                group_id=row.pop("pk"),
+                user_id=row.pop("comic__bookmark__user"),
+                session_id=row.pop("comic__bookmark__session"),
+                **row,
+            )
+            for row in rows
+        )
+        progress_model.objects.bulk_create(progresses, batch_size=900)
+
+
+class Migration(migrations.Migration):
+    """Run migrations."""
+
+    dependencies = [
+        ("codex", "0032_group_rollups"),
+        ("sessions", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FolderProgress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("page", models.PositiveIntegerField(default=0)),
+                ("finished_count", models.PositiveIntegerField(default=0)),
+                ("bookmark_updated_at", models.DateTimeField(null=True)),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_progress",
+                        to="codex.folder",
+                    ),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=codex.models.bookmark.cascade_if_user_null,
+                        to="sessions.session",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+                "unique_together": {("user", "session", "group")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ImprintProgress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("page", models.PositiveIntegerField(default=0)),
+                ("finished_count", models.PositiveIntegerField(default=0)),
+                ("bookmark_updated_at", models.DateTimeField(null=True)),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_progress",
+                        to="codex.imprint",
+                    ),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=codex.models.bookmark.cascade_if_user_null,
+                        to="sessions.session",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+                "unique_together": {("user", "session", "group")},
+            },
+        ),
+        migrations.CreateModel(
+            name="PublisherProgress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("page", models.PositiveIntegerField(default=0)),
+                ("finished_count", models.PositiveIntegerField(default=0)),
+                ("bookmark_updated_at", models.DateTimeField(null=True)),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_progress",
+                        to="codex.publisher",
+                    ),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=codex.models.bookmark.cascade_if_user_null,
+                        to="sessions.session",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+                "unique_together": {("user", "session", "group")},
+            },
+        ),
+        migrations.CreateModel(
+            name="SeriesProgress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("page", models.PositiveIntegerField(default=0)),
+                ("finished_count", models.PositiveIntegerField(default=0)),
+                ("bookmark_updated_at", models.DateTimeField(null=True)),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_progress",
+                        to="codex.series",
+                    ),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=codex.models.bookmark.cascade_if_user_null,
+                        to="sessions.session",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+                "unique_together": {("user", "session", "group")},
+            },
+        ),
+        migrations.CreateModel(
+            name="VolumeProgress",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("page", models.PositiveIntegerField(default=0)),
+                ("finished_count", models.PositiveIntegerField(default=0)),
+                ("bookmark_updated_at", models.DateTimeField(null=True)),
+                (
+                    "group",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_progress",
+                        to="codex.volume",
+                    ),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=codex.models.bookmark.cascade_if_user_null,
+                        to="sessions.session",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+                "unique_together": {("user", "session", "group")},
+            },
+        ),
+        migrations.RunPython(populate_group_progress),
+    ]
@@ -0,0 +1,78 @@
+"""Generated by Django 5.1.15 on 2026-10-18 20:38."""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+_FACET_RELS = {
+    "characters": "characters",
+    "contributors": "contributors__person",
+    "genres": "genres",
+    "identifier_type": "identifiers__identifier_type",
+    "locations": "locations",
+    "series_groups": "series_groups",
+    "stories": "stories",
+    "story_arcs": "story_arc_numbers__story_arc",
+    "tags": "tags",
+    "teams": "teams",
+}
+
+
+def populate_comic_facets(apps, _schema_editor):
+    """Post every comic's many to many filter values."""
+    comic_model = apps.get_model("codex", "comic")
+    facet_model = apps.get_model("codex", "comicfacet")
+    for field, rel in _FACET_RELS.items():
+        rows = (
+            comic_model.objects.filter(**{f"{rel}__isnull": False})
+            .values_list("pk", rel)
+            .distinct()
+        )
+        facets = (
+            facet_model(comic_id=comic_pk, field=field, value=value)
+            for comic_pk, value in rows
+        )
+        facet_model.objects.bulk_create(facets, batch_size=900)
+
+
+class Migration(migrations.Migration):
+    """Run migrations."""
+
+    dependencies = [
+        ("codex", "0033_group_progress"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ComicFacet",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("field", models.CharField(max_length=32)),
+                ("value", models.PositiveIntegerField()),
+                (
+                    "comic",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facets",
+                        to="codex.comic",
+                    ),
+                ),
+            ],
+            options={
+                "get_latest_by": "updated_at",
+                "abstract": False,
+                "unique_together": {("comic", "field", "value")},
+            },
+        ),
+        migrations.RunPython(populate_comic_facets),
+    ]
@@ -3,7 +3,9 @@
 from codex.models.admin import *
 from codex.models.bookmark import *
 from codex.models.comic import *
+from codex.models.facets import *
 from codex.models.groups import *
 from codex.models.library import *
 from codex.models.named import *
 from codex.models.paths import *
+from codex.models.rollups import *
@@ -16,8 +16,10 @@ from django.db.models import (
     DateTimeField,
     DecimalField,
     ForeignKey,
+    JSONField,
     ManyToManyField,
     OneToOneField,
+    PositiveBigIntegerField,
     PositiveIntegerField,
     PositiveSmallIntegerField,
     TextField,
@@ -339,3 +341,25 @@ class ComicFTS(BaseModel):
 
     class Meta(BaseModel.Meta):
         managed = False
+
+
+class ComicPageIndex(BaseModel):
+    """Where each page lives in the comic archive.
+
+    Each page is a list of member name, compressed size, uncompressed size,
+    local header offset, compression method, width and height.
+    """
+
+    NAME = 0
+    COMPRESS_SIZE = 1
+    FILE_SIZE = 2
+    HEADER_OFFSET = 3
+    COMPRESS_TYPE = 4
+    WIDTH = 5
+    HEIGHT = 6
+
+    comic = OneToOneField(
+        primary_key=True, to=Comic, on_delete=CASCADE, related_name="page_index"
+    )
+    size = PositiveBigIntegerField()
+    pages = JSONField(default=list)
@@ -0,0 +1,69 @@
+"""Postings of the many to many filter values for each comic."""
+
+from types import MappingProxyType
+
+from django.db import transaction
+from django.db.models import CASCADE, CharField, ForeignKey, PositiveIntegerField
+
+from codex.models.base import MAX_FIELD_LEN, BaseModel
+from codex.models.comic import Comic
+from codex.settings.settings import FILTER_BATCH_SIZE
+
+__all__ = ("FACET_RELS", "ComicFacet")
+
+# Filter field to the comic relation its values come from.
+FACET_RELS = MappingProxyType(
+    {
+        "characters": "characters",
+        "contributors": "contributors__person",
+        "genres": "genres",
+        "identifier_type": "identifiers__identifier_type",
+        "locations": "locations",
+        "series_groups": "series_groups",
+        "stories": "stories",
+        "story_arcs": "story_arc_numbers__story_arc",
+        "tags": "tags",
+        "teams": "teams",
+    }
+)
+
+
+class ComicFacet(BaseModel):
+    """A comic's value for a many to many filter field, maintained by the importer.
+
+    One narrow table lets filter choices be counted for a filtered set of
+    comics in a single grouped query instead of one join per field.
+    """
+
+    comic = ForeignKey(Comic, db_index=False, on_delete=CASCADE, related_name="facets")
+    field = CharField(max_length=MAX_FIELD_LEN)
+    value = PositiveIntegerField()
+
+    class Meta(BaseModel.Meta):
+        """Constraints."""
+
+        unique_together = ("comic", "field", "value")
+
+    @classmethod
+    def update_comics(cls, pks) -> int:
+        """Recreate the facets for comics from their relations."""
+        pks = tuple(pks)
+        count = 0
+        for start in range(0, len(pks), FILTER_BATCH_SIZE):
+            batch = pks[start : start + FILTER_BATCH_SIZE]
+            facets = []
+            for field, rel in FACET_RELS.items():
+                rows = (
+                    Comic.objects.filter(pk__in=batch, **{f"{rel}__isnull": False})
+                    .values_list("pk", rel)
+                    .distinct()
+                )
+                facets += [
+                    cls(comic_id=comic_pk, field=field, value=value)
+                    for comic_pk, value in rows
+                ]
+            with transaction.atomic():
+                cls.objects.filter(comic_id__in=batch).delete()
+                cls.objects.bulk_create(facets)
+            count += len(facets)
+        return count
@@ -0,0 +1,309 @@
+"""Materialized aggregates of the comics in each browser group."""
+
+from types import MappingProxyType
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.db import transaction
+from django.db.models import CASCADE, Case, ForeignKey, OneToOneField, Q, When
+from django.db.models.aggregates import Count, Max, Min, Sum
+from django.db.models.fields import (
+    DateField,
+    DateTimeField,
+    DecimalField,
+    PositiveBigIntegerField,
+    PositiveIntegerField,
+)
+from django.db.models.functions import Coalesce
+
+from codex.models.base import BaseModel
+from codex.models.bookmark import cascade_if_user_null
+from codex.models.comic import Comic
+from codex.models.groups import Folder, Imprint, Publisher, Series, Volume
+from codex.settings.settings import FILTER_BATCH_SIZE
+
+__all__ = (
+    "GROUP_PROGRESS_MODELS",
+    "GROUP_ROLLUP_MODELS",
+    "FolderProgress",
+    "FolderRollup",
+    "GroupProgress",
+    "GroupRollup",
+    "ImprintProgress",
+    "ImprintRollup",
+    "PublisherProgress",
+    "PublisherRollup",
+    "SeriesProgress",
+    "SeriesRollup",
+    "VolumeProgress",
+    "VolumeRollup",
+    "get_rollup_group_pks",
+)
+
+_ROLLUP_AGGREGATES = MappingProxyType(
+    {
+        "child_count": Count("comic"),
+        "page_count": Sum("comic__page_count", default=0),
+        "size": Sum("comic__size", default=0),
+        "created_at_min": Min("comic__created_at"),
+        "created_at_max": Max("comic__created_at"),
+        "date_min": Min("comic__date"),
+        "date_max": Max("comic__date"),
+        "updated_at_min": Min("comic__updated_at"),
+        "updated_at_max": Max("comic__updated_at"),
+        "community_rating_total": Sum("comic__community_rating"),
+        "community_rating_count": Count("comic__community_rating"),
+        "critical_rating_total": Sum("comic__critical_rating"),
+        "critical_rating_count": Count("comic__critical_rating"),
+    }
+)
+_ROLLUP_UPDATE_FIELDS = (*_ROLLUP_AGGREGATES.keys(), "updated_at")
+_PROGRESS_AGGREGATES = MappingProxyType(
+    {
+        "page": Sum(
+            Case(
+                When(comic__bookmark__finished=True, then="comic__page_count"),
+                default=Coalesce("comic__bookmark__page", 0),
+            ),
+            default=0,
+        ),
+        "finished_count": Count(
+            "comic__bookmark", filter=Q(comic__bookmark__finished=True)
+        ),
+        "bookmark_updated_at": Max("comic__bookmark__updated_at"),
+    }
+)
+
+
+class GroupRollup(BaseModel):
+    """Aggregates of a group's comics, maintained by the importer."""
+
+    child_count = PositiveIntegerField(default=0)
+    page_count = PositiveBigIntegerField(default=0)
+    size = PositiveBigIntegerField(default=0)
+    created_at_min = DateTimeField(null=True)
+    created_at_max = DateTimeField(null=True)
+    date_min = DateField(null=True)
+    date_max = DateField(null=True)
+    updated_at_min = DateTimeField(null=True)
+    updated_at_max = DateTimeField(null=True)
+    community_rating_total = DecimalField(decimal_places=2, max_digits=14, null=True)
+    community_rating_count = PositiveIntegerField(default=0)
+    critical_rating_total = DecimalField(decimal_places=2, max_digits=14, null=True)
+    critical_rating_count = PositiveIntegerField(default=0)
+
+    class Meta(BaseModel.Meta):
+        """Without this a real table is created and joined to."""
+
+        abstract = True
+
+    @classmethod
+    def update_groups(cls, pks) -> int:
+        """Recompute the rollups for groups from their comics."""
+        group_model = cls._meta.get_field("group").related_model
+        pks = tuple(pks)
+        count = 0
+        for start in range(0, len(pks), FILTER_BATCH_SIZE):
+            batch = pks[start : start + FILTER_BATCH_SIZE]
+            rows = (
+                group_model.objects.filter(pk__in=batch)  # type: ignore
+                .values("pk")
+                .annotate(**_ROLLUP_AGGREGATES)
+            )
+            rollups = [cls(group_id=row.pop("pk"), **row) for row in rows]
+            cls.objects.bulk_create(
+                rollups,
+                update_conflicts=True,
+                unique_fields=("group",),
+                update_fields=_ROLLUP_UPDATE_FIELDS,
+            )
+            count += len(rollups)
+        return count
+
+
+class PublisherRollup(GroupRollup):
+    """Publisher aggregates."""
+
+    group = OneToOneField(
+        Publisher, primary_key=True, on_delete=CASCADE, related_name="rollup"
+    )
+
+
+class ImprintRollup(GroupRollup):
+    """Imprint aggregates."""
+
+    group = OneToOneField(
+        Imprint, primary_key=True, on_delete=CASCADE, related_name="rollup"
+    )
+
+
+class SeriesRollup(GroupRollup):
+    """Series aggregates."""
+
+    group = OneToOneField(
+        Series, primary_key=True, on_delete=CASCADE, related_name="rollup"
+    )
+
+
+class VolumeRollup(GroupRollup):
+    """Volume aggregates."""
+
+    group = OneToOneField(
+        Volume, primary_key=True, on_delete=CASCADE, related_name="rollup"
+    )
+
+
+class FolderRollup(GroupRollup):
+    """Folder aggregates, including comics in subfolders."""
+
+    group = OneToOneField(
+        Folder, primary_key=True, on_delete=CASCADE, related_name="rollup"
+    )
+
+
+GROUP_ROLLUP_MODELS: MappingProxyType[type, type[GroupRollup]] = MappingProxyType(
+    {
+        Publisher: PublisherRollup,
+        Imprint: ImprintRollup,
+        Series: SeriesRollup,
+        Volume: VolumeRollup,
+        Folder: FolderRollup,
+    }
+)
+
+
+class GroupProgress(BaseModel):
+    """A user's reading progress in a group, maintained from their bookmarks."""
+
+    user = ForeignKey(
+        settings.AUTH_USER_MODEL, db_index=True, on_delete=CASCADE, null=True
+    )
+    session = ForeignKey(
+        Session, db_index=True, on_delete=cascade_if_user_null, null=True
+    )
+    page = PositiveIntegerField(default=0)
+    finished_count = PositiveIntegerField(default=0)
+    bookmark_updated_at = DateTimeField(null=True)
+
+    class Meta(BaseModel.Meta):
+        """Without this a real table is created and joined to."""
+
+        abstract = True
+
+    @classmethod
+    def update_groups(cls, pks, auth_filter=None) -> int:
+        """Recompute reading progress for groups from bookmarks.
+
+        Limit to one user or session with an auth_filter like bookmark updates use.
+        """
+        group_model = cls._meta.get_field("group").related_model
+        auth_filter = auth_filter or {}
+        if auth_filter:
+            bookmark_filter = {
+                f"comic__bookmark__{key}": value for key, value in auth_filter.items()
+            }
+        else:
+            bookmark_filter = {"comic__bookmark__isnull": False}
+        pks = tuple(pks)
+        count = 0
+        for start in range(0, len(pks), FILTER_BATCH_SIZE):
+            batch = pks[start : start + FILTER_BATCH_SIZE]
+            rows = (
+                group_model.objects.filter(pk__in=batch, **bookmark_filter)  # type: ignore
+                .values("pk", "comic__bookmark__user", "comic__bookmark__session")
+                .annotate(**_PROGRESS_AGGREGATES)
+            )
+            progresses = [
+                cls(
+                    group_id=row.pop("pk"),
+                    user_id=row.pop("comic__bookmark__user"),
+                    session_id=row.pop("comic__bookmark__session"),
+                    **row,
+                )
+                for row in rows
+            ]
+            with transaction.atomic():
+                cls.objects.filter(group_id__in=batch, **auth_filter).delete()
+                cls.objects.bulk_create(progresses)
+            count += len(progresses)
+        return count
+
+
+class PublisherProgress(GroupProgress):
+    """Publisher reading progress."""
+
+    group = ForeignKey(Publisher, on_delete=CASCADE, related_name="user_progress")
+
+    class Meta(GroupProgress.Meta):
+        """Constraints."""
+
+        unique_together = ("user", "session", "group")
+
+
+class ImprintProgress(GroupProgress):
+    """Imprint reading progress."""
+
+    group = ForeignKey(Imprint, on_delete=CASCADE, related_name="user_progress")
+
+    class Meta(GroupProgress.Meta):
+        """Constraints."""
+
+        unique_together = ("user", "session", "group")
+
+
+class SeriesProgress(GroupProgress):
+    """Series reading progress."""
+
+    group = ForeignKey(Series, on_delete=CASCADE, related_name="user_progress")
+
+    class Meta(GroupProgress.Meta):
+        """Constraints."""
+
+        unique_together = ("user", "session", "group")
+
+
+class VolumeProgress(GroupProgress):
+    """Volume reading progress."""
+
+    group = ForeignKey(Volume, on_delete=CASCADE, related_name="user_progress")
+
+    class Meta(GroupProgress.Meta):
+        """Constraints."""
+
+        unique_together = ("user", "session", "group")
+
+
+class FolderProgress(GroupProgress):
+    """Folder reading progress, including comics in subfolders."""
+
+    group = ForeignKey(Folder, on_delete=CASCADE, related_name="user_progress")
+
+    class Meta(GroupProgress.Meta):
+        """Constraints."""
+
+        unique_together = ("user", "session", "group")
+
+
+GROUP_PROGRESS_MODELS: MappingProxyType[type, type[GroupProgress]] = MappingProxyType(
+    {
+        Publisher: PublisherProgress,
+        Imprint: ImprintProgress,
+        Series: SeriesProgress,
+        Volume: VolumeProgress,
+        Folder: FolderProgress,
+    }
+)
+
+
+def get_rollup_group_pks(comics) -> dict[type, set[int]]:
+    """Get the pks of the groups the comics are in for each rollup model."""
+    group_pks = {}
+    for model in GROUP_ROLLUP_MODELS:
+        if model is Folder:
+            qs = Comic.folders.through.objects.filter(comic__in=comics)
+            field = "folder_id"
+        else:
+            qs = comics
+            field = f"{model._meta.model_name}_id"
+        group_pks[model] = set(qs.values_list(field, flat=True).distinct())
+    return group_pks
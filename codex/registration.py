@@ -2,15 +2,12 @@
 
 from rest_registration.settings import registration_settings
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.models import AdminFlag
 
 
 def patch_registration_setting():
     """Patch rest_registration setting."""
     # Technically this is a no-no, but rest-registration makes it easy.
-    enr = (
-        AdminFlag.objects.only("on")
-        .get(key=AdminFlag.FlagChoices.REGISTRATION.value)
-        .on
-    )
+    enr = ADMIN_FLAGS.get(AdminFlag.FlagChoices.REGISTRATION.value)
     registration_settings.user_settings["REGISTER_FLOW_ENABLED"] = enr
@@ -13,6 +13,8 @@ from codex.serializers.browser.filters import BrowserSettingsFilterSerializer
 from codex.serializers.fields import BreadcrumbsField, TimestampField, TopGroupField
 from codex.serializers.route import SimpleRouteSerializer
 
+MAX_BATCH_COVERS = 200
+
 
 class BrowserSettingsShowGroupFlagsSerializer(Serializer):
     """Show Group Flags."""
@@ -48,11 +50,18 @@ class BrowserCoverInputSerializer(BrowserCoverInputSerializerBase):
     parent = SimpleRouteSerializer(required=False)
 
 
+class BrowserCoversInputSerializer(BrowserCoverInputSerializer):
+    """Browser Settings for the batch covers response."""
+
+    groups = SimpleRouteSerializer(many=True, max_length=MAX_BATCH_COVERS)
+
+
 class BrowserSettingsSerializerBase(BrowserCoverInputSerializerBase):
     """Base Serializer for Browser & OPDS Settings."""
 
     # search_results_limit = IntegerField(required=False)
     top_group = TopGroupField(required=False)
+    cursor = CharField(required=False)
 
 
 class OPDSSettingsSerializer(BrowserSettingsSerializerBase):
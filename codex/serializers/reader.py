@@ -6,6 +6,7 @@ from rest_framework.serializers import (
     ChoiceField,
     DecimalField,
     IntegerField,
+    ListField,
     Serializer,
 )
 
@@ -85,6 +86,12 @@ class ReaderCurrentComicSerializer(ReaderComicSerializer):
     file_type = CharField(read_only=True, required=False)
     filename = CharField(read_only=True, required=False)
     name = CharField(read_only=True, required=False)
+    # Width and height of each page, null if unknown.
+    page_dims = ListField(
+        child=ListField(child=IntegerField(), allow_null=True, max_length=2),
+        read_only=True,
+        required=False,
+    )
 
 
 class ReaderBooksSerializer(Serializer):
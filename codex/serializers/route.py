@@ -14,8 +14,8 @@ class SimpleRouteSerializer(Serializer):
 
     def to_representation(self, instance):
         """Allow submission of sequences instead of strings for pks."""
-        if isinstance(instance, Route):
-            instance = instance.dict()
+        # Copy so session data and read only defaults aren't modified.
+        instance = instance.dict() if isinstance(instance, Route) else dict(instance)
         pks = instance["pks"]
         if not pks:
             instance["pks"] = "0"
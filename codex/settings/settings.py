@@ -70,6 +70,32 @@ FIX_FOREIGN_KEYS = not_falsy_env("CODEX_FIX_FOREIGN_KEYS")
 INTEGRITY_CHECK = environ.get("CODEX_INTEGRITY_CHECK", False)
 FTS_INTEGRITY_CHECK = not_falsy_env("CODEX_FTS_INTEGRITY_CHECK")
 FTS_REBUILD = not_falsy_env("CODEX_FTS_REBUILD")
+# 0 means use one worker per cpu.
+EXTRACT_WORKERS = int(environ.get("CODEX_EXTRACT_WORKERS", "0"))
+COVER_WORKERS = int(environ.get("CODEX_COVER_WORKERS", "0"))
+COVER_PACKS = not_falsy_env("CODEX_COVER_PACKS")
+COVER_THUMBNAIL_PROFILES = frozenset({"fast", "balanced", "quality"})
+COVER_THUMBNAIL_PROFILE = environ.get("CODEX_COVER_THUMBNAIL_PROFILE", "balanced")
+if COVER_THUMBNAIL_PROFILE not in COVER_THUMBNAIL_PROFILES:
+    getLogger(__name__).warning(
+        f"Unknown CODEX_COVER_THUMBNAIL_PROFILE {COVER_THUMBNAIL_PROFILE!r}, "
+        "using 'balanced'."
+    )
+    COVER_THUMBNAIL_PROFILE = "balanced"
+# At least one comic per chunk.
+IMPORT_CHUNK_SIZE = max(1, int(environ.get("CODEX_IMPORT_CHUNK_SIZE", "2000")))
+# 0 disables the metadata extraction cache.
+EXTRACT_CACHE_MAX_ENTRIES = int(
+    environ.get("CODEX_EXTRACT_CACHE_MAX_ENTRIES", "100000")
+)
+# 0 disables the open archive pool.
+READER_ARCHIVE_POOL_SIZE = int(environ.get("CODEX_READER_ARCHIVE_POOL_SIZE", "8"))
+# 0 disables reading pages ahead.
+READER_READ_AHEAD = int(environ.get("CODEX_READER_READ_AHEAD", "3"))
+READER_PAGE_CACHE_MB = int(environ.get("CODEX_READER_PAGE_CACHE_MB", "64"))
+READER_RENDITION_CACHE_MB = int(environ.get("CODEX_READER_RENDITION_CACHE_MB", "1024"))
+READER_PDF_DPI = int(environ.get("CODEX_READER_PDF_DPI", "150"))
+READER_PDF_CACHE_MB = int(environ.get("CODEX_READER_PDF_CACHE_MB", "1024"))
 
 # Base paths
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
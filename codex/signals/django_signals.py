@@ -2,9 +2,9 @@
 
 from time import time
 
-from django.core.cache import cache
 from django.db.models.signals import m2m_changed
 
+from codex.cache_generation import clear_cache
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import LIBRARIAN_STATUS_TASK
 from codex.librarian.tasks import DelayedTasks
@@ -30,7 +30,7 @@ def _user_group_change(**kwargs):
         or action not in GROUP_CHANGE_ACTIONS
     ):
         return
-    cache.clear()
+    clear_cache()
     tasks = (LIBRARIAN_STATUS_TASK,)
     task = DelayedTasks(time() + 2, tasks)
     LIBRARIAN_QUEUE.put(task)
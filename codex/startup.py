@@ -2,10 +2,11 @@
 
 from pathlib import Path
 
-from django.core.cache import cache
 from django.db.models import F, Q
 from django.db.models.functions import Now
 
+from codex.admin_flags import ADMIN_FLAGS
+from codex.cache_generation import clear_cache
 from codex.choices import ADMIN_FLAG_CHOICES, ADMIN_STATUS_TITLES
 from codex.db import ensure_db_schema
 from codex.logger.logging import get_logger
@@ -58,6 +59,7 @@ def init_admin_flags():
         if created:
             title = ADMIN_FLAG_CHOICES[flag.key]
             LOG.info(f"Created AdminFlag: {title} = {flag.on}")
+    ADMIN_FLAGS.clear()
 
 
 def init_timestamps():
@@ -180,7 +182,7 @@ def codex_init():
         return False
     ensure_db_rows()
     patch_registration_setting()
-    cache.clear()
+    clear_cache()
     LOG.info(f"root_path: {HYPERCORN_CONFIG.root_path}")
     if HYPERCORN_CONFIG.use_reloader:
         LOG.info(f"Will reload hypercorn if {HYPERCORN_CONFIG_TOML} changes")
@@ -1,9 +1,9 @@
 """codex:api:v3:browser URL Configuration."""
 
 from django.urls import path
-from django.views.decorators.cache import cache_control, cache_page, never_cache
+from django.views.decorators.cache import cache_control, never_cache
 
-from codex.urls.const import BROWSER_TIMEOUT, COVER_MAX_AGE, PAGE_MAX_AGE
+from codex.urls.const import COVER_MAX_AGE
 from codex.views.bookmark import BookmarkView
 from codex.views.browser.browser import BrowserView
 from codex.views.browser.choices import BrowserChoicesAvailableView, BrowserChoicesView
@@ -11,8 +11,6 @@ from codex.views.browser.cover import CoverView
 from codex.views.browser.metadata.metadata import MetadataView
 from codex.views.browser.settings import BrowserSettingsView
 
-METADATA_TIMEOUT = PAGE_MAX_AGE
-
 app_name = "browser"
 urlpatterns = [
     #
@@ -20,22 +18,22 @@ urlpatterns = [
     # Browser
     path(
         "<int_list:pks>/<int:page>",
-        cache_page(BROWSER_TIMEOUT)(BrowserView.as_view()),
+        BrowserView.as_view(),
         name="page",
     ),
     path(
         "<int_list:pks>/choices/<str:field_name>",
-        cache_page(BROWSER_TIMEOUT)(BrowserChoicesView.as_view()),
+        BrowserChoicesView.as_view(),
         name="choices_field",
     ),
     path(
         "<int_list:pks>/choices_available",
-        cache_page(BROWSER_TIMEOUT)(BrowserChoicesAvailableView.as_view()),
+        BrowserChoicesAvailableView.as_view(),
         name="choices_available",
     ),
     path(
         "<int_list:pks>/metadata",
-        cache_page(METADATA_TIMEOUT)(MetadataView.as_view()),
+        MetadataView.as_view(),
         name="metadata",
     ),
     #
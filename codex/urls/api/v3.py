@@ -1,8 +1,11 @@
 """codex:api:v3 URL Configuration."""
 
 from django.urls import include, path
+from django.views.decorators.cache import cache_control
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from codex.urls.const import COVER_MAX_AGE
+from codex.views.browser.covers import CoversView
 from codex.views.browser.mtime import MtimeView
 from codex.views.opds.urls import OPDSURLsView
 from codex.views.version import VersionView
@@ -13,6 +16,11 @@ urlpatterns = [
     # reader must come first to occlude browser group
     path("c/", include("codex.urls.api.reader")),
     path("<group:group>/", include("codex.urls.api.browser")),
+    path(
+        "covers",
+        cache_control(max_age=COVER_MAX_AGE, private=True)(CoversView.as_view()),
+        name="covers",
+    ),
     path("mtime", MtimeView.as_view(), name="mtimes"),
     path("version", VersionView.as_view(), name="version"),
     path("admin/", include("codex.urls.api.admin")),
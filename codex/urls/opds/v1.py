@@ -3,7 +3,7 @@
 from django.urls import path
 from django.views.decorators.cache import cache_page
 
-from codex.urls.const import BROWSER_TIMEOUT, COMMON_TIMEOUT
+from codex.urls.const import COMMON_TIMEOUT
 from codex.views.opds.util import full_redirect_view
 from codex.views.opds.v1.feed import OPDS1FeedView
 from codex.views.opds.v1.opensearch_v1 import OpenSearch1View
@@ -16,7 +16,7 @@ urlpatterns = [
     # Browser
     path(
         "<group:group>/<int_list:pks>/<int:page>",
-        cache_page(BROWSER_TIMEOUT)(OPDS1FeedView.as_view()),
+        OPDS1FeedView.as_view(),
         name="feed",
     ),
     path(
@@ -1,8 +1,9 @@
 """Admin Flag View."""
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
-from codex.librarian.tasks import WakeCronTask
+from codex.librarian.tasks import AdminFlagsChangedTask, WakeCronTask
 from codex.logger.logging import get_logger
 from codex.models import AdminFlag
 from codex.registration import patch_registration_setting
@@ -26,6 +27,8 @@ class AdminFlagViewSet(AdminModelViewSet):
 
     def _on_change(self):
         """Signal UI that its out of date."""
+        ADMIN_FLAGS.clear()
+        LIBRARIAN_QUEUE.put(AdminFlagsChangedTask())
         key = self.kwargs.get("key")
         if key == AdminFlag.FlagChoices.REGISTRATION.value:
             patch_registration_setting()
@@ -1,8 +1,8 @@
 """Group View."""
 
 from django.contrib.auth.models import Group
-from django.core.cache import cache
 
+from codex.cache_generation import clear_cache
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
 from codex.logger.logging import get_logger
@@ -27,7 +27,7 @@ class AdminGroupViewSet(AdminModelViewSet):
         if not validated_data or frozenset(validated_data.keys()).intersection(
             self._CHANGE_FIELDS
         ):
-            cache.clear()
+            clear_cache()
             LIBRARIAN_QUEUE.put(LIBRARY_CHANGED_TASK)
 
     def get_serializer(self, *args, **kwargs):
@@ -3,12 +3,13 @@
 from pathlib import Path
 from time import time
 
-from django.core.cache import cache
 from django.db.utils import NotSupportedError
 from drf_spectacular.utils import extend_schema
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+from codex.cache_generation import clear_cache
+from codex.librarian.importer.tasks import UpdateGroupRollupsTask
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
 from codex.librarian.tasks import DelayedTasks
@@ -17,7 +18,13 @@ from codex.librarian.watchdog.tasks import (
     WatchdogSyncTask,
 )
 from codex.logger.logging import get_logger
-from codex.models import FailedImport, Folder, Library
+from codex.models import (
+    Comic,
+    FailedImport,
+    Folder,
+    Library,
+    get_rollup_group_pks,
+)
 from codex.serializers.admin.libraries import (
     AdminFolderListSerializer,
     AdminFolderSerializer,
@@ -49,7 +56,7 @@ class AdminLibraryViewSet(AdminModelViewSet):
 
     @staticmethod
     def _on_change():
-        cache.clear()
+        clear_cache()
         task = LIBRARY_CHANGED_TASK
         LIBRARIAN_QUEUE.put(task)
 
@@ -93,7 +100,15 @@ class AdminLibraryViewSet(AdminModelViewSet):
         """Perform destroy and run hooks."""
         if instance.covers_only:
             raise NotSupportedError
+        group_pks = get_rollup_group_pks(Comic.objects.filter(library=instance))
         super().perform_destroy(instance)
+        # Groups shared with other libraries lost comics.
+        task = UpdateGroupRollupsTask(
+            group_pks={
+                model.__name__: frozenset(pks) for model, pks in group_pks.items()
+            }
+        )
+        LIBRARIAN_QUEUE.put(task)
         self._sync_watchdog()
         self._on_change()
 
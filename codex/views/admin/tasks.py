@@ -8,11 +8,13 @@ from rest_framework.response import Response
 
 from codex.librarian.covers.tasks import (
     CoverCreateAllTask,
+    CoverPackTask,
     CoverRemoveAllTask,
     CoverRemoveOrphansTask,
 )
 from codex.librarian.importer.tasks import (
     AdoptOrphanFoldersTask,
+    ExtractCacheCleanupTask,
     UpdateGroupsTask,
 )
 from codex.librarian.janitor.tasks import (
@@ -64,6 +66,7 @@ _TASK_MAP = MappingProxyType(
     {
         "purge_comic_covers": CoverRemoveAllTask(),
         "create_all_comic_covers": CoverCreateAllTask(),
+        "pack_covers": CoverPackTask(),
         "search_index_update": SearchIndexUpdateTask(False),
         "search_index_rebuild": SearchIndexUpdateTask(True),
         "search_index_remove_stale": SearchIndexRemoveStaleTask(),
@@ -95,6 +98,7 @@ _TASK_MAP = MappingProxyType(
         "janitor_nightly": JanitorNightlyTask(),
         "force_update_groups": UpdateGroupsTask(start_time=EPOCH_START),
         "adopt_folders": AdoptOrphanFoldersTask(),
+        "purge_extract_cache": ExtractCacheCleanupTask(purge=True),
     }
 )
 
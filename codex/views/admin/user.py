@@ -2,11 +2,11 @@
 
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.status import HTTP_202_ACCEPTED, HTTP_400_BAD_REQUEST
 
+from codex.cache_generation import clear_cache
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.librarian.notifier.tasks import LIBRARY_CHANGED_TASK
 from codex.logger.logging import get_logger
@@ -29,7 +29,7 @@ class AdminUserViewSet(AdminModelViewSet):
 
     @staticmethod
     def _on_change():
-        cache.clear()
+        clear_cache()
         LIBRARIAN_QUEUE.put(LIBRARY_CHANGED_TASK)
 
     def get_serializer(self, *args, **kwargs):
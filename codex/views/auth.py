@@ -8,6 +8,7 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.logger.logging import get_logger
 from codex.models import AdminFlag, Comic, Folder, StoryArc
 
@@ -24,10 +25,7 @@ class IsAuthenticatedOrEnabledNonUsers(IsAuthenticated):
 
     def has_permission(self, request, view):
         """Return True if ENABLE_NON_USERS is true or user authenticated."""
-        enu_flag = AdminFlag.objects.only("on").get(
-            key=AdminFlag.FlagChoices.NON_USERS.value
-        )
-        if enu_flag.on:
+        if ADMIN_FLAGS.get(AdminFlag.FlagChoices.NON_USERS.value):
             return True
         return super().has_permission(request, view)
 
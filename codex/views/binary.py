@@ -0,0 +1,194 @@
+"""Conditional and byte range responses for binary views."""
+
+import re
+from hashlib import blake2b
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BytesIO, RawIOBase
+from pathlib import Path
+
+from django.http import HttpResponse
+from django.http.response import FileResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+
+from codex.views.util import chunker
+
+_RANGE_RE = re.compile(r"^\s*bytes=(\d*)-(\d*)\s*$")
+_STAT_SIZE_INDEX = 6
+_STAT_MTIME_INDEX = 8
+# Most pages seem to be 2.5 Mb
+# largest pages I've seen were 9 Mb
+_CHUNK_SIZE = (1024**2) * 3  # 3 Mb
+
+
+class FileWindow(RawIOBase):
+    """Read only file-like window onto part of a file."""
+
+    def __init__(self, path, start=0, length=None):
+        """Open the file at the start of the window."""
+        super().__init__()
+        self._path = path
+        self._file = Path(path).open("rb")  # noqa: SIM115
+        try:
+            self._start = self._find_start(start)
+        except Exception:
+            self._file.close()
+            raise
+        if length is None:
+            length = self._file.seek(0, SEEK_END) - self._start
+        self._length = length
+        self._pos = 0
+        self._file.seek(self._start)
+
+    def _find_start(self, start):
+        """Find where the window starts."""
+        return start
+
+    def crop(self, offset, length):
+        """Narrow the window to a byte range within it."""
+        self._start += offset
+        self._length = max(0, min(length, self._length - offset))
+        self.seek(0)
+
+    def readable(self):
+        """Return True."""
+        return True
+
+    def seekable(self):
+        """Return True."""
+        return True
+
+    def tell(self):
+        """Position in the window."""
+        return self._pos
+
+    def seek(self, offset, whence=SEEK_SET):
+        """Seek within the window."""
+        if whence == SEEK_CUR:
+            offset += self._pos
+        elif whence == SEEK_END:
+            offset += self._length
+        self._pos = max(0, min(offset, self._length))
+        self._file.seek(self._start + self._pos)
+        return self._pos
+
+    def readinto(self, buffer):
+        """Read window data into the buffer."""
+        size = min(len(buffer), self._length - self._pos)
+        if size <= 0:
+            return 0
+        size = self._file.readinto(memoryview(buffer)[:size])
+        self._pos += size
+        return size
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+        super().close()
+
+    def __len__(self):
+        """Length of the window."""
+        return self._length
+
+
+class BinaryResponseMixin:
+    """Serve files and bytes with validators, conditional GETs and ranges."""
+
+    @staticmethod
+    def get_comic_validators(comic, *variant):
+        """Get an ETag and last modified timestamp from the comic's stored stat."""
+        stat = comic.stat or ()
+        size = stat[_STAT_SIZE_INDEX] if len(stat) > _STAT_SIZE_INDEX else 0
+        mtime = stat[_STAT_MTIME_INDEX] if len(stat) > _STAT_MTIME_INDEX else 0
+        updated_at = comic.updated_at.timestamp() if comic.updated_at else 0
+        version = repr((comic.pk, size, mtime, updated_at, *variant))
+        digest = blake2b(version.encode(), digest_size=16).hexdigest()
+        last_modified = int(mtime or updated_at) or None
+        return f'"{digest}"', last_modified
+
+    @staticmethod
+    def _add_validator_headers(response, etag, last_modified):
+        """Add validators and advertise byte ranges."""
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified)
+        response["Accept-Ranges"] = "bytes"
+        return response
+
+    def get_not_modified_response(self, etag, last_modified):
+        """Get a 304 or 412 response if the client's copy is current."""
+        response = self._add_validator_headers(HttpResponse(), etag, last_modified)
+        conditional_response = get_conditional_response(
+            self.request,  # type: ignore
+            etag=etag,
+            last_modified=last_modified,
+            response=response,
+        )
+        return None if conditional_response is response else conditional_response
+
+    def _is_if_range_current(self, etag, last_modified):
+        """Return whether the If-Range validator matches the current version."""
+        if_range = self.request.headers.get("If-Range")  # type: ignore
+        if not if_range:
+            return True
+        if if_range.startswith(('"', "W/")):
+            # Ranges need strong validators.
+            return etag in parse_etags(if_range)
+        if_range_date = parse_http_date_safe(if_range)
+        return bool(last_modified and if_range_date == last_modified)
+
+    def _get_byte_range(self, size, etag, last_modified):
+        """Get the requested (start, length) or None to send everything.
+
+        Raise ValueError if the range can't be satisfied.
+        """
+        range_header = self.request.headers.get("Range")  # type: ignore
+        if not range_header or not self._is_if_range_current(etag, last_modified):
+            return None
+        match = _RANGE_RE.match(range_header)
+        if not match:
+            # Multiple ranges aren't supported, so send everything.
+            return None
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        elif last:
+            start = max(0, size - int(last))
+            end = size - 1
+        else:
+            return None
+        if start >= size or end < start:
+            reason = f"bytes */{size}"
+            raise ValueError(reason)
+        return start, end - start + 1
+
+    def binary_response(self, content, content_type, etag, last_modified, **kwargs):
+        """Send bytes or a file window with byte range support."""
+        size = len(content)
+        try:
+            byte_range = self._get_byte_range(size, etag, last_modified)
+        except ValueError as exc:
+            if isinstance(content, FileWindow):
+                content.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = str(exc)
+            return self._add_validator_headers(response, etag, last_modified)
+
+        if byte_range:
+            start, length = byte_range
+            if isinstance(content, FileWindow):
+                content.crop(start, length)
+            else:
+                content = content[start : start + length]
+        if isinstance(content, FileWindow):
+            response = FileResponse(content, content_type=content_type, **kwargs)
+        else:
+            response = StreamingHttpResponse(
+                chunker(BytesIO(content), _CHUNK_SIZE), content_type=content_type
+            )
+            response["Content-Length"] = len(content)
+        if byte_range:
+            start, length = byte_range
+            response.status_code = 206
+            response["Content-Range"] = f"bytes {start}-{start + length - 1}/{size}"
+        return self._add_validator_headers(response, etag, last_modified)
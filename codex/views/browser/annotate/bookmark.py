@@ -8,6 +8,7 @@ from django.db.models import (
     When,
 )
 from django.db.models.fields import BooleanField, PositiveSmallIntegerField
+from django.db.models.fields.json import JSONField
 from django.db.models.functions import Least
 from django.db.models.functions.comparison import Coalesce
 
@@ -47,6 +48,19 @@ class BrowserAnnotateBookmarkView(BrowserAnnotateOrderView):
             distinct=True,
         )
 
+    @staticmethod
+    def _alias_finished_count(qs, finished_count):
+        """Alias finished_count and get the finished aggregate from it."""
+        qs = qs.alias(finished_count=finished_count)
+
+        finished_aggregate = Case(
+            When(finished_count=F("child_count"), then=True),
+            When(finished_count=0, then=False),
+            default=None,
+            output_field=BooleanField(),
+        )
+        return qs, finished_aggregate
+
     @classmethod
     def _get_group_bookmark_finished_annotation(cls, qs, bm_filter, finished_rel):
         """Get finished_count subquery."""
@@ -57,15 +71,34 @@ class BrowserAnnotateBookmarkView(BrowserAnnotateOrderView):
             output_field=PositiveSmallIntegerField(),
             # distinct breaks this sum and only returns one. idk why.
         )
-        qs = qs.alias(finished_count=finished_count)
+        return cls._alias_finished_count(qs, finished_count)
 
-        finished_aggregate = Case(
-            When(finished_count=F("child_count"), then=True),
-            When(finished_count=0, then=False),
-            default=None,
-            output_field=BooleanField(),
+    def _get_group_progress_annotations(self, qs):
+        """Get bookmark aggregates from the materialized reading progress."""
+        progress_filter = self._get_my_bookmark_filter("user_progress")
+        bookmark_page = Coalesce(
+            self.get_rollup_subquery(
+                qs.model, Sum("user_progress__page"), progress_filter
+            ),
+            0,
         )
-        return qs, finished_aggregate
+        finished_count = Coalesce(
+            self.get_rollup_subquery(
+                qs.model, Sum("user_progress__finished_count"), progress_filter
+            ),
+            0,
+        )
+        qs, finished_aggregate = self._alias_finished_count(qs, finished_count)
+        return qs, bookmark_page, finished_aggregate
+
+    def _get_group_bookmark_updated_ats(self, qs):
+        """Get bookmark updated_ats from the materialized reading progress."""
+        bmuas = self.get_rollup_subquery(
+            qs.model,
+            JsonGroupArray("user_progress__bookmark_updated_at"),
+            self._get_my_bookmark_filter("user_progress"),
+        )
+        return Coalesce(bmuas, Value("[]"), output_field=JSONField())
 
     def annotate_bookmarks(self, qs):
         """Hoist up bookmark annotations."""
@@ -74,9 +107,14 @@ class BrowserAnnotateBookmarkView(BrowserAnnotateOrderView):
         page_rel = f"{bm_rel}__page"
         finished_rel = f"{bm_rel}__finished"
 
+        use_progress = self.use_group_rollups(qs.model)
         if qs.model is Comic:
             bookmark_page = Sum(page_rel, filter=bm_filter, default=0)
             finished_aggregate = Sum(finished_rel, filter=bm_filter, default=False)
+        elif use_progress:
+            qs, bookmark_page, finished_aggregate = (
+                self._get_group_progress_annotations(qs)
+            )
         else:
             bookmark_page = self._get_group_bookmark_page_annotation(
                 qs, bm_rel, bm_filter, page_rel, finished_rel
@@ -97,7 +135,12 @@ class BrowserAnnotateBookmarkView(BrowserAnnotateOrderView):
         qs = qs.annotate(finished=finished_aggregate)
 
         if not self.bmua_is_max:
-            mbmua = self.get_max_bookmark_updated_at_aggregate(qs.model, JsonGroupArray)
+            if use_progress:
+                mbmua = self._get_group_bookmark_updated_ats(qs)
+            else:
+                mbmua = self.get_max_bookmark_updated_at_aggregate(
+                    qs.model, JsonGroupArray
+                )
             qs = qs.annotate(bookmark_updated_ats=mbmua)
         return qs
 
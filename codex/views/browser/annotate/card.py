@@ -1,24 +1,18 @@
 """Base view for metadata annotations."""
 
-from types import MappingProxyType
-
 from django.db.models import (
     F,
     Value,
 )
-from django.db.models.aggregates import Count
+from django.db.models.aggregates import Count, Sum
 from django.db.models.fields import CharField
 
 from codex.logger.logging import get_logger
 from codex.models.comic import Comic
 from codex.models.functions import JsonGroupArray
-from codex.models.groups import BrowserGroupModel, Imprint, Publisher, Series, Volume
 from codex.views.browser.annotate.bookmark import BrowserAnnotateBookmarkView
-from codex.views.const import FOLDER_GROUP
+from codex.views.const import CARD_GROUP_BY, FOLDER_GROUP
 
-_GROUP_BY: MappingProxyType[type[BrowserGroupModel], str] = MappingProxyType(
-    {Publisher: "sort_name", Imprint: "sort_name", Series: "sort_name", Volume: "name"}
-)
 LOG = get_logger(__name__)
 
 
@@ -27,7 +21,7 @@ class BrowserAnnotateCardView(BrowserAnnotateBookmarkView):
 
     def add_group_by(self, qs):
         """Get the group by for the model."""
-        if group_by := _GROUP_BY.get(qs.model):  # type: ignore
+        if group_by := CARD_GROUP_BY.get(qs.model):  # type: ignore
             qs = qs.group_by(group_by)
         return qs
 
@@ -35,8 +29,11 @@ class BrowserAnnotateCardView(BrowserAnnotateBookmarkView):
         """Annotate child chount for card."""
         if qs.model is Comic:
             return qs
-        rel = self.rel_prefix + "pk"
-        count_func = Count(rel, distinct=True)
+        if self.use_group_rollups(qs.model):
+            count_func = self.get_rollup_subquery(qs.model, Sum("rollup__child_count"))
+        else:
+            rel = self.rel_prefix + "pk"
+            count_func = Count(rel, distinct=True)
         ann = {"child_count": count_func}
         if self.TARGET == "opds2":
             if qs.model is not Comic:
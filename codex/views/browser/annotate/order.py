@@ -6,12 +6,15 @@ from types import MappingProxyType
 from django.db.models import (
     F,
     FilteredRelation,
+    OuterRef,
     Q,
+    Subquery,
     Value,
 )
 from django.db.models.aggregates import Avg, Max, Min, Sum
-from django.db.models.fields import CharField
-from django.db.models.functions import Reverse, Right, StrIndex
+from django.db.models.fields import CharField, DecimalField, FloatField
+from django.db.models.functions import Cast, NullIf, Reverse, Right, StrIndex
+from django.db.models.lookups import IsNull
 
 from codex.logger.logging import get_logger
 from codex.models import (
@@ -24,6 +27,7 @@ from codex.views.browser.order_by import (
     BrowserOrderByView,
 )
 from codex.views.const import (
+    CARD_GROUP_BY,
     NONE_INTEGERFIELD,
     STORY_ARC_GROUP,
 )
@@ -52,6 +56,9 @@ _ANNOTATED_ORDER_FIELDS = frozenset(
         "story_arc_number",
     }
 )
+_ROLLUP_SUM_FIELDS = frozenset({"page_count", "size"})
+_ROLLUP_RANGE_FIELDS = frozenset({"created_at", "date", "updated_at"})
+_ROLLUP_AVG_FIELDS = frozenset({"community_rating", "critical_rating"})
 
 LOG = get_logger(__name__)
 
@@ -103,6 +110,39 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
             self._order_agg_func = Max if order_reverse else Min
         return self._order_agg_func
 
+    def get_rollup_subquery(self, model, value, rollup_filter=None):
+        """Aggregate the rollups of every group merged into a card."""
+        key = CARD_GROUP_BY.get(model, "id")
+        card_filter = Q(**{key: OuterRef(key)})
+        if model._meta.get_field(key).null:
+            card_filter |= Q(**{f"{key}__isnull": True}) & Q(
+                IsNull(OuterRef(key), True)
+            )
+        if rollup_filter:
+            # In the same filter() so aggregates join the filtered relation.
+            card_filter &= rollup_filter
+        rollups = model.objects.filter(self.get_group_filter(), card_filter)
+        rollups = rollups.values(key).annotate(value=value).values("value")
+        return Subquery(rollups)
+
+    def _get_rollup_order_value(self, model):
+        """Get the order value from group rollups if it's materialized."""
+        if not self.use_group_rollups(model):
+            return None
+        field = "rollup__" + self.order_key
+        if self.order_key in _ROLLUP_SUM_FIELDS:
+            value = Sum(field)
+        elif self.order_key in _ROLLUP_RANGE_FIELDS:
+            suffix = "_max" if self.order_agg_func is Max else "_min"
+            value = self.order_agg_func(field + suffix)
+        elif self.order_key in _ROLLUP_AVG_FIELDS:
+            total = Cast(Sum(field + "_total"), FloatField())
+            count = NullIf(Sum(field + "_count"), 0)
+            value = Cast(total / count, DecimalField(max_digits=5, decimal_places=2))
+        else:
+            return None
+        return self.get_rollup_subquery(model, value)
+
     def _alias_sort_names(self, qs):
         """Annotate sort_name."""
         if self.order_key != "sort_name" and not (
@@ -182,8 +222,13 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
         ):
             return qs
 
-        rel = self.rel_prefix + "page_count"
-        page_count_sum = Sum(rel, distinct=True)
+        if self.use_group_rollups(qs.model):
+            page_count_sum = self.get_rollup_subquery(
+                qs.model, Sum("rollup__page_count")
+            )
+        else:
+            rel = self.rel_prefix + "page_count"
+            page_count_sum = Sum(rel, distinct=True)
         if self.TARGET == "browser":
             qs = qs.alias(page_count=page_count_sum)
         else:
@@ -192,9 +237,17 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
 
     def _annotate_bookmark_updated_at(self, qs):
         if self.is_opds_acquisition or self.order_key == "bookmark_updated_at":
-            bmua_agg = self.get_max_bookmark_updated_at_aggregate(
-                qs.model, agg_func=self.order_agg_func
-            )
+            if self.order_agg_func is Max and self.use_group_rollups(qs.model):
+                # Progress rollups only keep the latest bookmark update.
+                bmua_agg = self.get_rollup_subquery(
+                    qs.model,
+                    Max("user_progress__bookmark_updated_at"),
+                    self._get_my_bookmark_filter("user_progress"),
+                )
+            else:
+                bmua_agg = self.get_max_bookmark_updated_at_aggregate(
+                    qs.model, agg_func=self.order_agg_func
+                )
             # This is used by annotate.bookmark to avoid a
             # similar query.
             self.bmua_is_max = self.order_agg_func is Max
@@ -212,6 +265,8 @@ class BrowserAnnotateOrderView(BrowserOrderByView, SharedAnnotationsMixin):
         elif qs.model is Comic or self.order_key in _ANNOTATED_ORDER_FIELDS:
             # These are annotated in browser_annotaions
             order_value = F(self.order_key)
+        elif rollup_value := self._get_rollup_order_value(qs.model):
+            order_value = rollup_value
         else:
             agg_func = _ORDER_AGGREGATE_FUNCS[self.order_key]
             agg_func = self.order_agg_func if agg_func == Min else agg_func
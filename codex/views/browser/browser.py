@@ -23,11 +23,12 @@ from codex.views.const import (
     MAX_OBJ_PER_PAGE,
     STORY_ARC_GROUP,
 )
+from codex.views.response_cache import CachedResponseMixin
 
 LOG = get_logger(__name__)
 
 
-class BrowserView(BrowserTitleView):
+class BrowserView(CachedResponseMixin, BrowserTitleView):
     """Browse comics with a variety of filters and sorts."""
 
     serializer_class = BrowserPageSerializer
@@ -158,26 +159,33 @@ class BrowserView(BrowserTitleView):
         # Paginate
         num_pages = ceil((group_count + book_count) / MAX_OBJ_PER_PAGE)
         self.check_page_in_bounds(num_pages)
-        group_qs, book_qs, page_group_count, page_book_count = self.paginate(
-            group_qs, book_qs, group_count
+        page_group_qs, page_book_qs, page_group_count, page_book_count = self.paginate(
+            group_qs, book_qs, group_count, book_count
         )
 
         # Annotate
         if page_group_count:
-            group_qs = self.annotate_card_aggregates(group_qs)
-            group_qs = self.force_inner_joins(group_qs)
+            page_group_qs = self.annotate_card_aggregates(page_group_qs)
+            page_group_qs = self.force_inner_joins(page_group_qs)
         if page_book_count:
-            zero_pad = self._get_zero_pad(book_qs)
-            book_qs = self.annotate_card_aggregates(book_qs)
-            book_qs = self.force_inner_joins(book_qs)
+            zero_pad = self._get_zero_pad(page_book_qs)
+            page_book_qs = self.annotate_card_aggregates(page_book_qs)
+            page_book_qs = self.force_inner_joins(page_book_qs)
+            self.next_cursor = self.get_next_cursor(
+                num_pages, book_qs, page_book_qs, "b"
+            )
         else:
             zero_pad = 1
+            if page_group_count:
+                self.next_cursor = self.get_next_cursor(
+                    num_pages, group_qs, page_group_qs, "g"
+                )
 
-        # self._debug_queries(page_group_count, page_book_count, group_qs, book_qs)
+        # self._debug_queries(page_group_count, page_book_count, page_group_qs, page_book_qs)
 
         total_page_count = page_group_count + page_book_count
         mtime = self._get_page_mtime()
-        return group_qs, book_qs, num_pages, total_page_count, zero_pad, mtime
+        return page_group_qs, page_book_qs, num_pages, total_page_count, zero_pad, mtime
 
     def get_object(self):  # type: ignore
         """Validate settings and get the querysets."""
@@ -202,6 +210,7 @@ class BrowserView(BrowserTitleView):
                 "zero_pad": zero_pad,
                 "num_pages": num_pages,
                 "total_count": total_count,
+                "next_cursor": self.next_cursor,
                 "admin_flags": self.admin_flags,
                 "libraries_exist": libraries_exist,
                 "mtime": mtime,
@@ -213,6 +222,8 @@ class BrowserView(BrowserTitleView):
     @extend_schema(parameters=[BrowserTitleView.input_serializer_class])
     def get(self, *_args, **_kwargs):
         """Get browser settings."""
+        if response := self.get_cached_response():
+            return response
         data = self.get_object()
         serializer = self.get_serializer(data)
-        return Response(serializer.data)
+        return self.cache_response(Response(serializer.data))
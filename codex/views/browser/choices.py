@@ -4,14 +4,16 @@ from types import MappingProxyType
 from typing import Any
 
 from caseconverter import snakecase
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
 from drf_spectacular.utils import extend_schema
 from rest_framework.response import Response
 
 from codex.choices import DUMMY_NULL_NAME, VUETIFY_NULL_CODE
 from codex.logger.logging import get_logger
 from codex.models import (
+    FACET_RELS,
     Comic,
+    ComicFacet,
     ContributorPerson,
     StoryArc,
 )
@@ -24,6 +26,7 @@ from codex.serializers.browser.filters import (
 )
 from codex.serializers.browser.settings import BrowserFilterChoicesInputSerilalizer
 from codex.views.browser.filters.filter import BrowserFilterView
+from codex.views.response_cache import CachedResponseMixin
 from codex.views.session import (
     CONTRIBUTOR_PERSON_UI_FIELD,
     IDENTIFIER_TYPE_UI_FIELD,
@@ -58,7 +61,7 @@ _BACK_REL_MAP = MappingProxyType(
 _NULL_NAMED_ROW = MappingProxyType({"pk": VUETIFY_NULL_CODE, "name": DUMMY_NULL_NAME})
 
 
-class BrowserChoicesViewBase(BrowserFilterView):
+class BrowserChoicesViewBase(CachedResponseMixin, BrowserFilterView):
     """Get choices for filter dialog."""
 
     input_serializer_class = BrowserFilterChoicesInputSerilalizer
@@ -73,10 +76,14 @@ class BrowserChoicesViewBase(BrowserFilterView):
             .distinct()
         )
 
-    def get_m2m_field_query(self, model, comic_qs: QuerySet):
+    def get_m2m_field_query(self, field_name, model, comic_qs: QuerySet):
         """Get distinct m2m value objects for the relation."""
-        back_rel = _BACK_REL_MAP.get(model, "")
-        m2m_filter = {f"{back_rel}comic__in": comic_qs}
+        if field_name in FACET_RELS:
+            value_qs = ComicFacet.objects.filter(field=field_name, comic__in=comic_qs)
+            m2m_filter = {"pk__in": value_qs.values("value")}
+        else:
+            back_rel = _BACK_REL_MAP.get(model, "")
+            m2m_filter = {f"{back_rel}comic__in": comic_qs}
         return model.objects.filter(**m2m_filter).values("pk", "name").distinct()
 
     @staticmethod
@@ -105,9 +112,11 @@ class BrowserChoicesViewBase(BrowserFilterView):
     @extend_schema(parameters=[input_serializer_class])
     def get(self, *_args, **_kwargs):
         """Return choices."""
+        if response := self.get_cached_response():
+            return response
         obj = self.get_object()
         serializer = self.get_serializer(obj)
-        return Response(serializer.data)
+        return self.cache_response(Response(serializer.data))
 
 
 class BrowserChoicesAvailableView(BrowserChoicesViewBase):
@@ -115,42 +124,64 @@ class BrowserChoicesAvailableView(BrowserChoicesViewBase):
 
     serializer_class = BrowserFilterChoicesSerializer
 
-    @classmethod
-    def _get_field_choices_count(cls, comic_qs, field_name):
-        """Create a pk:name object for fields without tables."""
-        qs = cls.get_field_choices_query(comic_qs, field_name)
-        return qs.count()
-
-    def _get_m2m_field_choices_count(self, model, comic_qs, rel):
-        """Get choices with nulls where there are nulls."""
-        m2m_qs = self.get_m2m_field_query(model, comic_qs)
-        m2m_qs = m2m_qs.values("pk")
-        count = m2m_qs.count()
-
-        # Detect if there are null choices.
-        # Regretabbly with another query, but doing a forward query
-        # on the comic above restricts all results to only the filtered
-        # rows. :(
-        if self.does_m2m_null_exist(comic_qs, rel):
-            count += 1
+    def _get_column_choice_counts(self, comic_qs, field_names):
+        """Count the choices for fields stored on the comic in one query."""
+        aggregates = {"comic_count": Count("pk", distinct=True)}
+        for field_name in field_names:
+            rel, model = self.get_rel_and_model(field_name)
+            aggregates[f"{field_name}_count"] = Count(rel, distinct=True)
+            if model:
+                # Null is a choice for related models.
+                null_filter = Q(**{f"{rel}__isnull": True})
+                aggregates[f"{field_name}_null"] = Count("pk", filter=null_filter)
+        row = comic_qs.aggregate(**aggregates)
+        counts = {
+            field_name: row[f"{field_name}_count"] + bool(row.get(f"{field_name}_null"))
+            for field_name in field_names
+        }
+        return counts, row["comic_count"]
 
-        return count
+    @staticmethod
+    def _get_facet_choice_counts(comic_qs, comic_count):
+        """Count the choices for all many to many fields in one query."""
+        counts = dict.fromkeys(FACET_RELS, int(bool(comic_count)))
+        rows = (
+            ComicFacet.objects.filter(comic__in=comic_qs)
+            .values("field")
+            .annotate(
+                value_count=Count("value", distinct=True),
+                facet_comic_count=Count("comic", distinct=True),
+            )
+            .values_list("field", "value_count", "facet_comic_count")
+        )
+        for field_name, value_count, facet_comic_count in rows:
+            # Comics without a value make null a choice.
+            counts[field_name] = value_count + (facet_comic_count < comic_count)
+        return counts
+
+    def _get_choice_counts(self, comic_qs, field_names):
+        """Count the choices for every field."""
+        column_field_names = tuple(
+            field_name for field_name in field_names if field_name not in FACET_RELS
+        )
+        counts, comic_count = self._get_column_choice_counts(
+            comic_qs, column_field_names
+        )
+        counts.update(self._get_facet_choice_counts(comic_qs, comic_count))
+        return counts
 
     def get_object(self) -> dict[str, Any]:  # type: ignore
         """Get choice counts."""
         qs = super().get_object()
         filters = self.params.get("filters", {})
+        field_names = tuple(self.serializer_class().get_fields())  # type: ignore
+        counts = self._get_choice_counts(qs, field_names)
         data = {}
-        for field_name in self.serializer_class().get_fields():  # type: ignore
+        for field_name in field_names:
             if field_name == "story_arcs" and qs.model is StoryArc:
                 # don't allow filtering on story arc in story arc view.
                 continue
-            rel, m2m_model = self.get_rel_and_model(field_name)
-
-            if m2m_model:
-                count = self._get_m2m_field_choices_count(m2m_model, qs, rel)
-            else:
-                count = self._get_field_choices_count(qs, rel)
+            count = counts[field_name]
 
             try:
                 is_filter_set = bool(filters.get(field_name))
@@ -166,9 +197,9 @@ class BrowserChoicesView(BrowserChoicesViewBase):
 
     serializer_class = BrowserChoicesFilterSerializer
 
-    def _get_m2m_field_choices(self, model, comic_qs, rel):
+    def _get_m2m_field_choices(self, field_name, model, comic_qs, rel):
         """Get choices with nulls where there are nulls."""
-        qs = self.get_m2m_field_query(model, comic_qs)
+        qs = self.get_m2m_field_query(field_name, model, comic_qs)
 
         # Detect if there are null choices.
         # Regretabbly with another query, but doing a forward query
@@ -192,7 +223,7 @@ class BrowserChoicesView(BrowserChoicesViewBase):
         rel, m2m_model = self.get_rel_and_model(field_name)
 
         if m2m_model:
-            choices = self._get_m2m_field_choices(m2m_model, qs, rel)
+            choices = self._get_m2m_field_choices(field_name, m2m_model, qs, rel)
         else:
             choices = self.get_field_choices_query(qs, field_name)
 
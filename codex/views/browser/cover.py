@@ -1,13 +1,18 @@
 """Comic cover thumbnail view."""
 
+import json
+from hashlib import blake2b
+
+from django.core.cache import cache
 from django.db import OperationalError
 from django.db.models.query import Q
-from django.http.response import StreamingHttpResponse
+from django.http.response import HttpResponse, StreamingHttpResponse
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from rest_framework.renderers import BaseRenderer
 
 from codex.librarian.covers.create import CoverCreateThread
+from codex.librarian.covers.pack import CoverPackMixin
 from codex.librarian.covers.path import CoverPathMixin
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.logger.logging import get_logger
@@ -15,6 +20,8 @@ from codex.models import Comic, Volume
 from codex.models.groups import Folder
 from codex.models.paths import CustomCover
 from codex.serializers.browser.settings import BrowserCoverInputSerializer
+from codex.settings.settings import COVER_PACKS
+from codex.urls.const import COVER_MAX_AGE
 from codex.views.browser.annotate.order import BrowserAnnotateOrderView
 from codex.views.const import (
     CUSTOM_COVER_GROUP_RELATION,
@@ -26,6 +33,15 @@ from codex.views.const import (
 from codex.views.util import chunker
 
 LOG = get_logger(__name__)
+_COVER_PK_CACHE_PREFIX = "cover_pk:"
+_COVER_PK_PARAMS = (
+    "dynamic_covers",
+    "filters",
+    "order_reverse",
+    "parent",
+    "q",
+    "show",
+)
 
 
 class WEBPRenderer(BaseRenderer):
@@ -75,8 +91,8 @@ class CoverView(BrowserAnnotateOrderView):
         pks = self.kwargs["pks"]
         return pks[0], False
 
-    def _get_custom_cover(self):
-        """Get Custom Cover."""
+    def get_custom_cover_queryset(self):
+        """Get the custom cover queryset or None if custom covers don't apply."""
         if self.model is Volume or not self.params.get("custom_covers"):
             return None
         group = self.kwargs["group"]
@@ -84,17 +100,55 @@ class CoverView(BrowserAnnotateOrderView):
         pks = self.kwargs["pks"]
         comic_filter = {f"{group_rel}__in": pks}
         qs = CustomCover.objects.filter(**comic_filter)
-        qs = qs.only("pk")
-        return qs.first()
+        return qs.only("pk")
 
-    def _get_dynamic_cover(self):
-        """Get dynamic cover."""
+    def _get_custom_cover(self):
+        """Get Custom Cover."""
+        qs = self.get_custom_cover_queryset()
+        return qs.first() if qs is not None else None
+
+    def get_dynamic_cover_queryset(self):
+        """Get the ordered comic queryset that the dynamic cover is first in."""
         comic_qs = self.get_filtered_queryset(Comic)
         comic_qs = self.annotate_order_aggregates(comic_qs)
         comic_qs = self.add_order_by(comic_qs)
-        comic_qs = comic_qs.only("pk")
-        comic = comic_qs.first()
+        return comic_qs.only("pk")
+
+    def get_cover_pk_cache_key(self):
+        """Get the dynamic cover pk cache key or None if it shouldn't be cached.
+
+        The importer clears the cache when the library changes.
+        """
+        if self.is_bookmark_filtered or self.order_key == "bookmark_updated_at":
+            # Bookmark updates don't clear the cache.
+            return None
+        user = self.request.user
+        acl_key = user.pk if user and user.is_authenticated else 0
+        key_parts = (
+            self.model_group,
+            self.kwargs["pks"],
+            self.order_key,
+            acl_key,
+            *(self.params.get(key) for key in _COVER_PK_PARAMS),
+        )
+        key_json = json.dumps(key_parts, sort_keys=True, default=str)
+        digest = blake2b(key_json.encode(), digest_size=16).hexdigest()
+        return _COVER_PK_CACHE_PREFIX + digest
+
+    @staticmethod
+    def set_cached_cover_pks(cover_pks: dict[str, int]):
+        """Cache dynamic cover pks by cache key."""
+        cache.set_many(cover_pks, timeout=COVER_MAX_AGE)
+
+    def _get_dynamic_cover(self):
+        """Get dynamic cover."""
+        cache_key = self.get_cover_pk_cache_key()
+        if cache_key and (cover_pk := cache.get(cache_key)) is not None:
+            return cover_pk, False
+        comic = self.get_dynamic_cover_queryset().first()
         cover_pk = comic.pk if comic else 0
+        if cache_key:
+            self.set_cached_cover_pks({cache_key: cover_pk})
         return cover_pk, False
 
     def _get_cover_pk(self) -> tuple[int, bool]:
@@ -108,7 +162,7 @@ class CoverView(BrowserAnnotateOrderView):
             cover_pk, custom = self._get_dynamic_cover()
         return cover_pk, custom
 
-    def _get_missing_cover_path(self):
+    def get_missing_cover_path(self):
         """Get the missing cover, which is a default svg if fetched for a group."""
         group: str = self.kwargs["group"]
         cover_name = MISSING_COVER_NAME_MAP.get(group)
@@ -121,19 +175,28 @@ class CoverView(BrowserAnnotateOrderView):
         cover_path = STATIC_IMG_PATH / cover_fn
         return cover_path, content_type
 
-    def _get_cover_data(self, pk, custom):
+    def get_cover_data(self, pk, custom):
+        """Get the cover file and its content type."""
         thumb_buffer = None
         content_type = "image/webp"
 
+        if COVER_PACKS:
+            data = CoverPackMixin.read_packed_cover(pk, custom)
+            if data:
+                return data, content_type
+            if data is not None:
+                cover_path, content_type = self.get_missing_cover_path()
+                return cover_path.open("rb"), content_type
+
         cover_path = CoverPathMixin.get_cover_path(pk, custom)
         if not cover_path.exists():
             thumb_buffer = CoverCreateThread.create_cover_from_path(
                 pk, cover_path, LOG, LIBRARIAN_QUEUE, custom
             )
             if not thumb_buffer:
-                cover_path, content_type = self._get_missing_cover_path()
+                cover_path, content_type = self.get_missing_cover_path()
         elif cover_path.stat().st_size == 0:
-            cover_path, content_type = self._get_missing_cover_path()
+            cover_path, content_type = self.get_missing_cover_path()
 
         cover_file = thumb_buffer if thumb_buffer else cover_path.open("rb")
         return cover_file, content_type
@@ -151,7 +214,10 @@ class CoverView(BrowserAnnotateOrderView):
                 self._handle_operational_error(exc)
                 pk = 0
                 custom = False
-            cover_file, content_type = self._get_cover_data(pk, custom)
+            cover_file, content_type = self.get_cover_data(pk, custom)
+            if isinstance(cover_file, bytes):
+                # Packed covers are small and already read.
+                return HttpResponse(cover_file, content_type=content_type)
             return StreamingHttpResponse(chunker(cover_file), content_type=content_type)
         except Exception:
             LOG.exception("Get cover")
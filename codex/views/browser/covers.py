@@ -0,0 +1,159 @@
+"""Batch comic cover thumbnail view."""
+
+from struct import Struct
+
+from django.core.cache import cache
+from django.db import OperationalError
+from django.db.models import Subquery
+from django.http.response import HttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework.renderers import BaseRenderer
+
+from codex.logger.logging import get_logger
+from codex.models import Comic
+from codex.serializers.browser.settings import BrowserCoversInputSerializer
+from codex.views.browser.cover import CoverView
+from codex.views.const import COMIC_GROUP
+
+LOG = get_logger(__name__)
+# Content type length, data length
+_COVER_HEADER = Struct("!HI")
+# Keeps the subquery variables well under the sqlite limit.
+_CARDS_PER_QUERY = 50
+
+
+class CoversRenderer(BaseRenderer):
+    """Render length prefixed covers."""
+
+    media_type = "application/octet-stream"
+    format = "covers"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, *_args, **_kwargs):
+        """Return raw data."""
+        return data
+
+
+class CoversView(CoverView):
+    """Many cover thumbnails in one response.
+
+    Each cover is a header of the content type length and the data length,
+    followed by the content type and the data, in the order of the
+    submitted groups.
+    """
+
+    input_serializer_class = BrowserCoversInputSerializer
+    renderer_classes = (CoversRenderer,)
+    content_type = CoversRenderer.media_type
+    REPARSE_JSON_FIELDS = frozenset(CoverView.REPARSE_JSON_FIELDS | {"groups"})
+
+    def __init__(self, *args, **kwargs):
+        """Initialize properties."""
+        super().__init__(*args, **kwargs)
+        self._card_params = {}
+
+    def _get_card_view(self, group, pks):
+        """Get a fresh cover view for one card so memoized state stays per card."""
+        card_view = CoverView(
+            request=self.request,
+            args=self.args,
+            kwargs={**self.kwargs, "group": group, "pks": pks},
+            format_kwarg=self.format_kwarg,
+        )
+        # Params only depend on the group, so validate them once per group.
+        card_view._params = self._card_params.get(group)  # noqa: SLF001
+        self._card_params[group] = card_view.params
+        return card_view
+
+    def _get_cards(self):
+        """Get the submitted cards in order."""
+        return tuple((card["group"], card["pks"]) for card in self.params["groups"])
+
+    @staticmethod
+    def _add_card_subqueries(card_view, index, subqueries, row, cache_keys):
+        """Add the cover subqueries for one card unless its cover pk is cached."""
+        custom_qs = card_view.get_custom_cover_queryset()
+        if custom_qs is not None:
+            subqueries[f"custom_{index}"] = Subquery(custom_qs.values("pk")[:1])
+        comic_key = f"comic_{index}"
+        cache_key = card_view.get_cover_pk_cache_key()
+        if cache_key and (cover_pk := cache.get(cache_key)) is not None:
+            row[comic_key] = cover_pk
+            return
+        comic_qs = card_view.get_dynamic_cover_queryset()
+        subqueries[comic_key] = Subquery(comic_qs.values("pk")[:1])
+        if cache_key:
+            cache_keys[comic_key] = cache_key
+
+    def _get_cover_pks_batch(self, cards, start):
+        """Resolve a batch of cards' covers in one query."""
+        subqueries = {}
+        row = {}
+        cache_keys = {}
+        for index, (group, pks) in enumerate(cards, start=start):
+            if group != COMIC_GROUP and pks:
+                card_view = self._get_card_view(group, pks)
+                self._add_card_subqueries(card_view, index, subqueries, row, cache_keys)
+        if not subqueries:
+            return row
+        qs = Comic.objects.annotate(**subqueries).values(*subqueries.keys())
+        row.update(qs.first() or {})
+        self.set_cached_cover_pks(
+            {
+                cache_key: row.get(comic_key) or 0
+                for comic_key, cache_key in cache_keys.items()
+            }
+        )
+        return row
+
+    def _get_cover_pks(self, cards):
+        """Resolve all cards' cover pks."""
+        cover_pks = []
+        for start in range(0, len(cards), _CARDS_PER_QUERY):
+            batch = cards[start : start + _CARDS_PER_QUERY]
+            try:
+                row = self._get_cover_pks_batch(batch, start)
+            except OperationalError as exc:
+                self._handle_operational_error(exc)
+                row = {}
+            for index, (group, pks) in enumerate(batch, start=start):
+                if group == COMIC_GROUP:
+                    cover = (pks[0] if pks else 0, False)
+                elif custom_pk := row.get(f"custom_{index}"):
+                    cover = (custom_pk, True)
+                else:
+                    cover = (row.get(f"comic_{index}") or 0, False)
+                cover_pks.append(cover)
+        return cover_pks
+
+    def _read_cover(self, group, pks, pk, custom):
+        """Read one cover's data and content type."""
+        card_view = self._get_card_view(group, pks)
+        cover_file, content_type = card_view.get_cover_data(pk, custom)
+        if isinstance(cover_file, bytes):
+            return cover_file, content_type
+        with cover_file:
+            return cover_file.read(), content_type
+
+    @extend_schema(
+        parameters=[BrowserCoversInputSerializer],
+        responses={(200, content_type): OpenApiTypes.BINARY},
+    )
+    def get(self, *args, **kwargs):  # type: ignore
+        """Get many comic covers."""
+        cards = self._get_cards()
+        cover_pks = self._get_cover_pks(cards)
+        body = bytearray()
+        for (group, pks), (pk, custom) in zip(cards, cover_pks, strict=True):
+            try:
+                data, content_type = self._read_cover(group, pks, pk, custom)
+            except Exception:
+                LOG.exception(f"Get cover {group}:{pks}")
+                data, content_type = b"", ""
+            content_type_bytes = content_type.encode()
+            body += _COVER_HEADER.pack(len(content_type_bytes), len(data))
+            body += content_type_bytes
+            body += data
+        return HttpResponse(bytes(body), content_type=self.content_type)
@@ -4,10 +4,12 @@ from django.db.models.query import QuerySet
 from django.db.models.query_utils import Q
 
 from codex.logger.logging import get_logger
+from codex.models import GROUP_ROLLUP_MODELS, Library
 from codex.models.comic import Comic
 from codex.views.browser.filters.bookmark import BrowserFilterBookmarkView
 
 LOG = get_logger(__name__)
+_ROLLUP_TARGETS = frozenset({"browser", "opds1", "opds2"})
 
 
 class BrowserFilterView(BrowserFilterBookmarkView):
@@ -15,6 +17,28 @@ class BrowserFilterView(BrowserFilterBookmarkView):
 
     TARGET = ""
 
+    def __init__(self, *args, **kwargs):
+        """Initialize memoized values."""
+        super().__init__(*args, **kwargs)
+        self._use_group_rollups: dict[type, bool] = {}
+
+    def use_group_rollups(self, model):
+        """Memoize if group aggregates can be read from materialized rollups."""
+        # Rollups count every comic so only use them if nothing is filtered out.
+        if model not in GROUP_ROLLUP_MODELS:
+            return False
+        use_group_rollups = self._use_group_rollups.get(model)
+        if use_group_rollups is None:
+            use_group_rollups = bool(
+                self.TARGET in _ROLLUP_TARGETS
+                and not self.params.get("q")
+                and not self.get_comic_field_filter(model)
+                and not self.get_bookmark_filter(model)
+                and not Library.groups.through.objects.exists()
+            )
+            self._use_group_rollups[model] = use_group_rollups
+        return use_group_rollups
+
     def force_inner_joins(self, qs):
         """Force INNER JOINS to filter empty groups."""
         demote_tables = {"codex_library"}
@@ -23,6 +47,8 @@ class BrowserFilterView(BrowserFilterBookmarkView):
         if self.fts_mode:
             # Forcing INNER JOINS required to make fts5 work
             demote_tables.add("codex_comicfts")
+        # Rollup annotations may not join every table.
+        demote_tables &= frozenset(qs.query.alias_map)
         return qs.demote_joins(demote_tables)
 
     def _get_query_filters(
@@ -39,6 +65,9 @@ class BrowserFilterView(BrowserFilterBookmarkView):
         big_include_filter &= self.get_group_acl_filter(model, self.request.user)
         big_include_filter &= self.get_group_filter(group, pks, page_mtime=page_mtime)
         big_include_filter &= self.get_comic_field_filter(model)
+        if self.use_group_rollups(model):
+            # Rollup annotations don't join comics to drop empty groups.
+            big_include_filter &= Q(rollup__child_count__gt=0)
         if bookmark_filter:
             big_include_filter &= self.get_bookmark_filter(model)
         include_search_filter, exclude_search_filter, fts_q = self.get_search_filters(
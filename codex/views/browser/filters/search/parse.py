@@ -5,6 +5,7 @@ from types import MappingProxyType
 
 from django.db.models.query import Q
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.logger.logging import get_logger
 from codex.models import AdminFlag
 from codex.models.comic import ComicFTS
@@ -42,7 +43,7 @@ _NON_FTS_COLUMNS = frozenset(
 _VALID_COLUMNS = frozenset(_FTS_COLUMNS | _NON_FTS_COLUMNS)
 _QUOTES_REXP = r"\".*?\""
 _COLUMN_EXPRESSION_OPERATORS_REXP = (
-    rf"(?:{_QUOTES_REXP})|(?P<star>\B[\*\<\>]\w|\.{2,}|\w\*\w)"
+    rf"(?:{_QUOTES_REXP})|(?P<star>\B[\*\<\>]\w|\.{{2,}}|\w\*\w)"
 )
 _COLUMN_EXPRESSION_OPERATORS_RE = re.compile(_COLUMN_EXPRESSION_OPERATORS_REXP)
 _FTS_OPERATORS = frozenset({"and", "not", "or", "near"})
@@ -78,16 +79,12 @@ class SearchFilterView(BrowserFTSFilter):
     def admin_flags(self) -> MappingProxyType[str, bool]:
         """Set browser relevant admin flags."""
         if self._admin_flags is None:
-            if self.ADMIN_FLAG_VALUE_KEY_MAP:
-                admin_pairs = AdminFlag.objects.filter(
-                    key__in=self.ADMIN_FLAG_VALUE_KEY_MAP.keys()
-                ).values_list("key", "on")
-            else:
-                admin_pairs = ()
-            admin_flags = {}
-            for key, on in admin_pairs:
-                export_key = self.ADMIN_FLAG_VALUE_KEY_MAP[key]
-                admin_flags[export_key] = on
+            flags = ADMIN_FLAGS.get_flags()
+            admin_flags = {
+                export_key: flags[key]
+                for key, export_key in self.ADMIN_FLAG_VALUE_KEY_MAP.items()
+                if key in flags
+            }
             self._admin_flags = MappingProxyType(admin_flags)
         return self._admin_flags
 
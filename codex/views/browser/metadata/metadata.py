@@ -10,19 +10,22 @@ from codex.logger.logging import get_logger
 from codex.models import AdminFlag
 from codex.serializers.browser.metadata import MetadataSerializer
 from codex.serializers.browser.settings import BrowserFilterChoicesInputSerilalizer
+from codex.urls.const import PAGE_MAX_AGE
 from codex.views.browser.metadata.copy_intersections import (
     MetadataCopyIntersectionsView,
 )
+from codex.views.response_cache import CachedResponseMixin
 
 LOG = get_logger(__name__)
 
 
-class MetadataView(MetadataCopyIntersectionsView):
+class MetadataView(CachedResponseMixin, MetadataCopyIntersectionsView):
     """Aggregate Group and Comic Metadata View."""
 
     serializer_class = MetadataSerializer
     input_serializer_class = BrowserFilterChoicesInputSerilalizer
     TARGET = "metadata"
+    RESPONSE_CACHE_TIMEOUT = PAGE_MAX_AGE
     ADMIN_FLAG_VALUE_KEY_MAP = MappingProxyType(
         {
             AdminFlag.FlagChoices.FOLDER_VIEW.value: "folder_view",
@@ -76,8 +79,10 @@ class MetadataView(MetadataCopyIntersectionsView):
         """Get metadata for a filtered browse group."""
         # Init
         try:
+            if response := self.get_cached_response():
+                return response
             obj = self.get_object()
             serializer = self.get_serializer(obj)
-            return Response(serializer.data)
+            return self.cache_response(Response(serializer.data))
         except Exception:
             LOG.exception(f"Getting metadata {self.kwargs}")
@@ -2,6 +2,7 @@
 
 from codex.models import Comic
 from codex.views.browser.group_mtime import BrowserGroupMtimeView
+from codex.views.const import CARD_GROUP_BY
 
 
 class BrowserOrderByView(BrowserGroupMtimeView):
@@ -50,15 +51,20 @@ class BrowserOrderByView(BrowserGroupMtimeView):
                 order_fields_head += ["bookmark_updated_at"]
         return order_fields_head
 
-    def add_order_by(self, qs, order_key="", do_reverse=True, comic_sort_names=None):
-        """Create the order_by list."""
-        order_fields_head = ()
-        if qs.model is Comic:
+    def get_order_fields(self, model, order_key="", comic_sort_names=None):
+        """Get the fields to order by, ending in a tie breaker."""
+        if model is Comic:
             order_fields_head = self._add_comic_order_by(order_key, comic_sort_names)
         else:
             order_fields_head = ["order_value"]
+            if group_by := CARD_GROUP_BY.get(model):
+                # Cards merge groups so pk isn't a stable tie breaker.
+                order_fields_head += [group_by]
+        return (*order_fields_head, "pk")
 
-        order_fields = (*order_fields_head, "pk")
+    def add_order_by(self, qs, order_key="", do_reverse=True, comic_sort_names=None):
+        """Create the order_by list."""
+        order_fields = self.get_order_fields(qs.model, order_key, comic_sort_names)
 
         prefix = "-" if do_reverse and self.params.get("order_reverse") else ""
         order_by = []
@@ -1,65 +1,225 @@
 """Browser pagination."""
 
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from decimal import Decimal
+from hashlib import sha256
 from math import ceil
+from types import MappingProxyType
 
 from django.core.paginator import EmptyPage, Paginator
+from django.db.models import F, Q
 
+from codex.choices import mapping_to_dict
 from codex.logger.logging import get_logger
+from codex.models import Comic
 from codex.views.browser.page_in_bounds import BrowserPageInBoundsView
-from codex.views.const import MAX_OBJ_PER_PAGE
+from codex.views.const import CARD_GROUP_BY, MAX_OBJ_PER_PAGE
 
 LOG = get_logger(__name__)
+# Params that change which items are on a page.
+_CURSOR_PARAM_KEYS = ("filters", "order_by", "order_reverse", "q", "show", "top_group")
+# Averages and ranks don't round trip exactly enough to seek from.
+_NO_KEYSET_ORDER_KEYS = frozenset(
+    {"age_rating", "community_rating", "critical_rating", "search_score"}
+)
+_CURSOR_VALUE_LOADERS = MappingProxyType(
+    {"datetime": datetime.fromisoformat, "date": date.fromisoformat, "decimal": Decimal}
+)
+
+
+def _dump_cursor_value(value):
+    """Tag values that json can't represent."""
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"decimal": str(value)}
+    return value
+
+
+def _load_cursor_value(value):
+    """Load tagged cursor values."""
+    if isinstance(value, dict):
+        ((kind, text),) = value.items()
+        value = _CURSOR_VALUE_LOADERS[kind](text)
+    return value
+
+
+def _get_keyset_filter(fields, values, reverse):
+    """Filter for the rows ordered after the values.
+
+    SQLite orders nulls first ascending and last descending.
+    """
+    keyset_filter = None
+    for field, value in reversed(tuple(zip(fields, values, strict=True))):
+        if value is None:
+            after = None if reverse else Q(**{f"{field}__isnull": False})
+            equal = Q(**{f"{field}__isnull": True})
+        else:
+            lookup = "lt" if reverse else "gt"
+            after = Q(**{f"{field}__{lookup}": value})
+            if reverse:
+                after |= Q(**{f"{field}__isnull": True})
+            equal = Q(**{field: value})
+        if keyset_filter is None:
+            keyset_filter = after if after is not None else Q(pk__in=())
+        elif after is None:
+            keyset_filter = equal & keyset_filter
+        else:
+            keyset_filter = after | (equal & keyset_filter)
+    return keyset_filter
 
 
 class BrowserPaginateView(BrowserPageInBoundsView):
     """Paginate Groups and Books."""
 
-    def _paginate_section(self, qs, page):
+    def __init__(self, *args, **kwargs):
+        """Initialize memoized values."""
+        super().__init__(*args, **kwargs)
+        self._use_keyset: bool | None = None
+        self.next_cursor: str | None = None
+
+    @property
+    def use_keyset(self):
+        """Memoize if pages can seek from a cursor instead of an offset."""
+        if self._use_keyset is None:
+            self._use_keyset = not (
+                self.order_key in _NO_KEYSET_ORDER_KEYS
+                or self.params.get("limit")
+                or self.get_search_limit()
+            )
+        return self._use_keyset
+
+    def _get_keyset_fields(self, model):
+        """Get the order fields that uniquely identify a row in order."""
+        fields = self.get_order_fields(model)
+        if model in CARD_GROUP_BY:
+            # Seek on the merged card key, filtering pk would drop merged groups.
+            fields = fields[:-1]
+        return tuple(dict.fromkeys(fields))
+
+    def _get_cursor_key(self):
+        """Digest the route and params a cursor is valid for."""
+        params = {key: self.params.get(key) for key in _CURSOR_PARAM_KEYS}
+        data = {
+            "group": self.kwargs.get("group"),
+            "pks": self.kwargs.get("pks"),
+            **params,
+        }
+        text = json.dumps(mapping_to_dict(data), sort_keys=True, default=str)
+        return sha256(text.encode()).hexdigest()[:16]
+
+    def _load_cursor(self, model):
+        """Get the section and keyset filter for the page's cursor."""
+        cursor = self.params.get("cursor")
+        if not cursor or not self.use_keyset:
+            return None, None
+        try:
+            page, section, key, values = json.loads(urlsafe_b64decode(cursor))
+            values = tuple(_load_cursor_value(value) for value in values)
+        except (ArithmeticError, LookupError, TypeError, ValueError) as exc:
+            LOG.debug(f"Ignoring invalid browser cursor: {exc}")
+            return None, None
+        if page != self.kwargs.get("page", 1) or key != self._get_cursor_key():
+            return None, None
+        section_model = Comic if section == "b" else model
+        fields = self._get_keyset_fields(section_model)
+        if len(fields) != len(values):
+            return None, None
+        reverse = bool(self.params.get("order_reverse"))
+        return section, _get_keyset_filter(fields, values, reverse)
+
+    def get_next_cursor(self, num_pages, order_qs, page_qs, section):
+        """Create a cursor to seek to the next page from this page's last item."""
+        if not self.use_keyset or self.kwargs.get("page", 1) >= num_pages:
+            return None
+        # Evaluates the page for the serializer.
+        last = page_qs[len(page_qs) - 1]
+        fields = self._get_keyset_fields(order_qs.model)
+        unique_field = fields[-1]
+        last_qs = order_qs.filter(**{unique_field: getattr(last, unique_field)})
+        values = last_qs.values_list(*(F(field) for field in fields)).first()
+        if values is None:
+            return None
+        page = self.kwargs.get("page", 1) + 1
+        values = [_dump_cursor_value(value) for value in values]
+        payload = (page, section, self._get_cursor_key(), values)
+        return urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    def _paginate_section(self, qs, page, count, keyset_filter=None):
         """Paginate a group or Comic section."""
         orphans = 0 if self.model_group == "f" or self.params.get("q") else 5
         paginator = Paginator(qs, MAX_OBJ_PER_PAGE, orphans=orphans)
+        # Use the count already taken instead of counting again.
+        paginator.count = count  # type: ignore
         try:
             paginator_page = paginator.page(page)
-            qs = paginator_page.object_list
+            page_count = (
+                paginator_page.end_index() - paginator_page.start_index() + 1
+                if count
+                else 0
+            )
+            if keyset_filter is None:
+                qs = paginator_page.object_list
+            else:
+                qs = qs.filter(keyset_filter)[:page_count]
         except EmptyPage:
             if self.model_group != "f":
                 model_name = qs.model.__name__ if qs.model else "UnknownGroup"
                 LOG.warning(f"No {model_name}s on page {page}")
             qs = qs.model.objects.none()
+            page_count = 0
 
-        return qs
+        return qs, page_count
 
-    def _paginate_groups(self, group_qs):
+    def _paginate_groups(self, group_qs, group_count, keyset_filter):
         """Paginate the group object list before books."""
         page = self.kwargs.get("page", 1)
-        return self._paginate_section(group_qs, page)
+        return self._paginate_section(group_qs, page, group_count, keyset_filter)
 
-    def _paginate_books(self, book_qs, total_group_count, page_group_count):
+    def _paginate_books(self, book_qs, book_count, total_group_count, keyset_filter):
         """Paginate the book object list based on how many group/folders are showing."""
+        page = self.kwargs.get("page", 1)
+        num_group_pages = ceil(total_group_count / MAX_OBJ_PER_PAGE)
+        if not book_count or page < num_group_pages:
+            # Only groups on this page
+            return book_qs.model.objects.none(), 0
+
         group_remainder = total_group_count % MAX_OBJ_PER_PAGE
         num_books_on_mixed_page = MAX_OBJ_PER_PAGE - group_remainder
-        if page_group_count:
+        if page == num_group_pages and group_remainder:
             # There are books after the groups on the same page
             # Add remainder books without the paginator
             page_book_qs = book_qs[:num_books_on_mixed_page]
+            page_book_count = min(book_count, num_books_on_mixed_page)
         else:
             # There are books after the groups on a new page
             book_offset = 0 if not group_remainder else num_books_on_mixed_page
-            page_book_qs = book_qs[book_offset:]
+            if keyset_filter is None:
+                book_qs = book_qs[book_offset:]
+            count = max(book_count - book_offset, 0)
 
             # Which book page are we on after groups?
-            page = self.kwargs.get("page", 1)
-            num_group_and_mixed_pages = ceil(total_group_count / MAX_OBJ_PER_PAGE)
-            book_only_page = page - num_group_and_mixed_pages
+            book_only_page = page - num_group_pages
 
-            page_book_qs = self._paginate_section(page_book_qs, book_only_page)
-        return page_book_qs
+            page_book_qs, page_book_count = self._paginate_section(
+                book_qs, book_only_page, count, keyset_filter
+            )
+        return page_book_qs, page_book_count
 
-    def paginate(self, group_qs, book_qs, group_count):
+    def paginate(self, group_qs, book_qs, group_count, book_count):
         """Paginate the queryset into a group and book object lists."""
-        page_group_qs = self._paginate_groups(group_qs)
-        page_group_count = page_group_qs.count()
-        page_book_qs = self._paginate_books(book_qs, group_count, page_group_count)
-        page_book_count = page_book_qs.count()
+        section, keyset_filter = self._load_cursor(group_qs.model)
+        group_filter = keyset_filter if section == "g" else None
+        book_filter = keyset_filter if section == "b" else None
+        page_group_qs, page_group_count = self._paginate_groups(
+            group_qs, group_count, group_filter
+        )
+        page_book_qs, page_book_count = self._paginate_books(
+            book_qs, book_count, group_count, book_filter
+        )
 
         return page_group_qs, page_book_qs, page_group_count, page_book_count
@@ -96,6 +96,10 @@ MODEL_REL_MAP = MappingProxyType(
         Comic: "pk",
     }
 )
+# Browser cards merge groups with the same name.
+CARD_GROUP_BY: MappingProxyType[type[BrowserGroupModel], str] = MappingProxyType(
+    {Publisher: "sort_name", Imprint: "sort_name", Series: "sort_name", Volume: "name"}
+)
 GROUP_MODEL_MAP: MappingProxyType[str, type[BrowserGroupModel] | None] = (
     MappingProxyType(
         {
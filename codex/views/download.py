@@ -1,16 +1,15 @@
 """Download a comic archive."""
 
-from pathlib import Path
-
-from django.http import FileResponse, Http404
+from django.http import Http404
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 
 from codex.models import Comic
 from codex.views.auth import AuthFilterAPIView
+from codex.views.binary import BinaryResponseMixin, FileWindow
 
 
-class DownloadView(AuthFilterAPIView):
+class DownloadView(BinaryResponseMixin, AuthFilterAPIView):
     """Return the comic archive file as an attachment."""
 
     content_type = "application/vnd.comicbook+zip"
@@ -25,15 +24,19 @@ class DownloadView(AuthFilterAPIView):
             group_acl_filter = self.get_group_acl_filter(Comic, self.request.user)
             comic = (
                 Comic.objects.filter(group_acl_filter)
-                .only("path", "file_type")
+                .only("path", "file_type", "stat", "updated_at")
                 .get(pk=pk)
             )
         except Comic.DoesNotExist as err:
             reason = f"Comic {pk} not not found."
             raise Http404(reason) from err
 
+        etag, last_modified = self.get_comic_validators(comic)
+        if response := self.get_not_modified_response(etag, last_modified):
+            return response
+
         # FileResponse requires file handle not be closed in this method.
-        comic_file = Path(comic.path).open("rb")  # noqa: SIM115
+        comic_file = FileWindow(comic.path)
         content_type = "application/"
         if comic.file_type == "PDF":
             content_type += "pdf"
@@ -43,10 +46,12 @@ class DownloadView(AuthFilterAPIView):
             content_type += "octet-stream"
 
         filename = comic.get_filename()
-        return FileResponse(
+        return self.binary_response(
             comic_file,
+            content_type,
+            etag,
+            last_modified,
             as_attachment=self._AS_ATTACHMENT,
-            content_type=content_type,
             filename=filename,
         )
 
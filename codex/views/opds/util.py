@@ -18,6 +18,9 @@ def update_href_query_params(href, old_query_params, new_query_params=None):
     """Update an href by masking query params on top of the ones it has."""
     query_params = {}
     for key, value in old_query_params.items():
+        if key == "cursor":
+            # Cursors only seek to the page they were made for.
+            continue
         # qps are sometimes encapsulated in a list for when there's multiples.
         if isinstance(value, list):
             if len(value):
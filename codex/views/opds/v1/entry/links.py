@@ -14,6 +14,7 @@ from codex.views.opds.v1.data import OPDS1Link
 from codex.views.opds.v1.entry.data import OPDS1EntryData, OPDS1EntryObject
 
 LOG = get_logger(__name__)
+_MAX_WIDTH_TEMPLATE = "{maxWidth}"
 
 
 class OPDS1EntryLinksMixin:
@@ -114,10 +115,12 @@ class OPDS1EntryLinksMixin:
         if not pk:
             return None
         kwargs = {"pk": pk, "page": 0}
-        qps = {"bookmark": 1}
+        # Clients that fill in maxWidth get downscaled pages.
+        qps = {"bookmark": 1, "width": _MAX_WIDTH_TEMPLATE}
         href = reverse("opds:bin:page", kwargs=kwargs)
         href = update_href_query_params(href, {}, qps)
         href = href.replace("0/page.jpg", "{pageNumber}/page.jpg")
+        href = href.replace(quote_plus(_MAX_WIDTH_TEMPLATE), _MAX_WIDTH_TEMPLATE)
         page = self.obj.page
         # extra stupid pse chunky fix for no metadata
         self.lazy_metadata()
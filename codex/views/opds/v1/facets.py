@@ -6,7 +6,8 @@ from typing import Any
 
 from django.urls import reverse
 
-from codex.models import AdminFlag
+from codex.admin_flags import ADMIN_FLAGS
+from codex.models import AdminFlag, Comic
 from codex.views.browser.browser import BrowserView
 from codex.views.opds.const import MimeType, Rel, UserAgentNames
 from codex.views.opds.util import get_user_agent_name, update_href_query_params
@@ -115,6 +116,13 @@ class OPDS1FacetsView(BrowserView):
             self._use_facets = self.user_agent_name in UserAgentNames.FACET_SUPPORT
         return self._use_facets
 
+    def annotate_card_aggregates(self, qs):
+        """Select book relations before the page is evaluated."""
+        qs = super().annotate_card_aggregates(qs)
+        if qs.model is Comic:
+            qs = qs.select_related("series", "volume", "language")
+        return qs
+
     @property
     def obj(self) -> MappingProxyType[str, Any]:
         """Get the browser page and serialize it for this subclass."""
@@ -122,7 +130,6 @@ class OPDS1FacetsView(BrowserView):
             group_qs, book_qs, num_pages, total_count, zero_pad, mtime = (
                 self._get_group_and_books()
             )
-            book_qs = book_qs.select_related("series", "volume", "language")
 
             title = self.get_browser_page_title()
             self._obj = MappingProxyType(
@@ -220,11 +227,7 @@ class OPDS1FacetsView(BrowserView):
         facets = []
         for facet in facet_group.facets:
             if facet.value == "f":
-                efv_flag = (
-                    AdminFlag.objects.only("on")
-                    .get(key=AdminFlag.FlagChoices.FOLDER_VIEW.value)
-                    .on
-                )
+                efv_flag = ADMIN_FLAGS.get(AdminFlag.FlagChoices.FOLDER_VIEW.value)
                 if not efv_flag:
                     continue
             if facet_obj := self._facet_or_facet_entry(facet_group, facet, entries):
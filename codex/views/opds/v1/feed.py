@@ -167,5 +167,9 @@ class OPDS1FeedView(OPDS1LinksView, OPDSTemplateView):
     @extend_schema(parameters=[input_serializer_class])
     def get(self, *_args, **_kwargs):
         """Get the feed."""
+        if response := self.get_cached_response():
+            return response
         serializer = self.get_serializer(self)
-        return Response(serializer.data, content_type=self.content_type)
+        return self.cache_response(
+            Response(serializer.data, content_type=self.content_type)
+        )
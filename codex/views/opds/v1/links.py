@@ -125,13 +125,20 @@ class OPDS1LinksView(OPDS1FacetsView):
 
         return True
 
-    def _link(self, kwargs, rel, query_params=None, mime_type=MimeType.NAV):
+    def _link(
+        self,
+        kwargs,
+        rel,
+        query_params=None,
+        mime_type=MimeType.NAV,
+        new_query_params=None,
+    ):
         """Create a link."""
         if query_params is None:
             query_params = self.request.GET
         kwargs = pop_name(kwargs)
         href = reverse("opds:v1:feed", kwargs=kwargs)
-        href = update_href_query_params(href, query_params)
+        href = update_href_query_params(href, query_params, new_query_params)
         return OPDS1Link(rel, href, mime_type)
 
     def _top_link(self, top_link):
@@ -151,7 +158,8 @@ class OPDS1LinksView(OPDS1FacetsView):
             links += [self._link(prev_route, Rel.PREV)]
         if page < self.obj.get("num_pages", 1):
             next_route = {**self.kwargs, "page": page + 1}
-            links += [self._link(next_route, Rel.NEXT)]
+            cursor = {"cursor": self.next_cursor} if self.next_cursor else None
+            links += [self._link(next_route, Rel.NEXT, new_query_params=cursor)]
         return links
 
     @property
@@ -5,6 +5,7 @@ from types import MappingProxyType
 from drf_spectacular.utils import extend_schema
 from rest_framework.response import Response
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.logger.logging import get_logger
 from codex.models import AdminFlag
 from codex.serializers.browser.settings import OPDSSettingsSerializer
@@ -67,11 +68,7 @@ class OPDS2FeedView(OPDSAuthMixin, OPDS2PublicationView):
             or getattr(link_spec, "query_param_value", None) == "f"
         ):
             # Folder perms
-            efv_flag = (
-                AdminFlag.objects.only("on")
-                .get(key=AdminFlag.FlagChoices.FOLDER_VIEW.value)
-                .on
-            )
+            efv_flag = ADMIN_FLAGS.get(AdminFlag.FlagChoices.FOLDER_VIEW.value)
             if not efv_flag:
                 return False
         return True
@@ -213,6 +210,8 @@ class OPDS2FeedView(OPDSAuthMixin, OPDS2PublicationView):
     )
     def get(self, *_args, **_kwargs):
         """Get the feed."""
+        if response := self.get_cached_response():
+            return response
         obj = self.get_object()
         serializer = self.get_serializer(obj)
-        return Response(serializer.data)
+        return self.cache_response(Response(serializer.data))
@@ -54,10 +54,10 @@ class OPDS2TopLinksView(OPDS2LinksView):
         group = "f" if self.kwargs.get("group") == "f" else "r"
         return {"group": group, "pks": (0,), "page": 1}
 
-    def _link_page(self, rel, page):
+    def _link_page(self, rel, page, query_params=None):
         """Links to a page of results."""
         kwargs = {**self.kwargs, "page": page}
-        href_data = HrefData(kwargs)
+        href_data = HrefData(kwargs, query_params)
         link_data = LinkData(rel, href_data)
         return self.link(link_data)
 
@@ -68,12 +68,13 @@ class OPDS2TopLinksView(OPDS2LinksView):
         top_link_data = LinkData(Rel.TOP, top_href_data)
         up_href_data = HrefData(up_route)
         up_link_data = LinkData(Rel.UP, up_href_data)
+        cursor = {"cursor": self.next_cursor} if self.next_cursor else None
         links_data = [
             self.link_self(),
             *self._get_static_links(),
             self._link_page("first", 1),
             self._link_page("previous", page - 1),
-            self._link_page("next", page + 1),
+            self._link_page("next", page + 1, cursor),
             self._link_page("last", self.num_pages),
             self.link(top_link_data),
         ]
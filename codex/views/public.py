@@ -3,6 +3,7 @@
 from rest_framework.generics import GenericAPIView
 from rest_framework.mixins import RetrieveModelMixin
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.choices import ADMIN_FLAG_CHOICES
 from codex.logger.logging import get_logger
 from codex.models import AdminFlag
@@ -26,9 +27,10 @@ class AdminFlagsView(GenericAPIView, RetrieveModelMixin):
     def get_object(self):
         """Get admin flags."""
         flags = {}
-        for obj in self.get_queryset():  # type: ignore
-            name = ADMIN_FLAG_CHOICES[obj.key].lower().replace(" ", "_")
-            flags[name] = obj.on
+        for key, on in ADMIN_FLAGS.get_flags().items():
+            if key in _ADMIN_FLAG_KEYS:
+                name = ADMIN_FLAG_CHOICES[key].lower().replace(" ", "_")
+                flags[name] = on
         return flags
 
     def get(self, request, *args, **kwargs):
@@ -0,0 +1,138 @@
+"""Pool of open comic archives for the reader."""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from zipfile import BadZipFile
+
+from comicbox.box import Comicbox
+from comicbox.exceptions import UnsupportedArchiveTypeError
+from rarfile import BadRarFile
+
+from codex.settings.settings import READER_ARCHIVE_POOL_SIZE
+
+# Errors reading unreadable or missing archives.
+ARCHIVE_EXCEPTIONS = (UnsupportedArchiveTypeError, BadRarFile, BadZipFile, OSError)
+
+
+class _PooledArchive:
+    """An archive in the pool and the requests using it."""
+
+    __slots__ = ("cb", "evicted", "lock", "users")
+
+    def __init__(self):
+        """Initialize an archive that is opened on first use."""
+        self.cb: Comicbox | None = None
+        self.lock = Lock()
+        self.users = 0
+        self.evicted = False
+
+    def close(self):
+        """Close the archive."""
+        if self.cb:
+            self.cb.close()
+            self.cb = None
+
+
+class ComicArchivePool:
+    """Bounded LRU pool of open comic archives keyed by path and mtime.
+
+    Each archive is used by one request at a time. Reusing an open archive
+    skips re-reading the zip central directory or rar headers and
+    re-sorting the page list on every page turn. Evicted archives are
+    closed when the last request using them is done.
+    """
+
+    def __init__(self, size):
+        """Initialize the pool."""
+        self._size = size
+        self._archives: OrderedDict[tuple, _PooledArchive] = OrderedDict()
+        self._path_keys: dict[str, tuple] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(path):
+        """Get the key that identifies a version of the comic."""
+        stat = Path(path).stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def _evict(self, key, closing):
+        """Remove an archive from the pool. Call with the pool lock held."""
+        entry = self._archives.pop(key, None)
+        if self._path_keys.get(key[0]) == key:
+            del self._path_keys[key[0]]
+        if entry is None:
+            return
+        entry.evicted = True
+        if not entry.users:
+            closing.append(entry)
+
+    def _checkout(self, key):
+        """Get the pool entry for the key and count this request as a user."""
+        closing = []
+        with self._lock:
+            entry = self._archives.get(key)
+            if entry is None:
+                old_key = self._path_keys.get(key[0])
+                if old_key:
+                    # The comic changed on disk.
+                    self._evict(old_key, closing)
+                entry = _PooledArchive()
+                self._archives[key] = entry
+                self._path_keys[key[0]] = key
+            entry.users += 1
+            self._archives.move_to_end(key)
+            while len(self._archives) > self._size:
+                self._evict(next(iter(self._archives)), closing)
+        for old_entry in closing:
+            old_entry.close()
+        return entry
+
+    def _checkin(self, key, entry, discard=False):
+        """Release the request's use of the entry, closing it if it was evicted."""
+        closing = []
+        with self._lock:
+            entry.users -= 1
+            if discard and self._archives.get(key) is entry:
+                self._evict(key, closing)
+            elif entry.evicted and not entry.users:
+                closing.append(entry)
+        for old_entry in closing:
+            old_entry.close()
+
+    def discard(self, path):
+        """Forget any open archive for the path."""
+        closing = []
+        with self._lock:
+            if key := self._path_keys.get(str(path)):
+                self._evict(key, closing)
+        for entry in closing:
+            entry.close()
+
+    @contextmanager
+    def open(self, path):
+        """Yield an open Comicbox for the path."""
+        if self._size <= 0:
+            with Comicbox(path) as cb:
+                yield cb
+            return
+        key = self.get_key(path)
+        entry = self._checkout(key)
+        discard = False
+        try:
+            with entry.lock:
+                if entry.cb is None:
+                    cb = Comicbox(key[0])
+                    cb.__enter__()
+                    entry.cb = cb
+                yield entry.cb
+        except Exception:
+            # Don't reuse an archive in an unknown state.
+            discard = True
+            raise
+        finally:
+            self._checkin(key, entry, discard)
+
+
+COMIC_ARCHIVE_POOL = ComicArchivePool(READER_ARCHIVE_POOL_SIZE)
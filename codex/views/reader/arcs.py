@@ -1,5 +1,6 @@
 """Reader get Arcs methods."""
 
+from codex.admin_flags import ADMIN_FLAGS
 from codex.models import AdminFlag
 from codex.util import max_none
 from codex.views.const import (
@@ -39,12 +40,10 @@ class ReaderArcsView(ReaderBooksView):
 
     def _get_folder_arc(self, book, browser_arc_group, arcs, max_mtime):
         """Append the folder arc."""
-        efv_flag = (
-            AdminFlag.objects.only("on")
-            .get(key=AdminFlag.FlagChoices.FOLDER_VIEW.value)
-            .on
-        )
-        if not efv_flag or browser_arc_group == FOLDER_GROUP:
+        if browser_arc_group == FOLDER_GROUP:
+            return max_mtime
+        efv_flag = ADMIN_FLAGS.get(AdminFlag.FlagChoices.FOLDER_VIEW.value)
+        if not efv_flag:
             return max_mtime
 
         folder = book.parent_folder
@@ -65,7 +64,12 @@ class ReaderArcsView(ReaderBooksView):
         else:
             browser_arc_pks = frozenset()
 
-        for san in book.story_arc_numbers.all().order_by("story_arc__name"):
+        story_arc_numbers = (
+            book.story_arc_numbers.select_related("story_arc")
+            .only("story_arc__name", "story_arc__updated_at")
+            .order_by("story_arc__name")
+        )
+        for san in story_arc_numbers:
             sa = san.story_arc
             if not browser_arc_pks or sa.pk not in browser_arc_pks:
                 arc = {
@@ -2,7 +2,8 @@
 
 from typing import TYPE_CHECKING
 
-from django.db.models import F
+from django.db.models import Count, F, Window
+from django.db.models.functions import Lag, Lead, RowNumber
 from django.db.models.query import Q
 
 from codex.models import Bookmark, Comic
@@ -26,12 +27,18 @@ _COMIC_FIELDS = (
     "file_type",
     "issue_number",
     "issue_suffix",
+    "name",
     "page_count",
+    "parent_folder",
+    "path",
     "series",
     "volume",
     "reading_direction",
     "updated_at",
 )
+_BOOK_KEYS = ("prev", "current", "next")
+# Arc groups of the current book are read without further queries.
+_BOOK_SELECT_RELATED = ("parent_folder", "series", "volume")
 
 
 class ReaderBooksView(
@@ -104,7 +111,6 @@ class ReaderBooksView(
             arc_group = "s"
 
         rel = GROUP_RELATION[arc_group]
-        fields = _COMIC_FIELDS
         arc_pk_rel = rel + "__pk"
         arc_index = NONE_INTEGERFIELD
         arc_pk_select_related = (rel,)
@@ -118,7 +124,6 @@ class ReaderBooksView(
             prefetch_related = (*prefetch_related, rel)
             ordering = ("arc_index", "date", "pk")
         elif arc_group == FOLDER_GROUP:
-            fields = (*_COMIC_FIELDS, rel)
             select_related = (rel,)
             ordering = ("path", "pk")
 
@@ -133,7 +138,7 @@ class ReaderBooksView(
             qs = qs.select_related(*select_related)
         if prefetch_related:
             qs = qs.prefetch_related(*prefetch_related)
-        qs = qs.only(*fields)
+        qs = qs.only(*_COMIC_FIELDS)
         qs = self.annotate_group_names(qs)
         qs = qs.annotate(
             issue_count=F("volume__issue_count"),
@@ -147,51 +152,73 @@ class ReaderBooksView(
         if sort_names_alias:
             qs = qs.alias(**sort_names_alias)
         qs = qs.order_by(*ordering)
-        return qs, arc_group
-
-    def _append_with_settings(self, book, bookmark_filter):
-        """Append bookmark to book list."""
-        book.settings = (
-            Bookmark.objects.filter(**bookmark_filter, comic=book)
-            .only(*_SETTINGS_ATTRS)
-            .first()
+        return qs, arc_group, ordering
+
+    def _get_comics_window(self, comics, ordering):
+        """Get the current comic's position and neighbors in the arc in one query."""
+        pk = self.kwargs.get("pk")
+        window_qs = comics.annotate(
+            arc_row=Window(RowNumber(), order_by=ordering),
+            prev_pk=Window(Lag("pk"), order_by=ordering),
+            next_pk=Window(Lead("pk"), order_by=ordering),
+            arc_count=Window(Count("pk")),
+        )
+        # Filtering on window annotations happens after the window is computed.
+        window_qs = window_qs.filter(Q(pk=pk) | Q(prev_pk=pk) | Q(next_pk=pk))
+        window_qs = window_qs.values_list(
+            "pk", "arc_row", "prev_pk", "next_pk", "arc_count"
+        )
+        # A comic may be in the arc more than once. Use the first.
+        return min(
+            (row for row in window_qs if row[0] == pk),
+            key=lambda row: row[1],
+            default=None,
         )
-        return book
+
+    def _set_settings(self, books):
+        """Set each book's bookmark settings in one query."""
+        auth_filter = self.get_bookmark_auth_filter()
+        bookmark_filter = self.get_bookmark_search_kwargs(auth_filter)
+        bookmarks = Bookmark.objects.filter(
+            **bookmark_filter, comic__in=books.values()
+        ).only("comic", *_SETTINGS_ATTRS)
+        settings = {bookmark.comic_id: bookmark for bookmark in bookmarks}  # type: ignore
+        for book in books.values():
+            book.settings = settings.get(book.pk)
 
     def get_book_collection(self):
         """Get the -1, +1 window around the current issue.
 
-        Uses iteration in python. There are some complicated ways of
-        doing this with __gt[0] & __lt[0] in the db, but I think they
-        might be even more expensive.
-
         Yields 1 to 3 books
         """
-        comics, arc_group = self._get_comics_list()
-        auth_filter = self.get_bookmark_auth_filter()
-        bookmark_filter = self.get_bookmark_search_kwargs(auth_filter)
+        comics, arc_group, ordering = self._get_comics_list()
+        window = self._get_comics_window(comics, ordering)
+        if not window:
+            return {}
+        pk, arc_row, prev_pk, next_pk, arc_count = window
+        book_pks = {
+            key: value
+            for key, value in zip(_BOOK_KEYS, (prev_pk, pk, next_pk), strict=True)
+            if value
+        }
+        comics_by_pk = {}
+        book_qs = comics.filter(pk__in=book_pks.values()).select_related(
+            *_BOOK_SELECT_RELATED
+        )
+        for comic in book_qs:
+            comics_by_pk.setdefault(comic.pk, comic)
+
         books = {}
-        prev_book = None
-        pk = self.kwargs.get("pk")
-        for index, book in enumerate(comics):
-            if books:
-                # after match set next comic and break
-                books["next"] = self._append_with_settings(book, bookmark_filter)
-                break
-            if book.pk == pk:
-                # first match. set previous and current comic
-                if prev_book:
-                    books["prev"] = self._append_with_settings(
-                        prev_book, bookmark_filter
-                    )
+        for key, book_pk in book_pks.items():
+            book = comics_by_pk.get(book_pk)
+            if not book:
+                continue
+            if key == "current":
                 # create extra current book attrs:
-                if book.arc_index is None:
-                    book.arc_index = index + 1
+                book.arc_index = arc_row
                 book.filename = book.get_filename()
                 book.arc_group = arc_group
-                book.arc_count = comics.count()
-                books["current"] = self._append_with_settings(book, bookmark_filter)
-            else:
-                # Haven't matched yet, so set the previous comic
-                prev_book = book
+                book.arc_count = arc_count
+            books[key] = book
+        self._set_settings(books)
         return books
@@ -0,0 +1,94 @@
+"""Size bounded disk cache of reader page images."""
+
+import os
+from contextlib import suppress
+from hashlib import blake2b
+from pathlib import Path
+from threading import Lock
+
+from codex.logger.logging import get_logger
+
+LOG = get_logger(__name__)
+
+
+class DiskPageCache:
+    """Least recently used disk cache bounded by total size."""
+
+    def __init__(self, root, max_bytes):
+        """Initialize the cache."""
+        self._root = root
+        self._max_bytes = max_bytes
+        self._size: int | None = None
+        self._size_lock = Lock()
+
+    def _get_path(self, key):
+        """Get the cache entry path for a key."""
+        digest = blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        return self._root / digest[:2] / digest
+
+    def _scan(self):
+        """Get all cache entries with their last use time and size."""
+        entries = []
+        if not self._root.is_dir():
+            return entries
+        for cache_dir in os.scandir(self._root):
+            if not cache_dir.is_dir():
+                continue
+            for entry in os.scandir(cache_dir.path):
+                with suppress(FileNotFoundError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        """Remove the least recently used entries until under the limit."""
+        entries = sorted(self._scan())
+        size = sum(entry[1] for entry in entries)
+        target = self._max_bytes * 0.9
+        count = 0
+        for _, entry_size, entry_path in entries:
+            if size <= target:
+                break
+            with suppress(FileNotFoundError):
+                Path(entry_path).unlink()
+                count += 1
+            size -= entry_size
+        LOG.debug(f"Evicted {count} entries from {self._root}.")
+        return size
+
+    def _add_size(self, size):
+        """Account for a new entry and evict if over the limit."""
+        with self._size_lock:
+            if self._size is None:
+                self._size = sum(entry[1] for entry in self._scan())
+            else:
+                self._size += size
+            if self._size > self._max_bytes:
+                self._size = self._evict()
+
+    def get_cached(self, key):
+        """Get cached data or None if it isn't cached."""
+        if self._max_bytes <= 0:
+            return None
+        cache_path = self._get_path(key)
+        try:
+            data = cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # mtime records recent use for eviction.
+        cache_path.touch()
+        return data
+
+    def set_cached(self, key, data):
+        """Atomically write data to the cache."""
+        if self._max_bytes <= 0:
+            return
+        cache_path = self._get_path(key)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(cache_path)
+            self._add_size(len(data))
+        except OSError as exc:
+            LOG.warning(f"Saving to {self._root}: {exc}")
@@ -1,9 +1,6 @@
 """Views for reading comic books."""
 
-from io import BytesIO
-
-from comicbox.box import Comicbox
-from django.http.response import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.exceptions import NotFound
@@ -14,14 +11,27 @@ from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.logger.logging import get_logger
 from codex.models.comic import Comic, FileType
 from codex.settings.settings import FALSY
+from codex.views.binary import BinaryResponseMixin
 from codex.views.bookmark import BookmarkBaseView
-from codex.views.util import chunker
+from codex.views.reader.archives import ARCHIVE_EXCEPTIONS
+from codex.views.reader.pages import READER_PAGE_CACHE
+from codex.views.reader.pdf import PDF_EXCEPTIONS
+from codex.views.reader.renditions import (
+    PAGE_RENDITION_CACHE,
+    RENDITION_EXCEPTIONS,
+    RenditionParams,
+)
 
 LOG = get_logger(__name__)
 _PDF_MIME_TYPE = "application/pdf"
-# Most pages seem to be 2.5 Mb
-# largest pages I've seen were 9 Mb
-_PAGE_CHUNK_SIZE = (1024**2) * 3  # 3 Mb
+# Errors reading missing or unreadable pages.
+_PAGE_EXCEPTIONS = (
+    *ARCHIVE_EXCEPTIONS,
+    *PDF_EXCEPTIONS,
+    IndexError,
+    KeyError,
+    ValueError,
+)
 
 
 class IgnoreClientContentNegotiation(BaseContentNegotiation):
@@ -42,19 +52,23 @@ class IgnoreClientContentNegotiation(BaseContentNegotiation):
         return (renderer, renderer.media_type)
 
 
-class ReaderPageView(BookmarkBaseView):
+class ReaderPageView(BinaryResponseMixin, BookmarkBaseView):
     """Display a comic page from the archive itself."""
 
     X_MOZ_PRE_HEADERS = frozenset({"prefetch", "preload", "prerender", "subresource"})
     content_type = "image/jpeg"
     content_negotiation_class = IgnoreClientContentNegotiation  # type: ignore
 
+    def _is_prefetch(self):
+        """Is this a speculative browser prefetch instead of a page view."""
+        headers = self.request.headers
+        return headers.get("X-moz") in self.X_MOZ_PRE_HEADERS or headers.get(
+            "Sec-Purpose", ""
+        ).startswith("prefetch")
+
     def _update_bookmark(self):
         """Update the bookmark if the bookmark param was passed."""
-        do_bookmark = bool(
-            self.request.GET.get("bookmark")
-            and self.request.headers.get("X-moz") not in self.X_MOZ_PRE_HEADERS
-        )
+        do_bookmark = bool(self.request.GET.get("bookmark") and not self._is_prefetch())
         if not do_bookmark:
             return
 
@@ -67,22 +81,85 @@ class ReaderPageView(BookmarkBaseView):
         task = BookmarkUpdateTask(auth_filter, comic_filter, updates)
         LIBRARIAN_QUEUE.put(task)
 
-    def _get_page_image(self):
-        """Get the image data and content type."""
+    def _get_int_param(self, key):
+        """Get a positive integer query param or None."""
+        try:
+            value = int(self.request.GET.get(key, ""))
+        except ValueError:
+            return None
+        return value if value > 0 else None
+
+    def _get_rendition_params(self):
+        """Get the requested rendition width, quality and format."""
+        width = self._get_int_param("width")
+        if not width:
+            return None
+        width = PAGE_RENDITION_CACHE.get_width(width)
+        quality = PAGE_RENDITION_CACHE.get_quality(self._get_int_param("quality"))
+        accept = self.request.headers.get("Accept", "")
+        image_format = "WEBP" if "image/webp" in accept else "JPEG"
+        return RenditionParams(width, quality, image_format)
+
+    def _get_rendition(self, comic, page, to_pixmap, rendition_params):
+        """Get a downscaled page if a width was requested."""
+        if not rendition_params:
+            return None, None
+        try:
+            rendition = PAGE_RENDITION_CACHE.get_rendition(
+                comic.path, page, rendition_params, to_pixmap
+            )
+        except FileNotFoundError:
+            raise
+        except RENDITION_EXCEPTIONS as exc:
+            LOG.warning(f"Downscaling {comic.path} page {page}: {exc}")
+            rendition = None
+        if not rendition:
+            return None, None
+        content_type = PAGE_RENDITION_CACHE.get_content_type(
+            rendition_params.image_format
+        )
+        return rendition, content_type
+
+    def _get_comic(self):
+        """Get the comic for the page."""
         group_acl_filter = self.get_group_acl_filter(Comic, self.request.user)
         pk = self.kwargs.get("pk")
-        comic = Comic.objects.filter(group_acl_filter).only("path").get(pk=pk)
+        return (
+            Comic.objects.filter(group_acl_filter)
+            .only("path", "file_type", "page_count", "stat", "updated_at")
+            .get(pk=pk)
+        )
+
+    def _get_to_pixmap(self):
+        """Get whether pdf pages should be rasterized."""
+        return self.request.GET.get("pixmap", "").lower() not in FALSY
+
+    def _get_page_image(self, comic, rendition_params):
+        """Get the image data and content type."""
         page = self.kwargs.get("page")
-        to_pixmap = self.request.GET.get("pixmap", "").lower() not in FALSY
+        to_pixmap = self._get_to_pixmap()
         if comic.file_type == FileType.PDF.value and not to_pixmap:
             content_type = _PDF_MIME_TYPE
         else:
             content_type = self.content_type
 
-        with Comicbox(comic.path) as cb:
-            page_image = cb.get_page_by_index(page, to_pixmap=to_pixmap)
-        if not page_image:
-            page_image = b""
+        page_image = None
+        if content_type != _PDF_MIME_TYPE:
+            page_image, rendition_content_type = self._get_rendition(
+                comic, page, to_pixmap, rendition_params
+            )
+            if page_image:
+                content_type = rendition_content_type
+        if (
+            page_image is None
+            and not to_pixmap
+            and comic.file_type != FileType.PDF.value
+        ):
+            page_image = READER_PAGE_CACHE.get_stored_page(comic.path, page, comic.pk)
+        if page_image is None:
+            page_image = READER_PAGE_CACHE.read_page(comic.path, page, to_pixmap)
+        if not self._is_prefetch():
+            READER_PAGE_CACHE.read_ahead(comic.path, page, comic.page_count, to_pixmap)
 
         return page_image, content_type
 
@@ -90,6 +167,8 @@ class ReaderPageView(BookmarkBaseView):
         parameters=[
             OpenApiParameter("bookmark", OpenApiTypes.BOOL, default=True),
             OpenApiParameter("pixmap", OpenApiTypes.BOOL, default=False),
+            OpenApiParameter("width", OpenApiTypes.INT, required=False),
+            OpenApiParameter("quality", OpenApiTypes.INT, required=False),
         ],
         responses={
             (200, content_type): OpenApiTypes.BINARY,
@@ -99,8 +178,19 @@ class ReaderPageView(BookmarkBaseView):
     def get(self, *_args, **_kwargs):
         """Get the comic page from the archive."""
         try:
-            page_image, content_type = self._get_page_image()
+            comic = self._get_comic()
+            rendition_params = self._get_rendition_params()
+            page = self.kwargs.get("page")
+            etag, last_modified = self.get_comic_validators(
+                comic, page, self._get_to_pixmap(), rendition_params
+            )
             self._update_bookmark()
+            response = self.get_not_modified_response(etag, last_modified)
+            if not response:
+                page_image, content_type = self._get_page_image(comic, rendition_params)
+                response = self.binary_response(
+                    page_image, content_type, etag, last_modified
+                )
         except Comic.DoesNotExist as exc:
             pk = self.kwargs.get("pk")
             detail = f"comic {pk} not found in db."
@@ -109,9 +199,10 @@ class ReaderPageView(BookmarkBaseView):
             pk = self.kwargs.get("pk")
             detail = f"comic path for {pk} not found: {exc}."
             raise NotFound(detail=detail) from exc
-        except Exception as exc:
+        except _PAGE_EXCEPTIONS as exc:
             LOG.warning(exc)
             raise NotFound(detail="comic page not found") from exc
-        else:
-            page_chunker = chunker(BytesIO(page_image), _PAGE_CHUNK_SIZE)
-            return StreamingHttpResponse(page_chunker, content_type=content_type)
+        if rendition_params:
+            # The rendition format depends on the Accept header.
+            patch_vary_headers(response, ("Accept",))
+        return response
@@ -0,0 +1,255 @@
+"""In memory cache of decompressed reader pages with read ahead."""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from struct import Struct
+from threading import Lock
+from zipfile import ZIP_STORED, ZipInfo
+
+from codex.logger.logging import get_logger
+from codex.models.comic import ComicPageIndex
+from codex.settings.settings import READER_PAGE_CACHE_MB, READER_READ_AHEAD
+from codex.views.binary import FileWindow
+from codex.views.reader.archives import ARCHIVE_EXCEPTIONS, COMIC_ARCHIVE_POOL
+from codex.views.reader.pdf import PDF_EXCEPTIONS, PDF_PAGE_CACHE
+
+LOG = get_logger(__name__)
+_LOCAL_HEADER = Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_LOCAL_HEADER_FLAGS_INDEX = 3
+_LOCAL_HEADER_COMPRESSION_INDEX = 4
+_LOCAL_HEADER_FILE_SIZE_INDEX = 9
+_LOCAL_HEADER_NAME_LENGTH_INDEX = 10
+_ENCRYPTED_FLAG = 0x1
+_DATA_DESCRIPTOR_FLAG = 0x8
+_UTF8_FLAG = 0x800
+_MAX_MEMBER_SPAN_ARCHIVES = 64
+
+
+class StoredMemberFile(FileWindow):
+    """Read only file window onto an uncompressed zip member."""
+
+    def __init__(self, path, start, length, name):
+        """Remember the member to check against its local header."""
+        self._name = name
+        self._member_length = length
+        super().__init__(path, start, length)
+
+    def _is_member(self, header):
+        """Check the local header is for this uncompressed member."""
+        flags = header[_LOCAL_HEADER_FLAGS_INDEX]
+        if (
+            header[0] != _LOCAL_HEADER_SIGNATURE
+            or flags & _ENCRYPTED_FLAG
+            or header[_LOCAL_HEADER_COMPRESSION_INDEX] != ZIP_STORED
+        ):
+            return False
+        if (
+            not flags & _DATA_DESCRIPTOR_FLAG
+            and header[_LOCAL_HEADER_FILE_SIZE_INDEX] != self._member_length
+        ):
+            return False
+        name_length = header[_LOCAL_HEADER_NAME_LENGTH_INDEX]
+        encoding = "utf-8" if flags & _UTF8_FLAG else "cp437"
+        name = self._file.read(name_length).decode(encoding, errors="replace")
+        return name == self._name
+
+    def _find_start(self, start):
+        """Find the member data after its local header."""
+        self._file.seek(start)
+        header = _LOCAL_HEADER.unpack(self._file.read(_LOCAL_HEADER.size))
+        if not self._is_member(header):
+            reason = f"No stored zip member {self._name} at {start} in {self._path}"
+            raise ValueError(reason)
+        name_length, extra_length = header[_LOCAL_HEADER_NAME_LENGTH_INDEX:]
+        return start + _LOCAL_HEADER.size + name_length + extra_length
+
+
+class ReaderPageCache:
+    """Bounded LRU cache of page images that reads upcoming pages ahead."""
+
+    def __init__(self, max_bytes, read_ahead):
+        """Initialize the cache."""
+        self._max_bytes = max_bytes
+        self._read_ahead = read_ahead if max_bytes > 0 else 0
+        self._pages: OrderedDict[tuple, bytes] = OrderedDict()
+        self._size = 0
+        self._pending: set[tuple] = set()
+        self._member_spans: OrderedDict[tuple, tuple] = OrderedDict()
+        self._lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get(self, key):
+        with self._lock:
+            data = self._pages.get(key)
+            if data is not None:
+                self._pages.move_to_end(key)
+            return data
+
+    def _put(self, key, data):
+        size = len(data)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._pages:
+                return
+            self._pages[key] = data
+            self._size += size
+            while self._size > self._max_bytes:
+                _, old_data = self._pages.popitem(last=False)
+                self._size -= len(old_data)
+
+    def _read_page(self, path, key, index, to_pixmap):
+        """Read a page from the archive unless another thread just cached it."""
+        if to_pixmap:
+            data = PDF_PAGE_CACHE.read_page(path, index)
+            self._put(key, data)
+            return data
+        with COMIC_ARCHIVE_POOL.open(path) as cb:
+            data = self._get(key)
+            if data is None:
+                data = cb.get_page_by_index(index, to_pixmap=to_pixmap) or b""
+                self._put(key, data)
+        return data
+
+    def read_page(self, path, index, to_pixmap=False):
+        """Get a page image from the cache or the archive."""
+        key = (*COMIC_ARCHIVE_POOL.get_key(path), index, to_pixmap)
+        data = self._get(key)
+        if data is None:
+            data = self._read_page(path, key, index, to_pixmap)
+        return data
+
+    @staticmethod
+    def _get_member_span(info):
+        """Get the local header offset, size and name of an uncompressed member."""
+        if (
+            isinstance(info, ZipInfo)
+            and info.compress_type == ZIP_STORED
+            and not info.flag_bits & _ENCRYPTED_FLAG
+            and info.compress_size == info.file_size
+        ):
+            return (info.header_offset, info.file_size, info.filename)
+        return None
+
+    @staticmethod
+    def _get_indexed_member_spans(pk, size):
+        """Get the spans of every page from the import page index."""
+        pages = (
+            ComicPageIndex.objects.filter(comic_id=pk, size=size)
+            .values_list("pages", flat=True)
+            .first()
+        )
+        if not pages:
+            return None
+        spans = []
+        for page in pages:
+            header_offset = page[ComicPageIndex.HEADER_OFFSET]
+            if (
+                header_offset is not None
+                and page[ComicPageIndex.COMPRESS_TYPE] == ZIP_STORED
+                and page[ComicPageIndex.COMPRESS_SIZE] == page[ComicPageIndex.FILE_SIZE]
+            ):
+                spans.append(
+                    (
+                        header_offset,
+                        page[ComicPageIndex.FILE_SIZE],
+                        page[ComicPageIndex.NAME],
+                    )
+                )
+            else:
+                spans.append(None)
+        return tuple(spans)
+
+    def _read_member_spans(self, path):
+        """Read the spans of every page in the archive."""
+        with COMIC_ARCHIVE_POOL.open(path) as cb:
+            infos = {info.filename: info for info in cb.infolist()}
+            return tuple(
+                self._get_member_span(infos.get(pagename))
+                for pagename in cb.get_page_filenames()
+            )
+
+    def _set_member_spans(self, archive_key, spans, indexed):
+        """Remember the spans of an archive's pages."""
+        with self._lock:
+            self._member_spans[archive_key] = (spans, indexed)
+            self._member_spans.move_to_end(archive_key)
+            while len(self._member_spans) > _MAX_MEMBER_SPAN_ARCHIVES:
+                self._member_spans.popitem(last=False)
+
+    def get_stored_page(self, path, index, pk=None):
+        """Get a file window onto the page if it is stored uncompressed."""
+        archive_key = COMIC_ARCHIVE_POOL.get_key(path)
+        with self._lock:
+            spans, indexed = self._member_spans.get(archive_key, (None, False))
+            if spans is not None:
+                self._member_spans.move_to_end(archive_key)
+        if spans is None:
+            if pk is not None:
+                spans = self._get_indexed_member_spans(pk, archive_key[2])
+                indexed = spans is not None
+            if spans is None:
+                spans = self._read_member_spans(path)
+            self._set_member_spans(archive_key, spans, indexed)
+        span = spans[index] if 0 <= index < len(spans) else None
+        if not span:
+            return None
+        try:
+            return StoredMemberFile(path, *span)
+        except ValueError as exc:
+            # The index is stale or the member isn't really stored.
+            LOG.debug(exc)
+            spans = self._read_member_spans(path) if indexed else ()
+            self._set_member_spans(archive_key, spans, False)
+            return None
+
+    def _read_ahead_pages(self, path, index, page_count, to_pixmap):
+        """Cache the pages after index."""
+        try:
+            archive_key = COMIC_ARCHIVE_POOL.get_key(path)
+            if not page_count:
+                with COMIC_ARCHIVE_POOL.open(path) as cb:
+                    page_count = cb.get_page_count()
+            last_page = min(index + self._read_ahead, page_count - 1)
+            spans, _ = (
+                ((), False)
+                if to_pixmap
+                else self._member_spans.get(archive_key, ((), False))
+            )
+            for page in range(index + 1, last_page + 1):
+                if page < len(spans) and spans[page]:
+                    # Stored pages are served straight from the archive file.
+                    continue
+                key = (*archive_key, page, to_pixmap)
+                if self._get(key) is None:
+                    # Open per page so requests aren't blocked for the whole run.
+                    self._read_page(path, key, page, to_pixmap)
+        except (*ARCHIVE_EXCEPTIONS, *PDF_EXCEPTIONS) as exc:
+            LOG.debug(f"Reading ahead {path} from page {index}: {exc}")
+        except Exception:
+            # Nothing waits on the future, so log what would be lost with it.
+            LOG.exception(f"Reading ahead {path} from page {index}")
+        finally:
+            with self._lock:
+                self._pending.discard((str(path), index, to_pixmap))
+
+    def read_ahead(self, path, index, page_count, to_pixmap=False):
+        """Cache the next pages in the background."""
+        if self._read_ahead <= 0:
+            return
+        job = (str(path), index, to_pixmap)
+        with self._lock:
+            if job in self._pending:
+                return
+            self._pending.add(job)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="reader-read-ahead"
+                )
+        self._executor.submit(
+            self._read_ahead_pages, path, index, page_count, to_pixmap
+        )
+
+
+READER_PAGE_CACHE = ReaderPageCache(READER_PAGE_CACHE_MB * 1024**2, READER_READ_AHEAD)
@@ -0,0 +1,58 @@
+"""Rasterized pdf pages cached on disk."""
+
+from threading import Lock
+
+from codex.settings.settings import READER_PDF_CACHE_MB, READER_PDF_DPI, ROOT_CACHE_PATH
+from codex.views.reader.archives import COMIC_ARCHIVE_POOL
+from codex.views.reader.disk_cache import DiskPageCache
+
+try:
+    import pymupdf
+
+    # Errors rendering unreadable pdfs.
+    PDF_EXCEPTIONS = (RuntimeError, pymupdf.mupdf.FzErrorBase)
+except ImportError:
+    pymupdf = None
+    PDF_EXCEPTIONS = (RuntimeError,)
+
+PDF_PAGES_ROOT = ROOT_CACHE_PATH / "pdf_pages"
+_JPEG_QUALITY = 90
+_PDF_SUFFIX = ".pdf"
+
+
+class PdfPageCache(DiskPageCache):
+    """Disk cache of pdf pages rasterized at a fixed dpi."""
+
+    def __init__(self, root, max_bytes, dpi):
+        """Initialize the cache."""
+        super().__init__(root, max_bytes)
+        self._dpi = dpi
+        # Mupdf isn't thread safe.
+        self._render_lock = Lock()
+
+    def _rasterize(self, path, key, index):
+        """Render a pdf page unless another thread just rendered it."""
+        with self._render_lock:
+            data = self.get_cached(key)
+            if data is None:
+                with pymupdf.open(path) as doc:  # type: ignore
+                    pixmap = doc[index].get_pixmap(dpi=self._dpi)
+                    data = pixmap.tobytes("jpeg", jpg_quality=_JPEG_QUALITY)
+                self.set_cached(key, data)
+        return data
+
+    def read_page(self, path, index):
+        """Get a rasterized page from the cache or render it."""
+        if pymupdf is None or not str(path).lower().endswith(_PDF_SUFFIX):
+            with COMIC_ARCHIVE_POOL.open(path) as cb:
+                return cb.get_page_by_index(index, to_pixmap=True) or b""
+        key = (*COMIC_ARCHIVE_POOL.get_key(path), index, self._dpi)
+        data = self.get_cached(key)
+        if data is None:
+            data = self._rasterize(path, key, index)
+        return data
+
+
+PDF_PAGE_CACHE = PdfPageCache(
+    PDF_PAGES_ROOT, READER_PDF_CACHE_MB * 1024**2, READER_PDF_DPI
+)
@@ -9,6 +9,7 @@ from rest_framework.response import Response
 from codex.librarian.importer.tasks import LazyImportComicsTask
 from codex.librarian.mp_queue import LIBRARIAN_QUEUE
 from codex.logger.logging import get_logger
+from codex.models.comic import ComicPageIndex
 from codex.serializers.reader import ReaderComicsSerializer, ReaderViewInputSerializer
 from codex.serializers.redirect import ReaderRedirectSerializer
 from codex.views.reader.arcs import ReaderArcsView
@@ -58,6 +59,23 @@ class ReaderView(ReaderArcsView):
             task = LazyImportComicsTask(frozenset(import_pks))
             LIBRARIAN_QUEUE.put(task)
 
+    @staticmethod
+    def _get_page_dims(current):
+        """Get page dimensions from the import page index for layout."""
+        pages = (
+            ComicPageIndex.objects.filter(comic_id=current.pk)
+            .values_list("pages", flat=True)
+            .first()
+        )
+        if not pages:
+            return ()
+        return tuple(
+            (page[ComicPageIndex.WIDTH], page[ComicPageIndex.HEIGHT])
+            if page[ComicPageIndex.WIDTH]
+            else None
+            for page in pages
+        )
+
     def get_object(self):  # type: ignore
         """Get the previous and next comics in a group or story arc."""
         # Books
@@ -70,6 +88,7 @@ class ReaderView(ReaderArcsView):
         prev_book = books.get("prev")
         next_book = books.get("next")
         self._lazy_metadata(current, prev_book, next_book)
+        current.page_dims = self._get_page_dims(current)  # type: ignore
 
         books = {
             "current": current,
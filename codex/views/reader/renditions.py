@@ -0,0 +1,102 @@
+"""Downscaled reader page renditions cached on disk."""
+
+from io import BytesIO
+from typing import NamedTuple
+
+from PIL import Image
+
+from codex.settings.settings import READER_RENDITION_CACHE_MB, ROOT_CACHE_PATH
+from codex.views.reader.archives import ARCHIVE_EXCEPTIONS, COMIC_ARCHIVE_POOL
+from codex.views.reader.disk_cache import DiskPageCache
+from codex.views.reader.pages import READER_PAGE_CACHE
+from codex.views.reader.pdf import PDF_EXCEPTIONS
+
+RENDITIONS_ROOT = ROOT_CACHE_PATH / "renditions"
+# Widths are rounded up to limit the number of renditions per page.
+_WIDTH_STEP = 64
+_MAX_WIDTH = 8192
+_DEFAULT_QUALITY = 80
+_REDUCING_GAP = 2.0
+_FORMATS = {"WEBP": "image/webp", "JPEG": "image/jpeg"}
+# Errors reading or downscaling unreadable pages.
+RENDITION_EXCEPTIONS = (
+    *ARCHIVE_EXCEPTIONS,
+    *PDF_EXCEPTIONS,
+    Image.DecompressionBombError,
+    ValueError,
+)
+
+
+class RenditionParams(NamedTuple):
+    """Requested rendition size and encoding."""
+
+    width: int
+    quality: int
+    image_format: str
+
+
+class PageRenditionCache(DiskPageCache):
+    """Disk cache of downscaled pages."""
+
+    @staticmethod
+    def get_width(width):
+        """Round the requested width up to a rendition width."""
+        width = -(-width // _WIDTH_STEP) * _WIDTH_STEP
+        return max(_WIDTH_STEP, min(width, _MAX_WIDTH))
+
+    @staticmethod
+    def get_quality(quality):
+        """Clamp the requested encoding quality."""
+        return max(1, min(quality or _DEFAULT_QUALITY, 100))
+
+    @staticmethod
+    def get_content_type(image_format):
+        """Get the content type of a rendition format."""
+        return _FORMATS[image_format]
+
+    @staticmethod
+    def _render(data, params: RenditionParams):
+        """Downscale a page image. None if it's already narrow enough."""
+        width, quality, image_format = params
+        with BytesIO(data) as image_io, Image.open(image_io) as image:
+            if image.width <= width:
+                return None
+            height = max(1, round(image.height * width / image.width))
+            if image.format == "JPEG":
+                # Decode JPEGs at a fraction of full size.
+                image.draft(
+                    "RGB",
+                    (round(width * _REDUCING_GAP), round(height * _REDUCING_GAP)),
+                )
+            if image.mode not in ("RGB", "L"):
+                mode = (
+                    "RGBA"
+                    if image_format == "WEBP" and image.has_transparency_data
+                    else "RGB"
+                )
+                image = image.convert(mode)  # noqa: PLW2901
+            image.thumbnail(
+                (width, height),
+                Image.Resampling.LANCZOS,
+                reducing_gap=_REDUCING_GAP,
+            )
+            buffer = BytesIO()
+            image.save(buffer, image_format, quality=quality)
+            return buffer.getvalue()
+
+    def get_rendition(self, path, index, params: RenditionParams, to_pixmap):
+        """Get a downscaled page. None if the original is narrow enough."""
+        key = (*COMIC_ARCHIVE_POOL.get_key(path), index, to_pixmap, *params)
+        data = self.get_cached(key)
+        if data is not None:
+            return data or None
+        data = READER_PAGE_CACHE.read_page(path, index, to_pixmap)
+        data = self._render(data, params)
+        # Empty entries remember that the original is narrow enough.
+        self.set_cached(key, data or b"")
+        return data
+
+
+PAGE_RENDITION_CACHE = PageRenditionCache(
+    RENDITIONS_ROOT, READER_RENDITION_CACHE_MB * 1024**2
+)
@@ -0,0 +1,113 @@
+"""Cache whole serialized responses with ETags."""
+
+import json
+from hashlib import blake2b
+
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from codex.admin_flags import ADMIN_FLAGS
+from codex.cache_generation import get_cache_generation
+from codex.choices import mapping_to_dict
+from codex.models import Bookmark, Library
+from codex.urls.const import BROWSER_TIMEOUT
+
+_CACHE_KEY_PREFIX = "codex.response."
+
+
+class CachedResponseMixin:
+    """Cache serialized responses until the library, bookmarks or cache change."""
+
+    RESPONSE_CACHE_TIMEOUT = BROWSER_TIMEOUT
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the response digest."""
+        super().__init__(*args, **kwargs)
+        self._response_digest = ""
+
+    def _get_auth_version(self):
+        """Get the user or session and when their bookmarks last changed."""
+        user = self.request.user  # type: ignore
+        if user and user.is_authenticated:
+            auth = {"user": user.pk}
+            groups = sorted(user.groups.values_list("pk", flat=True))
+            bookmark_filter = {"user_id": user.pk}
+        else:
+            session_key = self.request.session.session_key  # type: ignore
+            auth = {"session": session_key}
+            groups = []
+            bookmark_filter = {"session_id": session_key}
+        if not next(iter(bookmark_filter.values())):
+            return auth, groups, None
+        bookmarks_mtime = Bookmark.objects.filter(**bookmark_filter).aggregate(
+            mtime=Max("updated_at")
+        )["mtime"]
+        return auth, groups, bookmarks_mtime
+
+    def _get_response_digest(self):
+        """Digest everything the response depends on."""
+        request = self.request  # type: ignore
+        auth, groups, bookmarks_mtime = self._get_auth_version()
+        libraries_mtime = Library.objects.aggregate(mtime=Max("updated_at"))["mtime"]
+        version = {
+            "view": type(self).__name__,
+            "url": request.build_absolute_uri(),
+            "media_type": request.accepted_media_type,
+            "user_agent": request.headers.get("User-Agent", ""),
+            "timezone": timezone.get_current_timezone_name(),
+            "kwargs": self.kwargs,  # type: ignore
+            "params": self.params,  # type: ignore
+            "admin_flags": ADMIN_FLAGS.get_flags(),
+            "auth": auth,
+            "groups": groups,
+            "bookmarks_mtime": bookmarks_mtime,
+            "libraries_mtime": libraries_mtime,
+            "generation": get_cache_generation(),
+        }
+        text = json.dumps(mapping_to_dict(version), sort_keys=True, default=str)
+        return blake2b(text.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _add_cache_headers(response, etag):
+        """Make clients revalidate with the ETag."""
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def get_cached_response(self):
+        """Get a 304 or the cached response if either copy is current."""
+        self._response_digest = self._get_response_digest()
+        etag = f'"{self._response_digest}"'
+        response = self._add_cache_headers(HttpResponse(), etag)
+        conditional_response = get_conditional_response(
+            self.request,  # type: ignore
+            etag=etag,
+            response=response,
+        )
+        if conditional_response is not response:
+            return conditional_response
+
+        cached = cache.get(_CACHE_KEY_PREFIX + self._response_digest)
+        if cached is None:
+            return None
+        content, content_type = cached
+        response = HttpResponse(content, content_type=content_type)
+        return self._add_cache_headers(response, etag)
+
+    def cache_response(self, response):
+        """Tag the response with its ETag and cache it once rendered."""
+        digest = self._response_digest
+        self._add_cache_headers(response, f'"{digest}"')
+
+        def _set_cache(rendered):
+            if rendered.status_code == 200:  # noqa: PLR2004
+                value = (rendered.content, rendered["Content-Type"])
+                cache.set(
+                    _CACHE_KEY_PREFIX + digest, value, self.RESPONSE_CACHE_TIMEOUT
+                )
+
+        response.add_post_render_callback(_set_cache)
+        return response
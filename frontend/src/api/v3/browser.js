@@ -33,6 +33,69 @@ export const getCoverSrc = ({ group, pks }, data, ts) => {
   return `${base}${hrefPath}/cover.webp?${queryString}`;
 };
 
+export const getCoverKey = (group, pks) => {
+  return `${group}:${pks.join(",")}`;
+};
+
+const parseCovers = (buffer) => {
+  // Each cover is prefixed by its content type length and data length.
+  const view = new DataView(buffer);
+  const decoder = new TextDecoder();
+  const covers = [];
+  let offset = 0;
+  while (offset < buffer.byteLength) {
+    const typeLength = view.getUint16(offset);
+    const dataLength = view.getUint32(offset + 2);
+    offset += 6;
+    const type = decoder.decode(new Uint8Array(buffer, offset, typeLength));
+    offset += typeLength;
+    const data = new Uint8Array(buffer, offset, dataLength);
+    covers.push(new Blob([data], { type }));
+    offset += dataLength;
+  }
+  return covers;
+};
+
+// Keeps each covers request url well under common url length limits.
+const MAX_COVERS_GROUPS_LENGTH = 1536;
+
+const batchCoverGroups = (groups) => {
+  // Split cards into batches whose encoded groups param stays short.
+  const batches = [];
+  let batch = [];
+  let length = 0;
+  for (const group of groups) {
+    const groupLength = encodeURIComponent(JSON.stringify(group)).length + 3;
+    if (batch.length && length + groupLength > MAX_COVERS_GROUPS_LENGTH) {
+      batches.push(batch);
+      batch = [];
+      length = 0;
+    }
+    batch.push(group);
+    length += groupLength;
+  }
+  if (batch.length) {
+    batches.push(batch);
+  }
+  return batches;
+};
+
+const getCoversBatch = (groups, data, ts) => {
+  const query = { ...data, groups };
+  delete query.show;
+  const params = serializeParams(query, ts);
+  return HTTP.get("/covers", { params, responseType: "arraybuffer" }).then(
+    (response) => parseCovers(response.data),
+  );
+};
+
+const getCovers = (groups, data, ts) => {
+  const requests = batchCoverGroups(groups).map((batch) =>
+    getCoversBatch(batch, data, ts),
+  );
+  return Promise.all(requests).then((batches) => batches.flat());
+};
+
 const getAvailableFilterChoices = ({ group, pks }, data, ts) => {
   const params = serializeParams(data, ts);
   return HTTP.get(`/${group}/${pks}/choices_available`, { params });
@@ -70,6 +133,7 @@ export default {
   getAvailableFilterChoices,
   getBrowserHref,
   getCoverSrc,
+  getCovers,
   getFilterChoices,
   getMetadata,
   getSettings,
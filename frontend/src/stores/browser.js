@@ -2,7 +2,7 @@ import deepClone from "deep-clone";
 import { dequal } from "dequal";
 import { defineStore } from "pinia";
 
-import API from "@/api/v3/browser";
+import API, { getCoverKey } from "@/api/v3/browser";
 import COMMON_API from "@/api/v3/common";
 import BROWSER_CHOICES from "@/choices/browser-choices.json";
 import BROWSER_DEFAULTS from "@/choices/browser-defaults.json";
@@ -90,6 +90,7 @@ export const useBrowserStore = defineStore("browser", {
       librariesExist: undefined,
       modelGroup: undefined,
       numPages: 1,
+      nextCursor: undefined,
       groups: [],
       books: [],
       fts: undefined,
@@ -100,6 +101,10 @@ export const useBrowserStore = defineStore("browser", {
     filterMode: "base",
     zeroPad: 0,
     browserPageLoaded: false,
+    covers: {
+      loading: false,
+      srcs: {},
+    },
     isSearchOpen: false,
     isSearchHelpOpen: false,
     searchHideTimeout: undefined,
@@ -539,7 +544,11 @@ export const useBrowserStore = defineStore("browser", {
         this.browserPageLoaded = false;
       }
       const oldBreadcrumbs = this.settings.breadcrumbs;
-      await API.getBrowserPage(route.params, this.settings, mtime)
+      // The api only seeks from the cursor if it was made for this page.
+      const params = this.page.nextCursor
+        ? { ...this.settings, cursor: this.page.nextCursor }
+        : this.settings;
+      await API.getBrowserPage(route.params, params, mtime)
         .then((response) => {
           const { breadcrumbs, ...page } = response.data;
           Object.freeze({ page });
@@ -552,6 +561,7 @@ export const useBrowserStore = defineStore("browser", {
             state.choices.dynamic = undefined;
             state.browserPageLoaded = true;
           });
+          this.loadCovers();
           return true;
         })
         .catch(this.handlePageError);
@@ -561,6 +571,35 @@ export const useBrowserStore = defineStore("browser", {
         this.updateBreadcrumbs(oldBreadcrumbs);
       }
     },
+    async loadCovers() {
+      // Get every cover on the page in one request.
+      const cards = [...this.page.groups, ...this.page.books];
+      const oldSrcs = Object.values(this.covers.srcs);
+      const srcs = {};
+      if (cards.length) {
+        this.covers.loading = true;
+        const groups = cards.map(({ group, ids }) => ({
+          group,
+          pks: ids.join(","),
+        }));
+        await API.getCovers(groups, this.coverSettings, this.page.mtime)
+          .then((blobs) => {
+            for (const [index, card] of cards.entries()) {
+              const blob = blobs[index];
+              if (blob?.size) {
+                const key = getCoverKey(card.group, card.ids);
+                srcs[key] = URL.createObjectURL(blob);
+              }
+            }
+            return true;
+          })
+          .catch(console.warn);
+      }
+      this.covers = { loading: false, srcs };
+      for (const src of oldSrcs) {
+        URL.revokeObjectURL(src);
+      }
+    },
     async loadAvailableFilterChoices() {
       return await API.getAvailableFilterChoices(
         router.currentRoute.value.params,
@@ -0,0 +1,104 @@
+"""Shared test fixtures."""
+
+import shutil
+from contextlib import suppress
+from pathlib import Path
+from queue import Empty
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from codex.logger.mp_queue import LOG_QUEUE
+from codex.models import Comic, Folder, Imprint, Library, Publisher, Series, Volume
+from codex.startup import init_admin_flags
+
+PAGE_COUNT = 10
+
+
+class LibraryTestCase(TestCase):
+    """Create a library with a series to fill with comics."""
+
+    TMP_DIR = Path("/tmp/codex.tests.library")  # noqa S108
+
+    def setUp(self):
+        """Set up for tests."""
+        self.TMP_DIR.mkdir(exist_ok=True, parents=True)
+        init_admin_flags()
+        cache.clear()
+        self.library, self.folder = self.create_library("library")
+        self.publisher = Publisher.objects.create(name="FooPub")
+        self.imprint = Imprint.objects.create(
+            name="BarComics", publisher=self.publisher
+        )
+        self.series, self.volume = self.create_series("Baz Patrol", self.imprint)
+        self.num_comics = 0
+        self.user = User.objects.create_user("reader")
+
+    def tearDown(self):
+        """Tear down tests."""
+        shutil.rmtree(self.TMP_DIR)
+        # Unread multiprocessing queues block interpreter exit once their
+        # pipes fill, and no log listener runs in tests.
+        with suppress(Empty):
+            while True:
+                LOG_QUEUE.get(timeout=0.1)
+
+    def create_library(self, name):
+        """Create a library and its root folder."""
+        path = self.TMP_DIR / name
+        path.mkdir(exist_ok=True, parents=True)
+        library = Library.objects.create(path=str(path))
+        folder = Folder.objects.create(library=library, path=str(path), name=name)
+        return library, folder
+
+    def create_folder(self, parent_folder, name):
+        """Create a folder in another folder."""
+        path = Path(parent_folder.path) / name
+        path.mkdir()
+        return Folder.objects.create(
+            library=parent_folder.library,
+            path=str(path),
+            name=name,
+            parent_folder=parent_folder,
+        )
+
+    def create_series(self, name, imprint):
+        """Create a series and its volume."""
+        series = Series.objects.create(
+            name=name, imprint=imprint, publisher=self.publisher
+        )
+        # Volume names are years, so these volumes have none.
+        volume = Volume.objects.create(
+            name=None, series=series, imprint=imprint, publisher=self.publisher
+        )
+        return series, volume
+
+    def create_comic(self, volume=None, folders=None, **kwargs):
+        """Create a comic in the volume and folders, numbered in order."""
+        self.num_comics += 1
+        volume = volume or self.volume
+        folders = folders or (self.folder,)
+        parent_folder = folders[-1]
+        path = Path(parent_folder.path) / f"{self.num_comics:03}.cbz"
+        path.touch()
+        fields = {
+            "issue_number": self.num_comics,
+            "size": 100,
+            "page_count": PAGE_COUNT,
+            "file_type": "CBZ",
+            **kwargs,
+        }
+        comic = Comic.objects.create(
+            library=parent_folder.library,
+            parent_folder=parent_folder,
+            path=str(path),
+            name=path.stem,
+            publisher=volume.publisher,
+            imprint=volume.imprint,
+            series=volume.series,
+            volume=volume,
+            **fields,
+        )
+        comic.folders.add(*folders)
+        return comic
@@ -0,0 +1,170 @@
+"""Test filter choices counted from comic facets."""
+
+import json
+from pathlib import Path
+
+from caseconverter import camelcase
+from django.core.cache import cache
+
+from codex.choices import VUETIFY_NULL_CODE
+from codex.models import (
+    FACET_RELS,
+    Character,
+    Comic,
+    ComicFacet,
+    Contributor,
+    ContributorPerson,
+    ContributorRole,
+    Genre,
+    Identifier,
+    IdentifierType,
+    Location,
+    SeriesGroup,
+    Story,
+    StoryArc,
+    StoryArcNumber,
+    Tag,
+    Team,
+)
+from codex.views.browser.choices import BrowserChoicesAvailableView
+from tests.fixtures import LibraryTestCase
+
+NUM_COMICS = 6
+NAMED_M2M_MODELS = {
+    "characters": Character,
+    "genres": Genre,
+    "locations": Location,
+    "series_groups": SeriesGroup,
+    "stories": Story,
+    "tags": Tag,
+    "teams": Team,
+}
+
+
+class BrowserChoicesTestCase(LibraryTestCase):
+    """Test facet choices match live many to many aggregation."""
+
+    TMP_DIR = Path("/tmp/codex.tests.choices")  # noqa S108
+
+    def setUp(self):
+        """Set up for tests."""
+        super().setUp()
+        self.comics = [
+            self.create_comic(issue_number=index) for index in range(NUM_COMICS)
+        ]
+        self._add_m2m_values()
+        ComicFacet.update_comics(comic.pk for comic in self.comics)
+        self.client.force_login(self.user)
+
+    def _add_m2m_values(self):
+        """Give comics overlapping values and leave the last without any."""
+        tagged_comics = self.comics[:-1]
+        for field_name, model in NAMED_M2M_MODELS.items():
+            values = [model.objects.create(name=f"{field_name} {i}") for i in range(3)]
+            for index, comic in enumerate(tagged_comics):
+                # Some comics have two values, some one, some none.
+                if index % 3 == 2:  # noqa PLR2004
+                    continue
+                getattr(comic, field_name).add(*values[index % 2 : index % 2 + 2])
+
+        role = ContributorRole.objects.create(name="Writer")
+        people = [
+            ContributorPerson.objects.create(name=f"Person {i}") for i in range(2)
+        ]
+        contributors = [
+            Contributor.objects.create(person=person, role=role) for person in people
+        ]
+        contributors.append(Contributor.objects.create(person=people[0], role=None))
+        for index, comic in enumerate(tagged_comics):
+            comic.contributors.add(contributors[index % len(contributors)])
+
+        arcs = [StoryArc.objects.create(name=f"Arc {i}") for i in range(2)]
+        arc_numbers = [
+            StoryArcNumber.objects.create(story_arc=arc, number=number)
+            for arc in arcs
+            for number in (1, 2)
+        ]
+        for index, comic in enumerate(tagged_comics[:-1]):
+            comic.story_arc_numbers.add(arc_numbers[index % len(arc_numbers)])
+
+        id_type = IdentifierType.objects.create(name="comicvine")
+        typed = Identifier.objects.create(identifier_type=id_type, nss="1")
+        # A value without a type is a null choice like no value at all.
+        untyped = Identifier.objects.create(identifier_type=None, nss="2")
+        self.comics[0].identifiers.add(typed)
+        self.comics[1].identifiers.add(typed, untyped)
+        self.comics[2].identifiers.add(untyped)
+
+    @staticmethod
+    def _get_live_choices(comic_qs, field_name):
+        """Get choice pks by aggregating the many to many relation."""
+        rel = FACET_RELS[field_name]
+        pks = set(
+            comic_qs.filter(**{f"{rel}__isnull": False})
+            .values_list(rel, flat=True)
+            .distinct()
+        )
+        if comic_qs.filter(**{f"{rel}__isnull": True}).exists():
+            pks.add(VUETIFY_NULL_CODE)
+        return pks
+
+    def _assert_counts_match(self, comic_qs):
+        """Assert facet choice counts match the live relations."""
+        counts = BrowserChoicesAvailableView._get_facet_choice_counts(  # noqa: SLF001
+            comic_qs, comic_qs.count()
+        )
+        live_counts = {
+            field_name: len(self._get_live_choices(comic_qs, field_name))
+            for field_name in FACET_RELS
+        }
+        assert counts == live_counts
+
+    def _get_choices(self, field_name, params=None):
+        """Get choice pks for the field from the choices endpoint."""
+        cache.clear()
+        url = f"/api/v3/p/{self.publisher.pk}/choices/{camelcase(field_name)}"
+        response = self.client.get(url, params or {})
+        assert response.status_code == 200  # noqa PLR2004
+        pks = [choice["pk"] for choice in response.json()["choices"]]
+        assert len(pks) == len(set(pks))
+        return set(pks)
+
+    def test_counts(self):
+        """Test counts for all comics, including null choices."""
+        comic_qs = Comic.objects.all()
+        self._assert_counts_match(comic_qs)
+        counts = BrowserChoicesAvailableView._get_facet_choice_counts(  # noqa: SLF001
+            comic_qs, comic_qs.count()
+        )
+        # One typed value and the null choice.
+        assert counts["identifier_type"] == 2  # noqa PLR2004
+
+    def test_counts_filtered(self):
+        """Test counts for subsets of comics."""
+        for comics in (self.comics[:1], self.comics[2:4], self.comics[-2:]):
+            comic_qs = Comic.objects.filter(pk__in=[comic.pk for comic in comics])
+            self._assert_counts_match(comic_qs)
+
+    def test_counts_no_comics(self):
+        """Test no comics have no choices."""
+        counts = BrowserChoicesAvailableView._get_facet_choice_counts(  # noqa: SLF001
+            Comic.objects.none(), 0
+        )
+        assert counts == dict.fromkeys(FACET_RELS, 0)
+
+    def test_choices(self):
+        """Test the choices endpoint returns the live values and null choice."""
+        comic_qs = Comic.objects.all()
+        for field_name in FACET_RELS:
+            live_pks = self._get_live_choices(comic_qs, field_name)
+            assert VUETIFY_NULL_CODE in live_pks, field_name
+            assert self._get_choices(field_name) == live_pks, field_name
+
+    def test_choices_filtered(self):
+        """Test the choices endpoint for comics filtered by another field."""
+        tag = Tag.objects.get(name="tags 0")
+        params = {"filters": json.dumps({"tags": [tag.pk]})}
+        comic_qs = Comic.objects.filter(tags=tag)
+        for field_name in FACET_RELS:
+            live_pks = self._get_live_choices(comic_qs, field_name)
+            assert self._get_choices(field_name, params) == live_pks, field_name
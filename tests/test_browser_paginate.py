@@ -0,0 +1,151 @@
+"""Test browser keyset pagination."""
+
+import json
+from base64 import urlsafe_b64encode
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from codex.models import GROUP_ROLLUP_MODELS, Imprint
+from tests.fixtures import LibraryTestCase
+
+# Small pages with a last page longer than the orphans.
+PER_PAGE = 10
+NUM_CARDS = 27
+
+
+@patch("codex.views.browser.paginate.MAX_OBJ_PER_PAGE", PER_PAGE)
+@patch("codex.views.browser.browser.MAX_OBJ_PER_PAGE", PER_PAGE)
+class BrowserKeysetPaginationTestCase(LibraryTestCase):
+    """Test seeking pages from a cursor returns the same pages as offsets."""
+
+    TMP_DIR = Path("/tmp/codex.tests.paginate")  # noqa S108
+
+    def setUp(self):
+        """Set up for tests."""
+        super().setUp()
+        self.imprints = [
+            self.imprint,
+            Imprint.objects.create(name="BazComics", publisher=self.publisher),
+        ]
+        self.client.force_login(self.user)
+
+    @staticmethod
+    def _update_rollups():
+        """Create rollups like an import does."""
+        for model, rollup_model in GROUP_ROLLUP_MODELS.items():
+            rollup_model.update_groups(model.objects.values_list("pk", flat=True))
+
+    def _get_page(self, route, page, params, cursor=None):
+        """Get the cards on a page and the cursor to the next one."""
+        cache.clear()
+        query = {**params}
+        if cursor:
+            query["cursor"] = cursor
+        response = self.client.get(f"/api/v3/{route}/{page}", query)
+        assert response.status_code == 200  # noqa PLR2004
+        data = response.json()
+        cards = [
+            (card["group"], tuple(card["ids"]))
+            for card in (*data["groups"], *data["books"])
+        ]
+        return cards, data["numPages"], data.get("nextCursor")
+
+    def _assert_cursor_pages_match(self, route, params=None):
+        """Assert every page seeks to the same cards as its offset page."""
+        params = params or {}
+        _, num_pages, _ = self._get_page(route, 1, params)
+        assert num_pages > 2  # noqa PLR2004
+        cursor = None
+        all_cards = []
+        for page in range(1, num_pages + 1):
+            offset_cards, _, _ = self._get_page(route, page, params)
+            cards, _, next_cursor = self._get_page(route, page, params, cursor)
+            assert cards == offset_cards, page
+            all_cards += cards
+            if page < num_pages:
+                assert next_cursor, page
+            cursor = next_cursor
+        assert len(all_cards) == len(set(all_cards))
+        return all_cards
+
+    def _create_comics_with_null_issues(self):
+        """Create a series of comics, half without issue numbers."""
+        for index in range(NUM_CARDS):
+            issue_number = index if index % 2 else None
+            self.create_comic(issue_number=issue_number)
+        self._update_rollups()
+        return self.series
+
+    def test_nulls(self):
+        """Test seeking past null order values."""
+        series = self._create_comics_with_null_issues()
+        cards = self._assert_cursor_pages_match(f"s/{series.pk}")
+        assert len(cards) == NUM_CARDS
+
+    def test_nulls_reverse(self):
+        """Test seeking past null order values in reverse."""
+        series = self._create_comics_with_null_issues()
+        route = f"s/{series.pk}"
+        forward = self._assert_cursor_pages_match(route)
+        reverse = self._assert_cursor_pages_match(route, {"orderReverse": "true"})
+        assert reverse == forward[::-1]
+
+    def test_merged_cards(self):
+        """Test seeking on series cards merged across imprints."""
+        for index in range(NUM_CARDS):
+            for imprint in self.imprints:
+                _, volume = self.create_series(f"Series {index:03}", imprint)
+                self.create_comic(volume, issue_number=1)
+        self._update_rollups()
+        route = f"p/{self.publisher.pk}"
+        cards = self._assert_cursor_pages_match(route)
+        assert len(cards) == NUM_CARDS
+        assert all(len(ids) == len(self.imprints) for _, ids in cards)
+        reverse = self._assert_cursor_pages_match(route, {"orderReverse": "true"})
+        assert reverse == cards[::-1]
+
+    def test_mixed_group_and_book_pages(self):
+        """Test seeking from group pages into pages with books."""
+        num_folders = 13
+        for index in range(num_folders):
+            folder = self.create_folder(self.folder, f"folder{index:03}")
+            self.create_comic(folders=(self.folder, folder), issue_number=index)
+        num_books = 15
+        for index in range(num_books):
+            self.create_comic(issue_number=index)
+        self._update_rollups()
+        cards = self._assert_cursor_pages_match(f"f/{self.folder.pk}")
+        groups = [card for card in cards if card[0] == "f"]
+        assert len(groups) == num_folders
+        assert len(cards) == num_folders + num_books
+
+    def test_cursor_rejected(self):
+        """Test cursors for another page or other params are ignored."""
+        series = self._create_comics_with_null_issues()
+        route = f"s/{series.pk}"
+        _, _, page_two_cursor = self._get_page(route, 1, {})
+        _, _, page_three_cursor = self._get_page(route, 2, {}, page_two_cursor)
+        assert page_three_cursor
+
+        # Another page
+        offset_cards, _, _ = self._get_page(route, 2, {})
+        cards, _, _ = self._get_page(route, 2, {}, page_three_cursor)
+        assert cards == offset_cards
+
+        # Other params
+        params = {"orderReverse": "true"}
+        offset_cards, _, _ = self._get_page(route, 2, params)
+        cards, _, _ = self._get_page(route, 2, params, page_two_cursor)
+        assert cards == offset_cards
+
+        # Garbage
+        bad_cursors = (
+            "garbage",
+            urlsafe_b64encode(json.dumps([2, "b", "key", []]).encode()).decode(),
+        )
+        offset_cards, _, _ = self._get_page(route, 2, {})
+        for cursor in bad_cursors:
+            cards, _, _ = self._get_page(route, 2, {}, cursor)
+            assert cards == offset_cards
@@ -0,0 +1,178 @@
+"""Test the reader."""
+
+import json
+import shutil
+from contextlib import suppress
+from pathlib import Path
+from unittest.mock import patch
+from zipfile import ZIP_STORED, ZipFile
+
+import pytest
+from cachalot.api import cachalot_disabled
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+
+from codex.models import Bookmark, StoryArc, StoryArcNumber
+from codex.views.reader.archives import ComicArchivePool
+from codex.views.reader.pages import StoredMemberFile
+from tests.fixtures import LibraryTestCase
+
+TMP_DIR = Path("/tmp/codex.tests.reader")  # noqa S108
+
+
+class ReaderQueriesTestCase(LibraryTestCase):
+    """Test the number of queries it takes to open the reader."""
+
+    TMP_DIR = TMP_DIR
+
+    def setUp(self):
+        """Set up for tests."""
+        super().setUp()
+        self.client.force_login(self.user)
+        self.comics = self._create_comics(3)
+
+    def _create_comics(self, count):
+        """Create comics in the series, each with story arcs and a bookmark."""
+        comics = []
+        for _ in range(count):
+            comic = self.create_comic()
+            for arc_name in ("Arc A", "Arc B"):
+                story_arc, _ = StoryArc.objects.get_or_create(name=arc_name)
+                story_arc_number = StoryArcNumber.objects.create(
+                    story_arc=story_arc, number=comic.issue_number
+                )
+                comic.story_arc_numbers.add(story_arc_number)
+            Bookmark.objects.create(user=self.user, comic=comic, page=1)
+            comics.append(comic)
+        return comics
+
+    def _count_reader_queries(self):
+        """Count the queries to open the middle comic of the series."""
+        comic = self.comics[1]
+        with cachalot_disabled(), CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"/api/v3/c/{comic.pk}")
+        assert response.status_code == 200  # noqa PLR2004
+        books = response.json()["books"]
+        assert books["prevBook"]["pk"] == self.comics[0].pk
+        assert books["nextBook"]["pk"] == self.comics[2].pk
+        assert books["current"]["settings"] is not None
+        return len(ctx.captured_queries)
+
+    def test_reader_queries_constant(self):
+        """Test that opening the reader doesn't query per comic or arc."""
+        # Load process caches like admin flags.
+        self._count_reader_queries()
+        num_queries = self._count_reader_queries()
+        self._create_comics(20)
+        assert self._count_reader_queries() == num_queries
+
+    def test_story_arc_position(self):
+        """Test the arc index is the position in the arc, not the arc number."""
+        story_arc = StoryArc.objects.create(name="Arc C")
+        for number, comic in zip((10, 20, 30), self.comics, strict=True):
+            story_arc_number = StoryArcNumber.objects.create(
+                story_arc=story_arc, number=number
+            )
+            comic.story_arc_numbers.add(story_arc_number)
+        comic = self.comics[1]
+        arc = json.dumps({"group": "a", "pks": str(story_arc.pk)})
+        response = self.client.get(f"/api/v3/c/{comic.pk}", {"arc": arc})
+        assert response.status_code == 200  # noqa PLR2004
+        data = response.json()
+        assert data["books"]["current"]["pk"] == comic.pk
+        assert data["arc"]["index"] == 2  # noqa PLR2004
+        assert data["arc"]["count"] == 3  # noqa PLR2004
+
+
+class FakeComicbox:
+    """Record when an archive is closed."""
+
+    def __init__(self, path):
+        """Remember the path."""
+        self.path = path
+        self.closed = False
+
+    def __enter__(self):
+        """Open nothing."""
+        return self
+
+    def close(self):
+        """Mark closed."""
+        self.closed = True
+
+
+@patch("codex.views.reader.archives.Comicbox", FakeComicbox)
+class ComicArchivePoolTestCase(SimpleTestCase):
+    """Test that pooled archives aren't closed while in use."""
+
+    def setUp(self):
+        """Create comic files."""
+        TMP_DIR.mkdir(exist_ok=True, parents=True)
+        self.paths = []
+        for name in ("a.cbz", "b.cbz"):
+            path = TMP_DIR / name
+            path.write_bytes(b"x")
+            self.paths.append(path)
+        self.pool = ComicArchivePool(1)
+
+    def tearDown(self):
+        """Tear down tests."""
+        shutil.rmtree(TMP_DIR)
+
+    def test_evicted_archive_closes_after_use(self):
+        """Test an archive evicted while in use is closed when released."""
+        with self.pool.open(self.paths[0]) as cb_a:
+            with self.pool.open(self.paths[1]) as cb_b:
+                assert not cb_a.closed
+            assert not cb_a.closed
+        assert cb_a.closed
+        assert not cb_b.closed
+
+    def test_error_keeps_newer_archive(self):
+        """Test an error with a stale archive doesn't discard the new one."""
+        path = self.paths[0]
+        with suppress(ValueError), self.pool.open(path) as cb_old:
+            path.write_bytes(b"changed")
+            with self.pool.open(path) as cb_new:
+                pass
+            raise ValueError
+        assert cb_old.closed
+        with self.pool.open(path) as cb:
+            assert cb is cb_new
+        assert not cb_new.closed
+
+
+class StoredMemberFileTestCase(SimpleTestCase):
+    """Test stored zip members are checked against their local headers."""
+
+    def setUp(self):
+        """Create a stored zip."""
+        TMP_DIR.mkdir(exist_ok=True, parents=True)
+        self.path = TMP_DIR / "stored.cbz"
+        with ZipFile(self.path, "w", compression=ZIP_STORED) as zf:
+            zf.writestr("1.jpg", b"first")
+            zf.writestr("2.jpg", b"second")
+        with ZipFile(self.path) as zf:
+            self.infos = {info.filename: info for info in zf.infolist()}
+
+    def tearDown(self):
+        """Tear down tests."""
+        shutil.rmtree(TMP_DIR)
+
+    def _open(self, offset_name, length_name, name):
+        offset = self.infos[offset_name].header_offset
+        length = self.infos[length_name].file_size
+        return StoredMemberFile(self.path, offset, length, name)
+
+    def test_member(self):
+        """Test reading a stored member."""
+        with self._open("2.jpg", "2.jpg", "2.jpg") as member:
+            assert member.read() == b"second"
+
+    def test_stale_name(self):
+        """Test a span pointing at a different member is rejected."""
+        with pytest.raises(ValueError, match="No stored zip member"):
+            self._open("1.jpg", "2.jpg", "2.jpg")
+        with pytest.raises(ValueError, match="No stored zip member"):
+            self._open("1.jpg", "1.jpg", "2.jpg")
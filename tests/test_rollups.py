@@ -0,0 +1,218 @@
+"""Test materialized group rollups."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from queue import SimpleQueue
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils.timezone import now
+
+from codex.librarian.bookmark.update import BookmarkUpdate
+from codex.librarian.importer.importer import ComicImporter
+from codex.librarian.importer.importerd import ComicImporterThread
+from codex.librarian.importer.tasks import ImportDBDiffTask, UpdateGroupRollupsTask
+from codex.logger.logging import get_logger
+from codex.models import (
+    GROUP_ROLLUP_MODELS,
+    FolderRollup,
+    Series,
+    SeriesProgress,
+    SeriesRollup,
+)
+from tests.fixtures import PAGE_COUNT, LibraryTestCase
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+LOG = get_logger(__name__)
+# Modules that send tasks to the librarian, which doesn't run in tests.
+LIBRARIAN_QUEUE_MODULES = (
+    "codex.librarian.bookmark.update",
+    "codex.signals.django_signals",
+    "codex.views.admin.library",
+)
+
+
+class RollupTestCase(LibraryTestCase):
+    """Create a small library to aggregate."""
+
+    TMP_DIR = Path("/tmp/codex.tests.rollups")  # noqa S108
+
+    def setUp(self):
+        """Set up for tests."""
+        for module in LIBRARIAN_QUEUE_MODULES:
+            patcher = patch(f"{module}.LIBRARIAN_QUEUE")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        super().setUp()
+        self.comics = [self.create_comic() for _ in range(2)]
+
+    @staticmethod
+    def _get_importer(library):
+        """Get an importer for the library."""
+        task = ImportDBDiffTask(library_id=library.pk)
+        return ComicImporter(task, SimpleQueue(), SimpleQueue())
+
+    def _update_rollups(self, library):
+        """Update rollups the way an import does."""
+        self._get_importer(library).update_group_rollups({}, EPOCH)
+
+    def _get_series_child_count(self):
+        """Get the series' rollup child count."""
+        return SeriesRollup.objects.get(group=self.series).child_count
+
+    def _browse_series(self, params=None):
+        """Get the series cards in the publisher."""
+        cache.clear()
+        response = self.client.get(f"/api/v3/p/{self.publisher.pk}/1", params or {})
+        assert response.status_code == 200  # noqa PLR2004
+        return response.json()["groups"]
+
+
+class GroupRollupTestCase(RollupTestCase):
+    """Test group rollups are maintained and read by the browser."""
+
+    def test_import_updates_rollups(self):
+        """Test an import aggregates the groups' comics."""
+        self._update_rollups(self.library)
+        for model in GROUP_ROLLUP_MODELS:
+            assert not model.objects.filter(rollup__isnull=True).exists()
+        rollup = SeriesRollup.objects.get(group=self.series)
+        assert rollup.child_count == 2  # noqa PLR2004
+        assert rollup.page_count == 2 * PAGE_COUNT
+        folder_rollup = FolderRollup.objects.get(group=self.folder)
+        assert folder_rollup.child_count == 2  # noqa PLR2004
+
+        self.create_comic()
+        self._update_rollups(self.library)
+        rollup = SeriesRollup.objects.get(group=self.series)
+        assert rollup.child_count == 3  # noqa PLR2004
+        assert rollup.page_count == 3 * PAGE_COUNT
+
+    def test_stale_groups_wait_for_last_chunk(self):
+        """Test groups comics left are only recomputed by the last update."""
+        self._update_rollups(self.library)
+        SeriesRollup.objects.filter(group=self.series).update(child_count=99)
+        importer = self._get_importer(self.library)
+        importer.stale_rollup_groups = {Series: {self.series.pk}}
+        importer.update_group_rollups({}, now(), include_stale_groups=False)
+        assert self._get_series_child_count() == 99  # noqa PLR2004
+
+        importer.update_group_rollups({}, now())
+        assert self._get_series_child_count() == 2  # noqa PLR2004
+        assert not importer.stale_rollup_groups
+
+    def test_library_delete_queues_rollups(self):
+        """Test deleting a library updates shared groups in the librarian."""
+        library, folder = self.create_library("b")
+        self.create_comic(folders=(folder,))
+        self._update_rollups(self.library)
+        assert self._get_series_child_count() == 3  # noqa PLR2004
+
+        admin = User.objects.create_superuser("admin")
+        self.client.force_login(admin)
+        with patch("codex.views.admin.library.LIBRARIAN_QUEUE") as queue:
+            response = self.client.delete(f"/api/v3/admin/library/{library.pk}/")
+        assert response.status_code == 204  # noqa PLR2004
+        # The request only queues the update.
+        assert self._get_series_child_count() == 3  # noqa PLR2004
+        tasks = [
+            call.args[0]
+            for call in queue.put.call_args_list
+            if isinstance(call.args[0], UpdateGroupRollupsTask)
+        ]
+        assert len(tasks) == 1
+        assert self.series.pk in tasks[0].group_pks["Series"]
+
+        thread = ComicImporterThread(
+            log_queue=SimpleQueue(), librarian_queue=SimpleQueue()
+        )
+        thread.process_item(tasks[0])
+        assert self._get_series_child_count() == 2  # noqa PLR2004
+
+    def test_browser_reads_rollups(self):
+        """Test unfiltered cards count from rollups and filtered cards don't."""
+        self._update_rollups(self.library)
+        self.client.force_login(self.user)
+        # A stale rollup shows where the count comes from.
+        SeriesRollup.objects.filter(group=self.series).update(child_count=99)
+        cards = self._browse_series()
+        assert [card["childCount"] for card in cards] == [99]
+
+        filters = json.dumps({"bookmark": "UNREAD"})
+        cards = self._browse_series({"filters": filters})
+        assert [card["childCount"] for card in cards] == [2]
+
+
+class GroupProgressTestCase(RollupTestCase):
+    """Test per user reading progress is maintained and read by the browser."""
+
+    def setUp(self):
+        """Set up for tests."""
+        super().setUp()
+        self._update_rollups(self.library)
+        self.auth_filter = {"user_id": self.user.pk}
+
+    def _update_bookmark(self, comic, updates):
+        """Update a bookmark the way the librarian does."""
+        BookmarkUpdate.update_bookmarks(
+            self.auth_filter, {"pk": comic.pk}, updates, LOG
+        )
+
+    def _get_series_progress(self):
+        """Get the user's reading progress in the series."""
+        return SeriesProgress.objects.get(group=self.series, user=self.user)
+
+    def test_bookmark_updates_progress(self):
+        """Test bookmark updates recompute the user's group progress."""
+        self._update_bookmark(self.comics[0], {"page": 5})
+        progress = self._get_series_progress()
+        assert progress.page == 5  # noqa PLR2004
+        assert progress.finished_count == 0
+
+        self._update_bookmark(self.comics[1], {"finished": True})
+        progress = self._get_series_progress()
+        assert progress.page == 5 + PAGE_COUNT
+        assert progress.finished_count == 1
+
+    def test_progress_is_per_user(self):
+        """Test another user's bookmarks don't change this user's progress."""
+        self._update_bookmark(self.comics[0], {"page": 5})
+        other_user = User.objects.create_user("other")
+        BookmarkUpdate.update_bookmarks(
+            {"user_id": other_user.pk}, {"pk": self.comics[0].pk}, {"page": 7}, LOG
+        )
+        assert self._get_series_progress().page == 5  # noqa PLR2004
+        other_progress = SeriesProgress.objects.get(group=self.series, user=other_user)
+        assert other_progress.page == 7  # noqa PLR2004
+
+    def test_library_delete_updates_progress(self):
+        """Test deleting a library drops its comics from shared group progress."""
+        library, folder = self.create_library("b")
+        comic = self.create_comic(folders=(folder,))
+        self._update_rollups(self.library)
+        self._update_bookmark(self.comics[0], {"page": 5})
+        self._update_bookmark(comic, {"page": 3})
+        assert self._get_series_progress().page == 8  # noqa PLR2004
+
+        library.delete()
+        task = UpdateGroupRollupsTask(group_pks={"Series": frozenset({self.series.pk})})
+        thread = ComicImporterThread(
+            log_queue=SimpleQueue(), librarian_queue=SimpleQueue()
+        )
+        thread.process_item(task)
+        assert self._get_series_progress().page == 5  # noqa PLR2004
+
+    def test_browser_reads_progress(self):
+        """Test unfiltered cards read progress from the materialized rollup."""
+        self._update_bookmark(self.comics[0], {"page": 5})
+        self.client.force_login(self.user)
+        cards = self._browse_series()
+        # Cards show progress as a percentage of the series' pages.
+        assert [card["progress"] for card in cards] == [25]
+
+        # A stale progress row shows where the progress comes from.
+        SeriesProgress.objects.filter(group=self.series, user=self.user).update(page=9)
+        cards = self._browse_series()
+        assert [card["progress"] for card in cards] == [45]